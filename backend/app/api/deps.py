@@ -5,6 +5,20 @@ from typing import Annotated
 from fastapi import Depends
 from supabase import Client
 from app.db.supabase import get_supabase_client
+from app.services.finance_service import FinanceService, get_finance_service
+from app.services.rebalance_service import RebalanceService
 
 # Supabase 클라이언트 의존성
 SupabaseDep = Annotated[Client, Depends(get_supabase_client)]
+
+# 금융 데이터 서비스 의존성 (앱 전체 싱글톤)
+FinanceServiceDep = Annotated[FinanceService, Depends(get_finance_service)]
+
+
+def get_rebalance_service(finance_service: FinanceServiceDep) -> RebalanceService:
+    """요청마다 RebalanceService 생성 - FinanceService는 공유 냥~"""
+    return RebalanceService(finance_service)
+
+
+# 리밸런싱 서비스 의존성
+RebalanceServiceDep = Annotated[RebalanceService, Depends(get_rebalance_service)]
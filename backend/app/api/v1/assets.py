@@ -5,9 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 
-from decimal import Decimal
-
-from app.api.deps import SupabaseDep
+from app.api.deps import SupabaseDep, FinanceServiceDep
 from app.models.schemas import (
     AssetCreate,
     AssetUpdate,
@@ -18,19 +16,17 @@ from app.models.schemas import (
     TickerValidationResponse,
 )
 from app.services.asset_service import AssetService
-from app.services.finance_service import FinanceService
 from app.config import settings
 
 router = APIRouter()
 
 
 @router.get("/validate-ticker/{ticker}", response_model=TickerValidationResponse)
-async def validate_ticker(ticker: str):
+async def validate_ticker(ticker: str, finance_service: FinanceServiceDep):
     """
     티커 유효성 검증 및 정보 반환 냥~ 🐱
     자산 추가 전 티커가 유효한지 확인하고 종목 정보 표시
     """
-    finance_service = FinanceService()
     result = await finance_service.validate_ticker_with_info(ticker)
     return TickerValidationResponse(**result)
 
@@ -38,6 +34,7 @@ async def validate_ticker(ticker: str):
 @router.get("", response_model=AssetsListResponse)
 async def get_assets(
     db: SupabaseDep,
+    finance_service: FinanceServiceDep,
     portfolio_id: Optional[UUID] = Query(None, description="포트폴리오 ID (없으면 기본 포트폴리오)"),
     include_inactive: bool = Query(False, description="비활성 자산 포함 여부"),
 ):
@@ -47,22 +44,21 @@ async def get_assets(
     summary에 총자산, 수익률 정보 포함
     """
     asset_service = AssetService(db)
-    finance_service = FinanceService()
 
     # 자산 목록 조회
     assets = await asset_service.get_assets(portfolio_id, include_inactive)
 
-    # 실시간 가격 조회 및 계산
-    enriched_assets = await finance_service.enrich_assets_with_prices(assets)
+    # 환율은 요청당 한 번만 조회해서 가격 계산과 summary에 함께 사용
+    fx = await finance_service.get_fx_matrix(a.get("currency") for a in assets)
 
-    # 환율 조회 (summary 계산용)
-    exchange_rate = await finance_service.get_exchange_rate()
+    # 실시간 가격 조회 및 계산
+    enriched_assets = await finance_service.enrich_assets_with_prices(assets, fx)
 
     # summary 계산
     summary_data = await asset_service.calculate_summary(
         enriched_assets,
         portfolio_id,
-        Decimal(str(exchange_rate))
+        fx.decimal_rate("USD")
     )
 
     return AssetsListResponse(
@@ -79,13 +75,13 @@ async def get_assets(
 @router.get("/{asset_id}", response_model=AssetResponse)
 async def get_asset(
     db: SupabaseDep,
+    finance_service: FinanceServiceDep,
     asset_id: UUID,
 ):
     """
     특정 자산 상세 조회 냥~ 🐱
     """
     asset_service = AssetService(db)
-    finance_service = FinanceService()
 
     asset = await asset_service.get_asset(asset_id)
     if not asset:
@@ -101,13 +97,13 @@ async def get_asset(
 @router.post("", response_model=AssetResponse)
 async def create_asset(
     db: SupabaseDep,
+    finance_service: FinanceServiceDep,
     asset_data: AssetCreate,
 ):
     """
     새 자산 추가 냥~ 🐱
     """
     asset_service = AssetService(db)
-    finance_service = FinanceService()
 
     # 티커 유효성 검증 (있는 경우)
     if asset_data.ticker:
@@ -126,6 +122,7 @@ async def create_asset(
 @router.put("/{asset_id}", response_model=AssetResponse)
 async def update_asset(
     db: SupabaseDep,
+    finance_service: FinanceServiceDep,
     asset_id: UUID,
     asset_data: AssetUpdate,
 ):
@@ -133,7 +130,6 @@ async def update_asset(
     자산 정보 수정 냥~ 🐱
     """
     asset_service = AssetService(db)
-    finance_service = FinanceService()
 
     # 티커 유효성 검증 (변경하는 경우)
     if asset_data.ticker:
@@ -8,7 +8,8 @@ from decimal import Decimal
 from fastapi import APIRouter, Query
 from typing import Optional
 
-from app.api.deps import SupabaseDep
+from app.api.deps import SupabaseDep, FinanceServiceDep, RebalanceServiceDep
+from app.db.supabase import execute
 from app.models.schemas import (
     DashboardSummary,
     AssetHistoryResponse,
@@ -20,7 +21,9 @@ from app.models.schemas import (
     ManualHistoryResponse,
 )
 from app.services.asset_service import AssetService
-from app.services.finance_service import FinanceService
+from app.services.market_indicators import market_indicators
+from app.services.portfolio_state import portfolio_states
+from app.services.portfolio_valuation import PortfolioValuation
 
 router = APIRouter()
 
@@ -28,6 +31,7 @@ router = APIRouter()
 @router.get("/summary", response_model=DashboardSummary)
 async def get_dashboard_summary(
     db: SupabaseDep,
+    rebalance_service: RebalanceServiceDep,
     portfolio_id: Optional[UUID] = Query(None, description="포트폴리오 ID"),
 ):
     """
@@ -36,30 +40,17 @@ async def get_dashboard_summary(
     - 카테고리별 배분 비율
     - 메인 플랜 정보 포함
     """
-    from app.services.rebalance_service import RebalanceService
-
     asset_service = AssetService(db)
-    finance_service = FinanceService()
-    rebalance_service = RebalanceService()
-
-    # 자산 목록 조회
-    assets = await asset_service.get_assets(portfolio_id)
 
-    # 현재가 조회 및 계산
-    enriched_assets = await finance_service.enrich_assets_with_prices(assets)
-
-    # 현재 환율 조회 (USD 자산 원화 환산용)
-    exchange_rate = await finance_service.get_exchange_rate()
-    print(f"[DEBUG] exchange_rate: {exchange_rate}")
-
-    # 요약 정보 계산 (환율 전달)
-    summary = await asset_service.calculate_summary(
-        enriched_assets, portfolio_id, Decimal(str(exchange_rate))
+    # 포트폴리오 평가 상태에서 합계만 읽기 (시세/자산 변경은 증분 반영, 만료되면 새로 만듦)
+    # 메인 플랜은 id/이름만 같이 조회 (플랜 평가는 안 함)
+    state, main_plan = await asyncio.gather(
+        portfolio_states.get(portfolio_id, asset_service, rebalance_service.finance_service),
+        rebalance_service.get_main_plan_ref(portfolio_id),
     )
-    print(f"[DEBUG] summary.total_value: {summary.total_value}")
+    summary = state.summary()
 
     # 메인 플랜 정보 추가 냥~
-    main_plan = await rebalance_service.get_main_plan(portfolio_id)
     if main_plan:
         summary.main_plan_id = UUID(main_plan["id"])
         summary.main_plan_name = main_plan["name"]
@@ -111,11 +102,10 @@ async def get_asset_history(
 
 
 @router.get("/exchange-rate", response_model=ExchangeRateResponse)
-async def get_current_exchange_rate():
+async def get_current_exchange_rate(finance_service: FinanceServiceDep):
     """
     현재 USD/KRW 환율 조회 냥~ 🐱
     """
-    finance_service = FinanceService()
     rate = await finance_service.get_exchange_rate()
 
     return ExchangeRateResponse(
@@ -129,6 +119,7 @@ async def get_current_exchange_rate():
 @router.get("/rebalance-alerts", response_model=RebalanceAlertsResponse)
 async def get_rebalance_alerts(
     db: SupabaseDep,
+    rebalance_service: RebalanceServiceDep,
     portfolio_id: Optional[UUID] = Query(None, description="포트폴리오 ID"),
     threshold: float = Query(5.0, ge=0, le=100, description="이탈도 임계값 (%)"),
 ):
@@ -138,10 +129,6 @@ async def get_rebalance_alerts(
     메인 플랜 기반 목표 비율 대비 {threshold}% 이상 이탈 반환
     메인 플랜이 없으면 레거시 카테고리 기반 폴백
     """
-    from app.services.rebalance_service import RebalanceService
-
-    rebalance_service = RebalanceService()
-
     # 메인 플랜 조회
     main_plan = await rebalance_service.get_main_plan(portfolio_id)
 
@@ -150,7 +137,9 @@ async def get_rebalance_alerts(
         return await _get_main_plan_alerts(main_plan, portfolio_id, threshold, rebalance_service)
     else:
         # 레거시 카테고리 기반 폴백
-        return await _get_legacy_alerts(db, portfolio_id, threshold)
+        return await _get_legacy_alerts(
+            db, portfolio_id, threshold, await rebalance_service.get_valuation(portfolio_id)
+        )
 
 
 async def _get_main_plan_alerts(
@@ -167,9 +156,11 @@ async def _get_main_plan_alerts(
 
     # 그룹용 기본 절대 밴드 조회 냥~
     DEFAULT_USER_ID = "00000000-0000-0000-0000-000000000001"
-    settings_result = rebalance_service.supabase.table("user_settings").select(
-        "default_absolute_band"
-    ).eq("user_id", DEFAULT_USER_ID).execute()
+    settings_result = await execute(
+        rebalance_service.supabase.table("user_settings")
+        .select("default_absolute_band")
+        .eq("user_id", DEFAULT_USER_ID)
+    )
     settings_row = settings_result.data[0] if settings_result.data else {}
     group_band = float(settings_row.get("default_absolute_band") or 5.0)
 
@@ -213,21 +204,14 @@ async def _get_legacy_alerts(
     db,
     portfolio_id: Optional[UUID],
     threshold: float,
+    valuation: PortfolioValuation,
 ) -> RebalanceAlertsResponse:
     """레거시 카테고리 기반 알림 (폴백) 냥~"""
     asset_service = AssetService(db)
-    finance_service = FinanceService()
-
-    # 현재 자산 조회
-    assets = await asset_service.get_assets(portfolio_id)
-    enriched_assets = await finance_service.enrich_assets_with_prices(assets)
-
-    # 현재 환율 조회
-    exchange_rate = await finance_service.get_exchange_rate()
 
     # 요약 정보 계산 (현재 배분 포함)
     summary = await asset_service.calculate_summary(
-        enriched_assets, portfolio_id, Decimal(str(exchange_rate))
+        valuation.enriched, portfolio_id, valuation.fx.decimal_rate("USD")
     )
 
     # 목표 배분 조회
@@ -270,13 +254,13 @@ async def _get_legacy_alerts(
 @router.get("/goal-progress", response_model=GoalProgressResponse)
 async def get_goal_progress(
     db: SupabaseDep,
+    finance_service: FinanceServiceDep,
     portfolio_id: Optional[UUID] = Query(None, description="포트폴리오 ID"),
 ):
     """
     목표 진행률 조회 냥~ 🐱
     """
     asset_service = AssetService(db)
-    finance_service = FinanceService()
 
     # 포트폴리오 목표 금액 조회
     portfolio = await asset_service.get_portfolio(portfolio_id)
@@ -284,13 +268,13 @@ async def get_goal_progress(
 
     # 현재 자산 가치 조회
     assets = await asset_service.get_assets(portfolio_id)
-    enriched_assets = await finance_service.enrich_assets_with_prices(assets)
 
-    # 현재 환율 조회
-    exchange_rate = await finance_service.get_exchange_rate()
+    # 현재 환율 조회 (요청당 한 번)
+    fx = await finance_service.get_fx_matrix(a.get("currency") for a in assets)
+    enriched_assets = await finance_service.enrich_assets_with_prices(assets, fx)
 
     summary = await asset_service.calculate_summary(
-        enriched_assets, portfolio_id, Decimal(str(exchange_rate))
+        enriched_assets, portfolio_id, fx.decimal_rate("USD")
     )
 
     current_value = summary.total_value
@@ -309,6 +293,7 @@ async def get_goal_progress(
 @router.get("/ticker-history/{ticker}")
 async def get_ticker_history(
     ticker: str,
+    finance_service: FinanceServiceDep,
     days: int = Query(30, ge=7, le=90, description="조회 일수 (7~90일)"),
 ):
     """
@@ -316,14 +301,13 @@ async def get_ticker_history(
 
     최근 N일간의 종가 데이터와 변화율 반환
     """
-    finance_service = FinanceService()
     result = await finance_service.get_ticker_history(ticker, days)
 
     return result
 
 
 @router.get("/market-indicators")
-async def get_market_indicators():
+async def get_market_indicators(finance_service: FinanceServiceDep):
     """
     주요 시장 지표 조회 냥~ 🐱
 
@@ -332,89 +316,10 @@ async def get_market_indicators():
     - USD/KRW 환율
     - 금/은 현물 가격비
     - 주요 지수 PER (S&P 500, NASDAQ, KOSPI)
-    """
-    finance_service = FinanceService()
-
-    # 주요 지표 목록
-    indicators_meta = [
-        {"ticker": "^KS11", "name": "KOSPI", "currency": "KRW"},
-        {"ticker": "^GSPC", "name": "S&P 500", "currency": "USD"},
-        {"ticker": "^IXIC", "name": "NASDAQ", "currency": "USD"},
-        {"ticker": "^VIX", "name": "VIX", "currency": ""},
-    ]
-
-    # 지수 가격, 금/은 비율, PER 병렬 조회
-    indicator_tasks = [
-        finance_service.get_ticker_history(m["ticker"], 2) for m in indicators_meta
-    ]
-    exchange_task = finance_service.get_exchange_rate()
-    gold_silver_task = finance_service.get_gold_silver_ratio()
-    per_task = finance_service.get_index_per()
-
-    (
-        *indicator_results,
-        exchange_rate,
-        gold_silver,
-        per_data,
-    ) = await asyncio.gather(
-        *indicator_tasks,
-        exchange_task,
-        gold_silver_task,
-        per_task,
-        return_exceptions=True,
-    )
-
-    results = []
-
-    for meta, data in zip(indicators_meta, indicator_results):
-        try:
-            if isinstance(data, Exception):
-                continue
-            if data and data.get("data") and len(data["data"]) >= 1:
-                latest = data["data"][-1]
-                results.append({
-                    "ticker": meta["ticker"],
-                    "name": meta["name"],
-                    "price": latest["close"],
-                    "change_rate": data.get("change_rate", 0),
-                    "currency": meta["currency"],
-                })
-        except Exception:
-            pass
-
-    # 환율 추가
-    try:
-        if not isinstance(exchange_rate, Exception):
-            results.append({
-                "ticker": "USDKRW=X",
-                "name": "USD/KRW",
-                "price": exchange_rate,
-                "change_rate": 0,
-                "currency": "KRW",
-            })
-    except Exception:
-        pass
-
-    # 금/은 비율
-    gold_silver_result = None
-    if not isinstance(gold_silver, Exception) and gold_silver.get("valid"):
-        gold_silver_result = {
-            "gold_price": gold_silver["gold_price"],
-            "silver_price": gold_silver["silver_price"],
-            "ratio": gold_silver["ratio"],
-        }
-
-    # PER 데이터
-    per_result = None
-    if not isinstance(per_data, Exception):
-        per_result = per_data
 
-    return {
-        "indicators": results,
-        "gold_silver_ratio": gold_silver_result,
-        "index_per": per_result,
-        "timestamp": datetime.now().isoformat(),
-    }
+    스케줄러가 주기적으로 계산해둔 스냅샷을 반환 (timestamp: 계산 시각, age_seconds/stale: 신선도)
+    """
+    return await market_indicators.get(finance_service)
 
 
 @router.post("/asset-history/manual")
@@ -446,7 +351,7 @@ async def create_manual_history(
         profit_rate = float((total_profit / entry.total_principal) * 100) if entry.total_principal > 0 else 0.0
 
         # upsert로 저장 (기존 데이터 덮어쓰기)
-        result = db.table("asset_history").upsert(
+        result = await execute(db.table("asset_history").upsert(
             {
                 "portfolio_id": str(portfolio_id),
                 "snapshot_date": entry.snapshot_date.isoformat(),
@@ -457,7 +362,7 @@ async def create_manual_history(
                 "category_breakdown": None,  # 수동 입력은 카테고리 없음
             },
             on_conflict="portfolio_id,snapshot_date"
-        ).execute()
+        ))
 
         if result.data:
             created_entries.append(result.data[0])
@@ -487,9 +392,12 @@ async def get_manual_history(
     if not portfolio_id:
         return []
 
-    result = db.table("asset_history").select("*").eq(
-        "portfolio_id", str(portfolio_id)
-    ).order("snapshot_date", desc=True).execute()
+    result = await execute(
+        db.table("asset_history")
+        .select("*")
+        .eq("portfolio_id", str(portfolio_id))
+        .order("snapshot_date", desc=True)
+    )
 
     return [
         ManualHistoryResponse(
@@ -515,7 +423,7 @@ async def delete_asset_history(
     """
     자산 히스토리 삭제 냥~ 🗑️
     """
-    result = db.table("asset_history").delete().eq("id", str(history_id)).execute()
+    result = await execute(db.table("asset_history").delete().eq("id", str(history_id)))
 
     if result.data:
         return {"success": True, "message": "냥~ 삭제 완료다옹! 🐱"}
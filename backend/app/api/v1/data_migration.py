@@ -6,8 +6,9 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
-from app.db.supabase import supabase
+from app.db.supabase import supabase, execute
 from app.services.asset_service import AssetService
+from app.services.portfolio_state import portfolio_states
 
 router = APIRouter()
 
@@ -44,7 +45,7 @@ async def export_data(portfolio_id: Optional[str] = None):
         else:
             portfolios_query = supabase.table("portfolios").select("*")
 
-        portfolios_result = portfolios_query.execute()
+        portfolios_result = await execute(portfolios_query)
         portfolios = portfolios_result.data or []
 
         # 포트폴리오 ID 목록
@@ -62,11 +63,11 @@ async def export_data(portfolio_id: Optional[str] = None):
             }
 
         # 자산 조회
-        assets_result = supabase.table("assets").select("*").in_("portfolio_id", portfolio_ids).execute()
+        assets_result = await execute(supabase.table("assets").select("*").in_("portfolio_id", portfolio_ids))
         assets = assets_result.data or []
 
         # 리밸런싱 플랜 조회
-        plans_result = supabase.table("rebalance_plans").select("*").in_("portfolio_id", portfolio_ids).execute()
+        plans_result = await execute(supabase.table("rebalance_plans").select("*").in_("portfolio_id", portfolio_ids))
         plans = plans_result.data or []
 
         # 플랜 ID 목록
@@ -75,7 +76,7 @@ async def export_data(portfolio_id: Optional[str] = None):
         # 플랜 배분 조회
         allocations = []
         if plan_ids:
-            allocations_result = supabase.table("plan_allocations").select("*").in_("plan_id", plan_ids).execute()
+            allocations_result = await execute(supabase.table("plan_allocations").select("*").in_("plan_id", plan_ids))
             allocations = allocations_result.data or []
 
         # 민감 정보 제거 및 정리
@@ -182,27 +183,27 @@ async def import_data(request: ImportRequest):
             portfolio_name = p_data.get("name", "가져온 포트폴리오")
 
             # 기존 포트폴리오 확인
-            existing = supabase.table("portfolios").select("*").eq("name", portfolio_name).execute()
+            existing = await execute(supabase.table("portfolios").select("*").eq("name", portfolio_name))
 
             if existing.data:
                 if merge_strategy == "replace":
                     # 기존 데이터 삭제 후 새로 생성
                     portfolio_id = existing.data[0]["id"]
-                    supabase.table("assets").delete().eq("portfolio_id", portfolio_id).execute()
+                    await execute(supabase.table("assets").delete().eq("portfolio_id", portfolio_id))
                     # 플랜 배분 먼저 삭제
-                    plans_to_delete = supabase.table("rebalance_plans").select("id").eq("portfolio_id", portfolio_id).execute()
+                    plans_to_delete = await execute(supabase.table("rebalance_plans").select("id").eq("portfolio_id", portfolio_id))
                     for plan in (plans_to_delete.data or []):
-                        supabase.table("plan_allocations").delete().eq("plan_id", plan["id"]).execute()
-                    supabase.table("rebalance_plans").delete().eq("portfolio_id", portfolio_id).execute()
-                    supabase.table("portfolios").delete().eq("id", portfolio_id).execute()
+                        await execute(supabase.table("plan_allocations").delete().eq("plan_id", plan["id"]))
+                    await execute(supabase.table("rebalance_plans").delete().eq("portfolio_id", portfolio_id))
+                    await execute(supabase.table("portfolios").delete().eq("id", portfolio_id))
 
                     # 새 포트폴리오 생성
-                    new_portfolio = supabase.table("portfolios").insert({
+                    new_portfolio = await execute(supabase.table("portfolios").insert({
                         "name": portfolio_name,
                         "description": p_data.get("description"),
                         "base_currency": p_data.get("base_currency", "KRW"),
                         "target_value": p_data.get("target_value")
-                    }).execute()
+                    }))
                     if new_portfolio.data:
                         created_portfolios[portfolio_name] = new_portfolio.data[0]["id"]
                         stats["portfolios_created"] += 1
@@ -212,12 +213,12 @@ async def import_data(request: ImportRequest):
                     stats["portfolios_updated"] += 1
             else:
                 # 새 포트폴리오 생성
-                new_portfolio = supabase.table("portfolios").insert({
+                new_portfolio = await execute(supabase.table("portfolios").insert({
                     "name": portfolio_name,
                     "description": p_data.get("description"),
                     "base_currency": p_data.get("base_currency", "KRW"),
                     "target_value": p_data.get("target_value")
-                }).execute()
+                }))
 
                 if new_portfolio.data:
                     created_portfolios[portfolio_name] = new_portfolio.data[0]["id"]
@@ -225,14 +226,14 @@ async def import_data(request: ImportRequest):
 
         # 포트폴리오가 없으면 기본 생성
         if not created_portfolios:
-            default_portfolio = supabase.table("portfolios").select("*").limit(1).execute()
+            default_portfolio = await execute(supabase.table("portfolios").select("*").limit(1))
             if default_portfolio.data:
                 created_portfolios["default"] = default_portfolio.data[0]["id"]
             else:
-                new_default = supabase.table("portfolios").insert({
+                new_default = await execute(supabase.table("portfolios").insert({
                     "name": "가져온 포트폴리오",
                     "base_currency": "KRW"
-                }).execute()
+                }))
                 created_portfolios["default"] = new_default.data[0]["id"]
 
         # 2. 자산 생성
@@ -240,7 +241,7 @@ async def import_data(request: ImportRequest):
             portfolio_name = a_data.get("_portfolio_name", "default")
             portfolio_id = created_portfolios.get(portfolio_name) or list(created_portfolios.values())[0]
 
-            supabase.table("assets").insert({
+            await execute(supabase.table("assets").insert({
                 "portfolio_id": portfolio_id,
                 "name": a_data.get("name", "알 수 없는 자산"),
                 "ticker": a_data.get("ticker"),
@@ -252,7 +253,7 @@ async def import_data(request: ImportRequest):
                 "purchase_exchange_rate": a_data.get("purchase_exchange_rate"),
                 "notes": a_data.get("notes"),
                 "is_active": a_data.get("is_active", True)
-            }).execute()
+            }))
             stats["assets_created"] += 1
 
         # 3. 리밸런싱 플랜 생성
@@ -261,14 +262,14 @@ async def import_data(request: ImportRequest):
             portfolio_id = created_portfolios.get(portfolio_name) or list(created_portfolios.values())[0]
             plan_name = plan_data.get("name", "가져온 플랜")
 
-            new_plan = supabase.table("rebalance_plans").insert({
+            new_plan = await execute(supabase.table("rebalance_plans").insert({
                 "portfolio_id": portfolio_id,
                 "name": plan_name,
                 "description": plan_data.get("description"),
                 "strategy_prompt": plan_data.get("strategy_prompt"),
                 "is_main": plan_data.get("is_main", False),
                 "is_active": plan_data.get("is_active", True)
-            }).execute()
+            }))
 
             if new_plan.data:
                 created_plans[plan_name] = new_plan.data[0]["id"]
@@ -280,13 +281,16 @@ async def import_data(request: ImportRequest):
             plan_id = created_plans.get(plan_name)
 
             if plan_id:
-                supabase.table("plan_allocations").insert({
+                await execute(supabase.table("plan_allocations").insert({
                     "plan_id": plan_id,
                     "ticker": alloc_data.get("ticker"),
                     "target_percentage": alloc_data.get("target_percentage", 0)
-                }).execute()
+                }))
                 stats["allocations_created"] += 1
 
+        # 자산을 DB에 직접 지우고 넣었으니 캐시된 포트폴리오 평가 상태는 전부 버림 냥~
+        portfolio_states.clear()
+
         return {
             "success": True,
             "message": "데이터 가져오기 성공이다냥~ 🎉",
@@ -296,6 +300,8 @@ async def import_data(request: ImportRequest):
     except HTTPException:
         raise
     except Exception as e:
+        # 중간에 실패해도 일부는 이미 반영됐을 수 있음
+        portfolio_states.clear()
         raise HTTPException(status_code=500, detail=f"가져오기 실패 냥~ 😿: {str(e)}")
 
 
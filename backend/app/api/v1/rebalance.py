@@ -16,31 +16,28 @@ from app.models.schemas import (
     AllocationGroupResponse,
     AssetRebalanceResponse,
 )
-from app.services.rebalance_service import RebalanceService
+from app.api.deps import RebalanceServiceDep
 
 router = APIRouter(prefix="/rebalance", tags=["Rebalance Plans"])
 
 
 @router.get("/plans", response_model=list[RebalancePlanResponse])
-async def get_plans(portfolio_id: Optional[UUID] = None):
+async def get_plans(service: RebalanceServiceDep, portfolio_id: Optional[UUID] = None):
     """리밸런싱 플랜 목록 조회 냥~"""
-    service = RebalanceService()
     plans = await service.get_plans(portfolio_id)
     return plans
 
 
 @router.get("/main-plan", response_model=Optional[RebalancePlanResponse])
-async def get_main_plan(portfolio_id: Optional[UUID] = None):
+async def get_main_plan(service: RebalanceServiceDep, portfolio_id: Optional[UUID] = None):
     """메인 플랜 조회 냥~"""
-    service = RebalanceService()
     plan = await service.get_main_plan(portfolio_id)
     return plan
 
 
 @router.post("/plans", response_model=RebalancePlanResponse)
-async def create_plan(plan: RebalancePlanCreate):
+async def create_plan(service: RebalanceServiceDep, plan: RebalancePlanCreate):
     """리밸런싱 플랜 생성 냥~"""
-    service = RebalanceService()
     try:
         created_plan = await service.create_plan(plan.model_dump())
         return created_plan
@@ -49,9 +46,8 @@ async def create_plan(plan: RebalancePlanCreate):
 
 
 @router.get("/plans/{plan_id}", response_model=RebalancePlanResponse)
-async def get_plan(plan_id: UUID):
+async def get_plan(service: RebalanceServiceDep, plan_id: UUID):
     """리밸런싱 플랜 상세 조회 냥~"""
-    service = RebalanceService()
     plan = await service.get_plan(plan_id)
     if not plan:
         raise HTTPException(status_code=404, detail="플랜을 찾을 수 없다옹! 🙀")
@@ -59,9 +55,8 @@ async def get_plan(plan_id: UUID):
 
 
 @router.put("/plans/{plan_id}", response_model=RebalancePlanResponse)
-async def update_plan(plan_id: UUID, plan: RebalancePlanUpdate):
+async def update_plan(service: RebalanceServiceDep, plan_id: UUID, plan: RebalancePlanUpdate):
     """리밸런싱 플랜 수정 냥~"""
-    service = RebalanceService()
     try:
         updated_plan = await service.update_plan(
             plan_id, plan.model_dump(exclude_unset=True)
@@ -72,9 +67,8 @@ async def update_plan(plan_id: UUID, plan: RebalancePlanUpdate):
 
 
 @router.delete("/plans/{plan_id}", response_model=MeowResponse)
-async def delete_plan(plan_id: UUID):
+async def delete_plan(service: RebalanceServiceDep, plan_id: UUID):
     """리밸런싱 플랜 삭제 냥~"""
-    service = RebalanceService()
     await service.delete_plan(plan_id)
     return MeowResponse(
         success=True, message="플랜이 삭제됐다옹! 🐱"
@@ -82,9 +76,8 @@ async def delete_plan(plan_id: UUID):
 
 
 @router.post("/plans/{plan_id}/set-main", response_model=RebalancePlanResponse)
-async def set_main_plan(plan_id: UUID):
+async def set_main_plan(service: RebalanceServiceDep, plan_id: UUID):
     """메인 플랜 설정 냥~"""
-    service = RebalanceService()
     try:
         plan = await service.set_main_plan(plan_id)
         return plan
@@ -93,9 +86,12 @@ async def set_main_plan(plan_id: UUID):
 
 
 @router.put("/plans/{plan_id}/allocations", response_model=RebalancePlanResponse)
-async def save_allocations(plan_id: UUID, allocations: list[PlanAllocationCreate]):
+async def save_allocations(
+    service: RebalanceServiceDep,
+    plan_id: UUID,
+    allocations: list[PlanAllocationCreate],
+):
     """배분 설정 저장 냥~"""
-    service = RebalanceService()
     plan = await service.get_plan(plan_id)
     if not plan:
         raise HTTPException(status_code=404, detail="플랜을 찾을 수 없다옹! 🙀")
@@ -105,9 +101,12 @@ async def save_allocations(plan_id: UUID, allocations: list[PlanAllocationCreate
 
 
 @router.post("/plans/{plan_id}/calculate", response_model=AssetRebalanceResponse)
-async def calculate_rebalance(plan_id: UUID, portfolio_id: Optional[UUID] = None):
+async def calculate_rebalance(
+    service: RebalanceServiceDep,
+    plan_id: UUID,
+    portfolio_id: Optional[UUID] = None,
+):
     """플랜 기준 리밸런싱 계산 냥~"""
-    service = RebalanceService()
     try:
         result = await service.calculate_rebalance_by_plan(plan_id, portfolio_id)
         return result
@@ -116,12 +115,14 @@ async def calculate_rebalance(plan_id: UUID, portfolio_id: Optional[UUID] = None
 
 
 @router.post("/calculate-main", response_model=AssetRebalanceResponse)
-async def calculate_main_plan_rebalance(portfolio_id: Optional[UUID] = None):
+async def calculate_main_plan_rebalance(
+    service: RebalanceServiceDep,
+    portfolio_id: Optional[UUID] = None,
+):
     """메인 플랜 기준 리밸런싱 자동 계산 냥~
 
     메인 플랜을 자동으로 찾아서 리밸런싱 계산을 수행합니다.
     """
-    service = RebalanceService()
     main_plan = await service.get_main_plan(portfolio_id)
 
     if not main_plan:
@@ -141,9 +142,8 @@ async def calculate_main_plan_rebalance(portfolio_id: Optional[UUID] = None):
 # ============================================
 
 @router.get("/plans/{plan_id}/groups", response_model=list[AllocationGroupResponse])
-async def get_groups(plan_id: UUID):
+async def get_groups(service: RebalanceServiceDep, plan_id: UUID):
     """플랜의 배분 그룹 목록 조회 냥~"""
-    service = RebalanceService()
     plan = await service.get_plan(plan_id)
     if not plan:
         raise HTTPException(status_code=404, detail="플랜을 찾을 수 없다옹! 🙀")
@@ -153,9 +153,12 @@ async def get_groups(plan_id: UUID):
 
 
 @router.put("/plans/{plan_id}/groups", response_model=list[AllocationGroupResponse])
-async def save_groups(plan_id: UUID, groups: list[AllocationGroupCreate]):
+async def save_groups(
+    service: RebalanceServiceDep,
+    plan_id: UUID,
+    groups: list[AllocationGroupCreate],
+):
     """배분 그룹 저장 냥~"""
-    service = RebalanceService()
     plan = await service.get_plan(plan_id)
     if not plan:
         raise HTTPException(status_code=404, detail="플랜을 찾을 수 없다옹! 🙀")
@@ -6,6 +6,7 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException
 
 from app.api.deps import SupabaseDep
+from app.db.supabase import execute
 from app.models.schemas import UserSettingsResponse, UserSettingsUpdate
 
 router = APIRouter(prefix="/settings", tags=["settings"])
@@ -21,7 +22,7 @@ async def get_settings(db: SupabaseDep):
     설정이 없으면 기본값으로 자동 생성
     """
     # 설정 조회
-    result = db.table("user_settings").select("*").eq("user_id", str(DEFAULT_USER_ID)).execute()
+    result = await execute(db.table("user_settings").select("*").eq("user_id", str(DEFAULT_USER_ID)))
 
     if result.data:
         return result.data[0]
@@ -33,7 +34,7 @@ async def get_settings(db: SupabaseDep):
         "default_relative_band": 25.0,
     }
 
-    insert_result = db.table("user_settings").insert(new_settings).execute()
+    insert_result = await execute(db.table("user_settings").insert(new_settings))
 
     if not insert_result.data:
         raise HTTPException(status_code=500, detail="냥? 설정 생성에 실패했다옹! 🙀")
@@ -53,7 +54,7 @@ async def update_settings(settings: UserSettingsUpdate, db: SupabaseDep):
         raise HTTPException(status_code=400, detail="냥? 변경할 설정이 없다옹!")
 
     # 설정이 없으면 먼저 생성
-    existing = db.table("user_settings").select("id").eq("user_id", str(DEFAULT_USER_ID)).execute()
+    existing = await execute(db.table("user_settings").select("id").eq("user_id", str(DEFAULT_USER_ID)))
 
     if not existing.data:
         # 기본값으로 생성 후 업데이트
@@ -63,14 +64,13 @@ async def update_settings(settings: UserSettingsUpdate, db: SupabaseDep):
             "default_relative_band": 25.0,
             **update_data,
         }
-        result = db.table("user_settings").insert(new_settings).execute()
+        result = await execute(db.table("user_settings").insert(new_settings))
     else:
         # 기존 설정 업데이트
-        result = (
+        result = await execute(
             db.table("user_settings")
             .update(update_data)
             .eq("user_id", str(DEFAULT_USER_ID))
-            .execute()
         )
 
     if not result.data:
@@ -22,10 +22,73 @@ class Settings(BaseSettings):
     # 스케줄러 설정 (매일 밤 11시에 스냅샷 저장)
     snapshot_hour: int = 23
     snapshot_minute: int = 0
+    # 스냅샷 작업에서 동시에 평가할 포트폴리오 수
+    snapshot_concurrency: int = 4
+    # 대시보드 시장 지표 스냅샷 갱신 주기 (엔드포인트는 스냅샷만 읽음)
+    market_indicators_refresh_seconds: int = 300
+    # 포트폴리오 평가 상태 재구성 주기 (그 사이엔 시세 틱/자산 변경만 증분 반영)
+    portfolio_state_ttl_seconds: int = 300
+
+    # 보유 티커 + 시장 지표 시세 예열 (만료 임박한 시세만 주기적으로 미리 갱신)
+    quote_prewarm_enabled: bool = True
+    quote_prewarm_interval_seconds: int = 45
     timezone: str = "Asia/Seoul"
 
     # 환율 설정
     default_usd_krw_rate: float = 1350.0
+    # 환율 캐시 유효 시간 (이 시간 안에는 재조회 없이 캐시 사용)
+    exchange_rate_ttl_seconds: int = 300
+
+    # 시세 캐시 설정 (프로세스 전역, TTL + stale-while-revalidate)
+    quote_cache_ttl_seconds: int = 60
+    quote_cache_stale_seconds: int = 600
+    quote_cache_max_size: int = 2000
+    # 거래소 장 시간 기준 TTL (장 마감 후 시세는 다음 개장까지 캐시)
+    quote_cache_market_hours: bool = True
+
+    # 티커 메타데이터(이름/통화/거래소/유효성) 캐시 - 거의 안 바뀌어서 하루 단위
+    ticker_metadata_ttl_seconds: int = 86400
+    # 없는 티커로 확인된 결과는 짧게 캐시
+    ticker_metadata_invalid_ttl_seconds: int = 600
+    # 펀더멘털(PER 등 .info) 캐시 기본 유지 시간 (PER은 장중에 거의 안 바뀜)
+    fundamentals_ttl_seconds: int = 86400
+
+    # 일괄 시세 조회 시 한 번에 요청할 티커 수
+    quote_batch_size: int = 50
+
+    # yfinance 호출용 스레드 풀 크기 (앱 전체에서 하나만 사용)
+    finance_max_workers: int = 8
+
+    # 시세 제공자: yfinance | yahoo (httpx 비동기 chart API) | local (네트워크 없이 시드 기반 가상 시세, 부하 테스트용)
+    market_data_provider: str = "yfinance"
+    # yahoo 제공자 커넥션 풀 크기와 동시 요청 수
+    yahoo_max_connections: int = 100
+    yahoo_max_keepalive: int = 20
+    yahoo_concurrency: int = 32
+    market_data_seed: int = 42
+    # local 제공자 호출마다 지연(ms)과 실패 확률
+    market_data_latency_ms: float = 0.0
+    market_data_failure_rate: float = 0.0
+
+    # yfinance 호출 가드 (AIMD 동시성 제한 + 호출 타임아웃 + 서킷 브레이커)
+    upstream_min_concurrency: int = 1
+    upstream_max_concurrency: int = 8
+    upstream_timeout_seconds: float = 15.0
+    # 연속 실패 횟수가 이만큼 쌓이면 upstream_open_seconds 동안 호출 차단 (캐시/마지막 정상값 사용)
+    upstream_failure_threshold: int = 5
+    upstream_open_seconds: float = 30.0
+
+    # DB 쿼리용 스레드 풀 크기 (동기 supabase 호출을 이벤트 루프 밖에서 실행)
+    db_max_workers: int = 10
+
+    # 가격 히스토리 로컬 저장소 (티커별 .npz, 지난 종가는 재조회하지 않음)
+    history_store_enabled: bool = True
+    history_store_dir: str = "data/history"
+    # 최근 구간(당일 종가) 재확인 주기
+    history_refresh_seconds: int = 900
+
+    # 영구 캐시 (SQLite) 경로 - 설정하면 시세/환율/메타데이터를 디스크에 남겨서 재시작 후에도 사용
+    persistent_cache_path: str | None = None
 
     class Config:
         env_file = ".env"
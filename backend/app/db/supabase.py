@@ -2,7 +2,11 @@
 Supabase 클라이언트 냥~ 🐱
 데이터베이스 연결을 담당하는 모듈
 """
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from typing import Any
+
 from supabase import create_client, Client
 from app.config import settings
 
@@ -21,3 +25,25 @@ def get_supabase_client() -> Client:
 
 # 편의를 위한 클라이언트 인스턴스
 supabase: Client = get_supabase_client()
+
+
+# DB 쿼리 전용 스레드 풀 냥~
+# supabase-py의 .execute()는 동기 HTTP 호출이라 이벤트 루프를 막지 않도록 여기서 실행
+_db_executor = ThreadPoolExecutor(
+    max_workers=settings.db_max_workers,
+    thread_name_prefix="meowney-db",
+)
+
+
+async def execute(query: Any) -> Any:
+    """
+    쿼리 빌더를 DB 스레드 풀에서 실행 냥~
+    사용법: result = await execute(db.table("assets").select("*"))
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_db_executor, query.execute)
+
+
+def shutdown_db_executor() -> None:
+    """앱 종료 시 DB 스레드 풀 정리 냥~"""
+    _db_executor.shutdown(wait=True, cancel_futures=True)
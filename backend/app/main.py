@@ -11,6 +11,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.api.v1.router import api_router
 from app.services.scheduler_service import start_scheduler, shutdown_scheduler
+from app.services.finance_service import init_finance_service, close_finance_service
+from app.services.persistent_cache import close_persistent_cache
+from app.services.upstream_guard import upstream_guard
+from app.db.supabase import shutdown_db_executor
 
 # Windows 콘솔 인코딩 문제 해결
 if sys.platform == "win32":
@@ -26,6 +30,7 @@ async def lifespan(app: FastAPI):
     """
     # 시작 시
     print("[Meowney] 서버가 기지개를 켜는 중이다옹...")
+    init_finance_service()
     start_scheduler()
     print("[Meowney] 스케줄러가 깨어났다옹! 매일 밤 자산 스냅샷을 찍을 거야~")
 
@@ -34,6 +39,9 @@ async def lifespan(app: FastAPI):
     # 종료 시
     print("[Meowney] 서버가 잠들 준비를 하는 중이다옹...")
     shutdown_scheduler()
+    await close_finance_service()
+    close_persistent_cache()
+    shutdown_db_executor()
     print("[Meowney] 안녕히 주무세요 냥~")
 
 
@@ -65,6 +73,8 @@ async def health_check():
         "status": "healthy",
         "message": "🐱 야옹~ 서버가 잘 돌아가고 있다옹!",
         "app_name": settings.app_name,
+        # 시세 업스트림(yfinance) 상태 - 서킷이 열려 있으면 캐시/마지막 정상값으로 응답 중
+        "upstream": upstream_guard.snapshot(),
     }
 
 
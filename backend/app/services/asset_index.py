@@ -0,0 +1,81 @@
+"""
+Asset Index - 배분 항목 ↔ 자산 매칭용 인덱스 냥~ 🐱
+요청마다 자산 목록을 한 번만 훑어서 id / ticker / name 딕셔너리를 만들어 두고 재사용
+"""
+from typing import Iterator, Optional
+
+from app.services.holdings import asset_key
+
+
+class AssetIndex:
+    """
+    자산 매칭 인덱스 냥~
+
+    match_item_to_asset의 선형 탐색과 결과가 같도록 같은 키는 먼저 나온 자산이 우선
+    - by_id / by_ticker / by_name: 정확히 일치하는 자산
+    - alias: 소문자 이름을 미리 만들어 두고, alias별 포함 검사 결과를 캐시
+    """
+
+    def __init__(self, assets: list[dict]):
+        self.assets = assets
+        self.by_id: dict[str, dict] = {}
+        self.by_ticker: dict[str, dict] = {}
+        self.by_name: dict[str, dict] = {}
+        self._lower_names: list[tuple[str, dict]] = []
+        self._alias_cache: dict[str, Optional[dict]] = {}
+
+        for asset in assets:
+            self.by_id.setdefault(asset_key(asset), asset)
+            if asset.get("ticker"):
+                self.by_ticker.setdefault(asset["ticker"], asset)
+            if asset.get("name") is not None:
+                self.by_name.setdefault(asset["name"], asset)
+            self._lower_names.append(((asset.get("name") or "").lower(), asset))
+
+    def match_alias(self, alias: str) -> Optional[dict]:
+        """alias ⊂ 이름 또는 이름 ⊂ alias 인 첫 번째 자산 냥~"""
+        alias_lower = alias.lower()
+        if alias_lower not in self._alias_cache:
+            self._alias_cache[alias_lower] = next(
+                (
+                    asset
+                    for name_lower, asset in self._lower_names
+                    if alias_lower in name_lower or name_lower in alias_lower
+                ),
+                None,
+            )
+        return self._alias_cache[alias_lower]
+
+    def match(self, item: dict) -> Optional[dict]:
+        """
+        배분 항목을 자산에 매칭 냥~
+
+        매칭 우선순위:
+        1. asset_id - 직접 참조
+        2. ticker - 티커 매칭 (티커 칸에 이름을 넣은 경우도 허용)
+        3. alias - 이름 포함 검사
+        """
+        if item.get("asset_id"):
+            asset = self.by_id.get(str(item["asset_id"]))
+            if asset is not None:
+                return asset
+
+        if item.get("ticker"):
+            ticker = item["ticker"]
+            asset = self.by_ticker.get(ticker)
+            if asset is None:
+                # 티커 칸에 이름을 넣은 경우 (예: '국내 금현물')
+                asset = self.by_name.get(ticker)
+            if asset is not None:
+                return asset
+
+        if item.get("alias"):
+            return self.match_alias(item["alias"])
+
+        return None
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.assets)
+
+    def __len__(self) -> int:
+        return len(self.assets)
@@ -1,7 +1,7 @@
 """
 Asset Service - 자산 관리 비즈니스 로직 냥~ 🐱
 """
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 from uuid import UUID
 from typing import Optional, Any
@@ -12,13 +12,17 @@ from app.models.schemas import (
     AssetCreate,
     AssetUpdate,
     DashboardSummary,
-    CategoryAllocation,
     AssetHistoryResponse,
     RebalanceTarget,
     RebalanceResponse,
     RebalanceSuggestion,
 )
 from app.config import settings
+from app.db.supabase import execute
+from app.services.holdings import Holding
+from app.services.money import Money
+from app.services.portfolio_state import build_summary, portfolio_states
+from app.services.valuation_engine import summary_columns
 
 
 class AssetService:
@@ -32,7 +36,7 @@ class AssetService:
 
     async def _get_default_portfolio_id(self) -> UUID:
         """기본 포트폴리오 ID 조회"""
-        result = self.db.table("portfolios").select("id").limit(1).execute()
+        result = await execute(self.db.table("portfolios").select("id").limit(1))
         if result.data:
             return UUID(result.data[0]["id"])
         raise ValueError("기본 포트폴리오가 없다옹! DB 초기화 필요 🙀")
@@ -41,7 +45,7 @@ class AssetService:
         self,
         portfolio_id: Optional[UUID] = None,
         include_inactive: bool = False,
-    ) -> list[dict]:
+    ) -> list[Holding]:
         """
         자산 목록 조회 냥~
         카테고리 정보도 함께 조인
@@ -58,41 +62,25 @@ class AssetService:
         if not include_inactive:
             query = query.eq("is_active", True)
 
-        result = query.order("created_at", desc=False).execute()
-
-        # 카테고리 정보 평탄화
-        assets = []
-        for row in result.data:
-            asset = dict(row)
-            category = asset.pop("asset_categories", None)
-            if category:
-                asset["category_name"] = category.get("name")
-                asset["category_color"] = category.get("color")
-                asset["category_icon"] = category.get("icon")
-            assets.append(asset)
+        result = await execute(query.order("created_at", desc=False))
 
-        return assets
+        # 행마다 한 번만 파싱 (UUID/Decimal 변환, 카테고리 평탄화)
+        return [Holding.from_row(row) for row in result.data]
 
-    async def get_asset(self, asset_id: UUID) -> Optional[dict]:
+    async def get_asset(self, asset_id: UUID) -> Optional[Holding]:
         """특정 자산 조회"""
-        result = (
+        result = await execute(
             self.db.table("assets")
             .select("*, asset_categories(name, color, icon)")
             .eq("id", str(asset_id))
             .single()
-            .execute()
         )
 
         if result.data:
-            asset = dict(result.data)
-            category = asset.pop("asset_categories", None)
-            if category:
-                asset["category_name"] = category.get("name")
-                asset["category_color"] = category.get("color")
-            return asset
+            return Holding.from_row(result.data)
         return None
 
-    async def create_asset(self, data: AssetCreate) -> dict:
+    async def create_asset(self, data: AssetCreate) -> Holding:
         """새 자산 생성 냥~"""
         portfolio_id = data.portfolio_id
         if not portfolio_id:
@@ -114,10 +102,12 @@ class AssetService:
         if data.current_value is not None:
             insert_data["current_value"] = str(data.current_value)
 
-        result = self.db.table("assets").insert(insert_data).execute()
-        return result.data[0]
+        result = await execute(self.db.table("assets").insert(insert_data))
+        holding = Holding.from_row(result.data[0])
+        portfolio_states.upsert(holding)
+        return holding
 
-    async def update_asset(self, asset_id: UUID, data: AssetUpdate) -> Optional[dict]:
+    async def update_asset(self, asset_id: UUID, data: AssetUpdate) -> Optional[Holding]:
         """자산 정보 수정 냥~"""
         update_data = data.model_dump(exclude_unset=True)
 
@@ -129,34 +119,41 @@ class AssetService:
         if "category_id" in update_data and update_data["category_id"]:
             update_data["category_id"] = str(update_data["category_id"])
 
-        result = (
+        result = await execute(
             self.db.table("assets")
             .update(update_data)
             .eq("id", str(asset_id))
-            .execute()
         )
 
-        return result.data[0] if result.data else None
+        if not result.data:
+            return None
+        holding = Holding.from_row(result.data[0])
+        portfolio_states.upsert(holding)
+        return holding
 
     async def soft_delete_asset(self, asset_id: UUID) -> bool:
         """자산 비활성화 (소프트 삭제)"""
-        result = (
+        result = await execute(
             self.db.table("assets")
             .update({"is_active": False})
             .eq("id", str(asset_id))
-            .execute()
         )
-        return len(result.data) > 0
+        if not result.data:
+            return False
+        portfolio_states.remove(asset_id)
+        return True
 
     async def hard_delete_asset(self, asset_id: UUID) -> bool:
         """자산 완전 삭제"""
-        result = (
+        result = await execute(
             self.db.table("assets")
             .delete()
             .eq("id", str(asset_id))
-            .execute()
         )
-        return len(result.data) > 0
+        if not result.data:
+            return False
+        portfolio_states.remove(asset_id)
+        return True
 
     async def calculate_summary(
         self,
@@ -174,78 +171,29 @@ class AssetService:
             exchange_rate: USD/KRW 현재 환율 (폴백용)
         """
         # 기본 환율 설정 (settings에서 가져옴)
-        current_rate = exchange_rate if exchange_rate else Decimal(str(settings.default_usd_krw_rate))
+        current_rate = exchange_rate if exchange_rate else settings.default_usd_krw_rate
 
-        total_value = Decimal("0")
-        total_principal = Decimal("0")
-        category_totals: dict[str, dict] = {}
+        # 금액은 고정소수점 정수 열로 한 번에 계산 냥~ (평가 상태의 증분 계산과 같은 식)
+        market, principal = summary_columns(enriched_assets, current_rate)
 
-        for asset in enriched_assets:
-            # finance_service.enrich_assets_with_prices()에서 이미 원화 환산된 market_value 사용
-            market_value = Decimal(str(asset.get("market_value", 0)))
-            quantity = Decimal(str(asset.get("quantity", 0)))
-            avg_price = Decimal(str(asset.get("average_price", 0)))
-            currency = asset.get("currency", "KRW")
-
-            # 현금은 수익 계산에서 제외: principal = market_value로 맞춤 냥~ 💰
-            if asset.get("asset_type") == "cash":
-                principal = market_value
-            elif currency == "USD":
-                # 매수시점 환율, 없으면 현재 환율로 폴백
-                purchase_rate = asset.get("purchase_exchange_rate")
-                if purchase_rate:
-                    purchase_rate = Decimal(str(purchase_rate))
-                else:
-                    purchase_rate = current_rate
-                principal = quantity * avg_price * purchase_rate
-            else:
-                principal = quantity * avg_price
-
-            total_value += market_value
-            total_principal += principal
-
-            # 카테고리별 집계
+        # 카테고리별 집계
+        category_totals: dict[str, dict] = {}
+        for asset, market_units in zip(enriched_assets, market.tolist()):
             cat_name = asset.get("category_name", "기타")
-            cat_color = asset.get("category_color", "#6b7280")
-            cat_id = asset.get("category_id")
 
             if cat_name not in category_totals:
                 category_totals[cat_name] = {
-                    "category_id": cat_id,
-                    "color": cat_color,
-                    "market_value": Decimal("0"),
+                    "category_id": asset.get("category_id"),
+                    "color": asset.get("category_color", "#6b7280"),
+                    "units": 0,
                 }
-            category_totals[cat_name]["market_value"] += market_value
-
-        # 수익률 계산
-        total_profit = total_value - total_principal
-        profit_rate = float((total_profit / total_principal * 100)) if total_principal > 0 else 0.0
-
-        # 카테고리별 비율 계산
-        allocations = []
-        for cat_name, data in category_totals.items():
-            percentage = float((data["market_value"] / total_value * 100)) if total_value > 0 else 0.0
-            allocations.append(
-                CategoryAllocation(
-                    category_id=UUID(data["category_id"]) if data["category_id"] else None,
-                    category_name=cat_name,
-                    color=data["color"],
-                    market_value=data["market_value"],
-                    percentage=round(percentage, 2),
-                )
-            )
+            category_totals[cat_name]["units"] += market_units
 
-        # 비율 내림차순 정렬
-        allocations.sort(key=lambda x: x.percentage, reverse=True)
-
-        return DashboardSummary(
-            total_value=total_value,
-            total_principal=total_principal,
-            total_profit=total_profit,
-            profit_rate=round(profit_rate, 2),
+        return build_summary(
+            Money(int(market.sum())),
+            Money(int(principal.sum())),
+            category_totals,
             asset_count=len(enriched_assets),
-            allocations=allocations,
-            last_updated=datetime.now(),
         )
 
     async def get_asset_history(
@@ -259,7 +207,7 @@ class AssetService:
         if not portfolio_id:
             portfolio_id = await self._get_default_portfolio_id()
 
-        result = (
+        result = await execute(
             self.db.table("asset_history")
             .select("*")
             .eq("portfolio_id", str(portfolio_id))
@@ -267,7 +215,6 @@ class AssetService:
             .lte("snapshot_date", end_date.isoformat())
             .order("snapshot_date", desc=False)
             .limit(limit)
-            .execute()
         )
 
         # Decimal 변환
@@ -286,6 +233,11 @@ class AssetService:
         일일 스냅샷 저장 냥~ 🐱
         스케줄러에서 호출
         """
+        saved = await self.save_snapshots([self.build_snapshot_row(portfolio_id, summary)])
+        return saved[0] if saved else {}
+
+    def build_snapshot_row(self, portfolio_id: UUID, summary: DashboardSummary) -> dict:
+        """asset_history 스냅샷 행 생성 냥~ (오늘 날짜 기준)"""
         today = date.today()
 
         # 카테고리별 금액 JSON
@@ -294,7 +246,7 @@ class AssetService:
             for alloc in summary.allocations
         }
 
-        snapshot_data = {
+        return {
             "portfolio_id": str(portfolio_id),
             "snapshot_date": today.isoformat(),
             "total_value": str(summary.total_value),
@@ -304,14 +256,18 @@ class AssetService:
             "category_breakdown": category_breakdown,
         }
 
+    async def save_snapshots(self, rows: list[dict]) -> list[dict]:
+        """여러 포트폴리오 스냅샷 한 번에 저장 냥~ (같은 날짜면 업데이트)"""
+        if not rows:
+            return []
+
         # UPSERT (같은 날짜면 업데이트)
-        result = (
+        result = await execute(
             self.db.table("asset_history")
-            .upsert(snapshot_data, on_conflict="portfolio_id,snapshot_date")
-            .execute()
+            .upsert(rows, on_conflict="portfolio_id,snapshot_date")
         )
 
-        return result.data[0] if result.data else {}
+        return result.data or []
 
     async def calculate_rebalance(
         self,
@@ -333,7 +289,7 @@ class AssetService:
         category_names: dict[str, str] = {}  # category_id -> name 매핑
 
         for asset in enriched_assets:
-            cat_id = asset.get("category_id")
+            cat_id = str(asset["category_id"]) if asset.get("category_id") else None
             cat_name = asset.get("category_name", "기타")
             market_value = Decimal(str(asset.get("market_value", 0)))
 
@@ -370,20 +326,26 @@ class AssetService:
 
     async def get_all_portfolio_ids(self) -> list[UUID]:
         """모든 포트폴리오 ID 조회 (스케줄러용)"""
-        result = self.db.table("portfolios").select("id").execute()
+        result = await execute(self.db.table("portfolios").select("id"))
         return [UUID(row["id"]) for row in result.data]
 
+    async def get_active_tickers(self) -> list[str]:
+        """전체 포트폴리오의 활성 자산 티커 (중복 제거, 스케줄러용)"""
+        result = await execute(
+            self.db.table("assets").select("ticker").eq("is_active", True)
+        )
+        return sorted({row["ticker"] for row in result.data if row.get("ticker")})
+
     async def get_portfolio(self, portfolio_id: Optional[UUID] = None) -> dict:
         """포트폴리오 정보 조회 냥~"""
         if not portfolio_id:
             portfolio_id = await self._get_default_portfolio_id()
 
-        result = (
+        result = await execute(
             self.db.table("portfolios")
             .select("*")
             .eq("id", str(portfolio_id))
             .single()
-            .execute()
         )
 
         return result.data if result.data else {}
@@ -394,11 +356,10 @@ class AssetService:
         update_data: dict,
     ) -> dict:
         """포트폴리오 정보 수정 냥~"""
-        result = (
+        result = await execute(
             self.db.table("portfolios")
             .update(update_data)
             .eq("id", str(portfolio_id))
-            .execute()
         )
 
         return result.data[0] if result.data else {}
@@ -420,11 +381,10 @@ class AssetService:
             portfolio_id = await self._get_default_portfolio_id()
 
         try:
-            result = (
+            result = await execute(
                 self.db.table("target_allocations")
                 .select("*, asset_categories(name)")
                 .eq("portfolio_id", str(portfolio_id))
-                .execute()
             )
         except Exception:
             # 테이블이 폐기된 경우 빈 목록 반환
@@ -468,10 +428,9 @@ class AssetService:
         ]
 
         try:
-            result = (
+            result = await execute(
                 self.db.table("target_allocations")
                 .upsert(upsert_data, on_conflict="portfolio_id,category_id")
-                .execute()
             )
             return result.data
         except Exception:
@@ -1,59 +1,363 @@
 """
-Finance Service - yfinance 연동 냥~ 🐱
-실시간 주가 조회 및 계산 담당
+Finance Service - 시세 조회 및 계산 냥~ 🐱
+실제 시세는 MarketDataProvider(기본 yfinance)에서 조회
 """
 import asyncio
+import time
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable, Iterable, Optional
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-import yfinance as yf
+import numpy as np
+import pandas as pd
+import pytz
 
 from app.config import settings
+from app.services.quote_cache import QuoteCache, quote_cache, FRESH, STALE, MISS
+from app.services.single_flight import SingleFlight
+from app.services.fx_matrix import FxMatrix, BASE_CURRENCY
+from app.services.holdings import Holding, ValuedHolding
+from app.services.valuation_engine import value_assets
+from app.services.portfolio_state import portfolio_states
+from app.services.history_store import history_store
+from app.services.history_transforms import benchmark_points, sparkline
+from app.services.persistent_cache import persistent_cache, QUOTES, FX, META
+from app.services.market_hours import quote_ttl
+from app.services.upstream_guard import upstream_guard, UpstreamError
+from app.services.ticker_metadata import ticker_metadata
+from app.services.market_data import MarketDataProvider, create_market_data_provider
+
+
+# 대시보드 시장 지표 목록 냥~ (스케줄러 시세 예열에도 사용)
+MARKET_INDICATORS = [
+    {"ticker": "^KS11", "name": "KOSPI", "currency": "KRW"},
+    {"ticker": "^GSPC", "name": "S&P 500", "currency": "USD"},
+    {"ticker": "^IXIC", "name": "NASDAQ", "currency": "USD"},
+    {"ticker": "^VIX", "name": "VIX", "currency": ""},
+]
+
+# 예열 대상 시장 지표 티커 (지수 + 환율 + 금/은 선물)
+MARKET_INDICATOR_TICKERS = [m["ticker"] for m in MARKET_INDICATORS] + ["USDKRW=X", "GC=F", "SI=F"]
+
+# 지수 PER 조회 대상 (key, 티커, 표시 이름) 냥~ 지수 자체 PER이 없어서 대표 ETF 사용
+INDEX_PER_SOURCES = [
+    ("sp500", "SPY", "S&P 500 (SPY)"),
+    ("nasdaq", "QQQ", "NASDAQ (QQQ)"),
+    ("kospi", "EWY", "KOSPI (EWY)"),
+]
 
 
 class FinanceService:
     """
     금융 데이터 서비스 냥~ 🐱
-    yfinance를 사용하여 실시간 주가 조회
+    시세 제공자(yfinance 또는 local)로 실시간 주가 조회
     """
 
     # 클래스 레벨 환율 캐시 (인스턴스 간 공유)
+    # exchange_rate_ttl_seconds 이내면 재조회 없이 사용, 조회 실패 시에는 오래된 값도 폴백으로 사용
     _exchange_rate_cache: dict[str, dict] = {}
 
-    def __init__(self):
-        self._executor = ThreadPoolExecutor(max_workers=5)
-        self._price_cache: dict[str, dict] = {}  # 간단한 메모리 캐시
+    # 백그라운드 갱신 중인 티커 (중복 갱신 방지) 냥~
+    _refreshing: set[str] = set()
+    _refresh_tasks: set[asyncio.Task] = set()
+
+    # 동시에 들어온 같은 조회 합치기 (인스턴스 간 공유) 냥~
+    _quote_flights = SingleFlight()
+    _fx_flights = SingleFlight()
+    _history_flights = SingleFlight()
+    _fundamentals_flights = SingleFlight()
+
+    # 펀더멘털(.info) 캐시 냥~ 호출하는 쪽이 TTL을 정함 (PER은 하루)
+    # 조회 실패 시에는 만료된 값이라도 폴백으로 사용
+    _fundamentals_cache = QuoteCache(
+        ttl_seconds=settings.fundamentals_ttl_seconds,
+        stale_seconds=0,
+        max_size=settings.quote_cache_max_size,
+    )
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        provider: MarketDataProvider | None = None,
+    ):
+        workers = max_workers or settings.finance_max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="meowney-finance",
+        )
+        # 스레드 풀 업스트림 호출 슬롯 냥~ (타임아웃으로 버려진 호출도 스레드가 끝날 때까지 슬롯 차지)
+        self._upstream_slots = asyncio.Semaphore(workers)
+        self.provider = provider or create_market_data_provider()
+        # 비동기 제공자(yahoo)면 스레드 풀 없이 이벤트 루프에서 바로 await
+        self._is_async = asyncio.iscoroutinefunction(self.provider.quote)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        스레드 풀 정리 냥~
+        대기열 작업은 취소하고, 실행 중인 작업(영구 캐시 쓰기 등)은 끝날 때까지 기다림
+        멈춘 업스트림 호출에 종료가 묶이지 않게 최대 timeout초 (기본 upstream_timeout_seconds)
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        timeout = settings.upstream_timeout_seconds if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        for thread in list(self._executor._threads):
+            thread.join(max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                print(f"⚠️ 스레드 풀 작업이 {timeout}초 안에 안 끝나서 기다리지 않고 종료 냥")
+                break
+
+    async def aclose(self) -> None:
+        """시세 제공자 연결(HTTP 커넥션 풀)과 스레드 풀 정리 냥~"""
+        aclose = getattr(self.provider, "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception as e:
+                print(f"🙀 시세 제공자 종료 실패 냥: {e}")
+        # 실행 중인 스레드 작업을 기다리는 동안 이벤트 루프는 막지 않음
+        await asyncio.to_thread(self.close)
+
+    def warm_start(self) -> None:
+        """
+        영구 캐시에서 마지막 시세/환율 불러오기 냥~ 🔥
+        장중 시세는 stale로 넣어서 첫 요청은 즉시 응답하고 백그라운드에서 갱신
+        """
+        if persistent_cache is None:
+            return
+        try:
+            quotes = persistent_cache.load(QUOTES, limit=settings.quote_cache_max_size)
+            # 오래된 것부터 넣어야 LRU에서 최근 값이 남음
+            # 장 마감 후 받은 시세는 다음 개장 전까지 그대로 신선, 나머지는 stale로 넣음
+            for ticker, (quote, updated_at) in reversed(list(quotes.items())):
+                ttl = quote_ttl(
+                    ticker,
+                    quote.get("exchange"),
+                    fetched_at=datetime.fromtimestamp(updated_at, pytz.utc),
+                )
+                quote_cache.set(ticker, quote, ttl_seconds=max(0.0, ttl))
+
+            # 메타데이터는 저장 시각 기준 남은 TTL만큼
+            metas = persistent_cache.load(META, limit=settings.quote_cache_max_size)
+            now = time.time()
+            for ticker, (meta, updated_at) in reversed(list(metas.items())):
+                remaining = settings.ticker_metadata_ttl_seconds - (now - updated_at)
+                if remaining > 0:
+                    ticker_metadata.remember(ticker, {**meta, "valid": True}, ttl_seconds=remaining)
+
+            rates = persistent_cache.load(FX)
+            for key, (value, updated_at) in rates.items():
+                FinanceService._exchange_rate_cache.setdefault(key, {
+                    "rate": float(value["rate"]),
+                    "timestamp": datetime.fromtimestamp(updated_at),
+                    "source": "persistent",
+                })
+            print(f"🔥 영구 캐시에서 시세 {len(quotes)}개, 환율 {len(rates)}개 불러왔다옹~")
+        except Exception as e:
+            print(f"🙀 영구 캐시 불러오기 실패 냥: {e}")
+
+    def _persist_sync(self, namespace: str, items: dict[str, Any]) -> None:
+        """영구 캐시 기록 냥~ (실패해도 조회 결과에는 영향 없음)"""
+        if persistent_cache is None or not items:
+            return
+        try:
+            persistent_cache.put_many(namespace, items)
+        except Exception as e:
+            print(f"🙀 영구 캐시 저장 실패 냥: {namespace} - {e}")
+
+    def _persisted_sync(self, namespace: str, key: str) -> Optional[Any]:
+        """영구 캐시 조회 냥~ (없거나 실패하면 None)"""
+        if persistent_cache is None:
+            return None
+        try:
+            entry = persistent_cache.get(namespace, key)
+        except Exception as e:
+            print(f"🙀 영구 캐시 조회 실패 냥: {namespace}/{key} - {e}")
+            return None
+        return entry[0] if entry else None
+
+    async def _remember_quotes(self, quotes: dict[str, dict]) -> None:
+        """
+        유효한 시세를 공유 캐시에 넣고 영구 캐시에도 기록 냥~
+        TTL은 거래소 장 시간 기준 (장 마감 후면 다음 개장까지)
+        """
+        for ticker, quote in quotes.items():
+            quote_cache.set(ticker, quote, ttl_seconds=quote_ttl(ticker, quote.get("exchange")))
+            ticker_metadata.remember(ticker, quote)
+        # 포트폴리오 평가 상태에는 시세 틱으로 반영 (바뀐 티커의 자산만 다시 평가)
+        portfolio_states.apply_quotes(quotes)
+
+        if persistent_cache is None or not quotes:
+            return
+        meta = {
+            ticker: {
+                "name": quote.get("name"),
+                "currency": quote.get("currency"),
+                "exchange": quote.get("exchange"),
+            }
+            for ticker, quote in quotes.items()
+            if quote.get("name") or quote.get("exchange")
+        }
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self._executor, self._persist_sync, QUOTES, quotes)
+        await loop.run_in_executor(self._executor, self._persist_sync, META, meta)
+
+    async def _last_known_quote(self, ticker: str) -> Optional[dict]:
+        """조회 실패 시 폴백할 마지막 정상 시세 냥~ (메모리 → 영구 캐시)"""
+        known = quote_cache.peek(ticker)
+        if known is None and persistent_cache is not None:
+            loop = asyncio.get_event_loop()
+            known = await loop.run_in_executor(self._executor, self._persisted_sync, QUOTES, ticker)
+        return known if known and known.get("valid") else None
+
+    async def _call_upstream(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        시세 제공자 호출을 업스트림 가드 아래에서 실행 냥~
+        코루틴 함수는 바로 await, 동기 함수는 스레드 풀에서 실행
+        서킷이 열려 있거나 타임아웃이면 UpstreamError
+        """
+        if asyncio.iscoroutinefunction(fn):
+            return await upstream_guard.call(partial(fn, *args))
+        return await self._run_upstream_sync(fn, *args)
+
+    async def _run_upstream_sync(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        동기 업스트림 호출을 스레드 풀에서 실행 냥~
+        풀 슬롯은 가드에 들어가기 전에 얻음 (로컬 풀이 꽉 차서 기다린 시간은 업스트림 타임아웃이 아님)
+        가드 타임아웃은 await만 끊고 스레드는 계속 돌아가므로,
+        스레드가 실제로 끝날 때 슬롯을 돌려줘서 풀 크기 이상 쌓이지 않게 함
+        """
+        await self._upstream_slots.acquire()
+        loop = asyncio.get_running_loop()
+        submitted = False
+
+        def submit() -> asyncio.Future:
+            nonlocal submitted
+            future = self._executor.submit(fn, *args)
+            submitted = True
+            future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._upstream_slots.release))
+            return asyncio.wrap_future(future)
+
+        try:
+            return await upstream_guard.call(submit)
+        finally:
+            if not submitted:
+                # 서킷이 열려 있거나 제출 전에 실패/취소 → 바로 반납
+                self._upstream_slots.release()
+
+    @staticmethod
+    def _quote_result(ticker: str, quote: dict) -> dict:
+        """제공자 시세 → 시세 dict 냥~"""
+        current_price = quote.get("current_price")
+        return {
+            "ticker": ticker,
+            "current_price": current_price,
+            "currency": quote.get("currency"),
+            "name": quote.get("name"),
+            "exchange": quote.get("exchange"),
+            "valid": current_price is not None,
+        }
+
+    @staticmethod
+    def _quote_error(ticker: str, error: Exception) -> dict:
+        """조회 실패 시세 dict 냥~"""
+        print(f"🙀 티커 조회 실패 냥: {ticker} - {error}")
+        return {
+            "ticker": ticker,
+            "current_price": None,
+            "currency": None,
+            "name": None,
+            "valid": False,
+            "error": str(error),
+        }
 
     def _get_stock_info_sync(self, ticker: str) -> dict:
         """
         동기 방식으로 주식 정보 조회
-        yfinance는 동기 라이브러리라서 별도 스레드에서 실행
+        시세 제공자는 동기(블로킹) 라이브러리라서 별도 스레드에서 실행
+        조회 예외는 그대로 던짐 (업스트림 가드가 장애인지 판단해서 집계)
         """
-        try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-
-            # 현재가 가져오기 (여러 필드 시도)
-            current_price = (
-                info.get("currentPrice")
-                or info.get("regularMarketPrice")
-                or info.get("previousClose")
-                or info.get("open")
-            )
+        return self._quote_result(ticker, self.provider.quote(ticker))
 
-            return {
+    async def _get_stock_info_async(self, ticker: str) -> dict:
+        """비동기 제공자로 주식 정보 조회 냥~ (스레드 없이)"""
+        return self._quote_result(ticker, await self.provider.quote(ticker))
+
+    def _get_batch_quotes_sync(self, tickers: list[str]) -> dict[str, dict]:
+        """
+        여러 티커 종가를 한 번에 일괄 조회 냥~
+        개별 시세 조회 없이 마지막 종가를 현재가로 사용
+        배치에 없거나 메타데이터를 모르는 티커는 결과에서 빠짐 (호출 측에서 개별 조회로 폴백)
+        조회 예외는 그대로 던짐 (업스트림 가드가 실패로 집계)
+        """
+        return self._batch_results(tickers, self.provider.batch_closes(tickers))
+
+    async def _get_batch_quotes_async(self, tickers: list[str]) -> dict[str, dict]:
+        """비동기 제공자로 일괄 조회 냥~ (영구 캐시 메타데이터 읽기만 스레드 풀에서)"""
+        closes = await self.provider.batch_closes(tickers)
+        if persistent_cache is None:
+            return self._batch_results(tickers, closes)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, self._batch_results, tickers, closes)
+
+    def _batch_results(self, tickers: list[str], closes: dict[str, float]) -> dict[str, dict]:
+        """
+        마지막 종가 → 시세 dict 냥~
+        일괄 다운로드에는 통화/거래소가 없어서 이전에 조회한 메타데이터를 붙임
+        메타데이터를 모르는 티커는 결과에서 빼서 개별 조회(통화/거래소 포함)로 폴백
+        (통화 없이 넘기면 USD 시세가 KRW 자산에 환산 없이 들어가고, 거래소 없이는 장 시간 TTL도 못 씀)
+        """
+        results = {}
+        for ticker in tickers:
+            if ticker not in closes:
+                continue
+
+            known = self._known_metadata(ticker)
+            if not known.get("currency"):
+                continue
+            results[ticker] = {
                 "ticker": ticker,
-                "current_price": current_price,
-                "currency": info.get("currency"),  # None 유지 - 기본값 USD 가정하면 KRW 자산에 환율 곱히는 버그 발생
-                "name": info.get("shortName") or info.get("longName"),
-                "exchange": info.get("exchange"),
-                "valid": current_price is not None,
+                "current_price": closes[ticker],
+                "currency": known["currency"],
+                "name": known.get("name"),
+                "exchange": known.get("exchange"),
+                "valid": True,
             }
-        except Exception as e:
-            print(f"🙀 티커 조회 실패 냥: {ticker} - {e}")
-            return {
+
+        return results
+
+    def _known_metadata(self, ticker: str) -> dict:
+        """
+        이전에 조회한 이름/통화/거래소 냥~
+        메타데이터 캐시 → 시세 캐시 → 영구 캐시 순으로, 빈 필드만 다음 출처에서 채움
+        (거래소가 빠지면 장 시간 TTL 대신 짧은 기본 TTL이 쓰임)
+        """
+        known = {"name": None, "currency": None, "exchange": None}
+        sources = (
+            lambda: ticker_metadata.get(ticker),
+            lambda: quote_cache.peek(ticker),
+            lambda: self._persisted_sync(META, ticker),
+        )
+        for source in sources:
+            found = source() or {}
+            for field, value in known.items():
+                if value is None:
+                    known[field] = found.get(field)
+            if all(known.values()):
+                break
+        return known
+
+    async def _fetch_stock_price(self, ticker: str) -> dict:
+        """
+        시세 제공자 조회 후 유효한 결과만 공유 캐시에 저장 냥~
+        실패하거나 업스트림이 막혀 있으면 마지막 정상 시세로 폴백
+        """
+        try:
+            worker = self._get_stock_info_async if self._is_async else self._get_stock_info_sync
+            result = await self._call_upstream(worker, ticker)
+        except UpstreamError as e:
+            result = {
                 "ticker": ticker,
                 "current_price": None,
                 "currency": None,
@@ -61,64 +365,208 @@ class FinanceService:
                 "valid": False,
                 "error": str(e),
             }
+        except Exception as e:
+            result = self._quote_error(ticker, e)
+        if result.get("valid"):
+            await self._remember_quotes({ticker: result})
+            return result
+
+        # 없는 티커는 메타데이터 캐시에 (업스트림 실패는 제외)
+        ticker_metadata.remember(ticker, result)
+        known = await self._last_known_quote(ticker)
+        if known is not None:
+            print(f"⚠️ 시세 조회 실패, 마지막 정상 시세 사용 냥: {ticker}")
+            return known
+        return result
+
+    async def _fetch_batch_prices(self, tickers: list[str]) -> dict[str, dict]:
+        """
+        일괄 시세 조회 엔진 냥~ 🐱
+        quote_batch_size 단위로 나눠 동시에 일괄 조회, 배치에서 빠진 티커만 개별 조회
+        """
+        size = max(1, settings.quote_batch_size)
+        chunks = [tickers[i:i + size] for i in range(0, len(tickers), size)]
+
+        chunk_results = await asyncio.gather(*[
+            self._fetch_batch_chunk(chunk) for chunk in chunks
+        ])
+
+        results: dict[str, dict] = {}
+        for chunk_result in chunk_results:
+            results.update(chunk_result)
+        await self._remember_quotes(results)
+
+        # 배치에서 빠진 티커만 개별 조회로 폴백
+        missing = [ticker for ticker in tickers if ticker not in results]
+        if missing:
+            fallbacks = await asyncio.gather(*[self._fetch_stock_price(t) for t in missing])
+            for quote in fallbacks:
+                results[quote["ticker"]] = quote
+
+        return results
+
+    async def _fetch_batch_chunk(self, chunk: list[str]) -> dict[str, dict]:
+        """청크 하나 일괄 조회 냥~ (실패하면 빈 결과 → 개별 조회/마지막 정상 시세로 폴백)"""
+        try:
+            worker = self._get_batch_quotes_async if self._is_async else self._get_batch_quotes_sync
+            return await self._call_upstream(worker, chunk)
+        except Exception as e:
+            print(f"🙀 일괄 시세 조회 실패 냥: {len(chunk)}개 - {e}")
+            return {}
+
+    async def _refresh_prices(self, tickers: list[str]) -> None:
+        """백그라운드 시세 갱신 냥~ (실패해도 기존 캐시 유지)"""
+        try:
+            await FinanceService._quote_flights.do_many(tickers, self._fetch_batch_prices)
+        except Exception as e:
+            print(f"🙀 백그라운드 시세 갱신 실패 냥: {tickers} - {e}")
+        finally:
+            FinanceService._refreshing.difference_update(tickers)
+
+    def _schedule_refresh(self, tickers: list[str]) -> None:
+        """stale 시세 갱신 예약 - 이미 갱신 중인 티커는 제외 냥~"""
+        pending = [t for t in tickers if t not in FinanceService._refreshing]
+        if not pending:
+            return
+        FinanceService._refreshing.update(pending)
+        task = asyncio.get_event_loop().create_task(self._refresh_prices(pending))
+        FinanceService._refresh_tasks.add(task)
+        task.add_done_callback(FinanceService._refresh_tasks.discard)
 
     async def get_stock_price(self, ticker: str) -> dict:
         """
         비동기로 주식 가격 조회 냥~
+        공유 캐시 우선, stale이면 바로 반환하고 백그라운드에서 갱신
         """
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            self._executor,
-            self._get_stock_info_sync,
-            ticker
+        cached, state = quote_cache.lookup(ticker)
+        if state == FRESH:
+            return cached
+        if state == STALE:
+            self._schedule_refresh([ticker])
+            return cached
+
+        return await FinanceService._quote_flights.do(
+            ticker, partial(self._fetch_stock_price, ticker)
         )
-        return result
 
     async def get_multiple_prices(self, tickers: list[str]) -> dict[str, dict]:
         """
         여러 종목 동시 조회 냥~ 🐱
-        병렬로 조회해서 빠르게!
+        캐시에 없는 티커만 모아서 일괄 조회 (청크당 한 번의 다운로드)
         """
         if not tickers:
             return {}
 
-        tasks = [self.get_stock_price(ticker) for ticker in tickers]
-        results = await asyncio.gather(*tasks)
+        results: dict[str, dict] = {}
+        stale: list[str] = []
+        missing: list[str] = []
+
+        for ticker in dict.fromkeys(tickers):
+            cached, state = quote_cache.lookup(ticker)
+            if state == MISS:
+                missing.append(ticker)
+                continue
+            results[ticker] = cached
+            if state == STALE:
+                stale.append(ticker)
+
+        if stale:
+            self._schedule_refresh(stale)
+
+        if missing:
+            results.update(
+                await FinanceService._quote_flights.do_many(missing, self._fetch_batch_prices)
+            )
 
-        return {result["ticker"]: result for result in results}
+        return results
 
-    async def validate_ticker(self, ticker: str) -> bool:
+    async def prewarm_quotes(self, tickers: list[str], horizon_seconds: float = 0) -> list[str]:
         """
-        티커 유효성 검증 냥~
+        시세 예열 냥~ 🔥
+        캐시가 없거나 horizon_seconds 안에 만료될 티커만 일괄 조회해서 공유 캐시에 넣음
+        장 마감 종목은 다음 개장까지 신선하므로 자연스럽게 건너뜀
+        갱신한 티커 목록 반환
         """
-        result = await self.get_stock_price(ticker)
-        return result.get("valid", False)
+        due = [
+            ticker
+            for ticker in dict.fromkeys(tickers)
+            if (quote_cache.ttl_remaining(ticker) or 0) <= horizon_seconds
+        ]
+        if due:
+            await FinanceService._quote_flights.do_many(due, self._fetch_batch_prices)
+        return due
 
-    async def validate_ticker_with_info(self, ticker: str) -> dict:
+    async def get_ticker_metadata(self, ticker: str) -> dict:
         """
-        티커 검증 및 상세 정보 반환 냥~
-        프론트엔드에서 검증 결과를 표시하기 위한 상세 정보 포함
+        티커 메타데이터 조회 냥~ (이름/통화/거래소/유효성)
+        메타데이터 캐시 우선, 없으면 시세 조회 한 번으로 채움 (받은 시세는 공유 캐시에 남음)
         """
+        cached = ticker_metadata.get(ticker)
+        if cached is not None:
+            return {"ticker": ticker, **cached, "error": None}
+
         result = await self.get_stock_price(ticker)
+        if result.get("valid") and not (result.get("name") or result.get("exchange")):
+            # 일괄 조회로 받은 시세에는 이름이 없어서 개별 조회로 채움
+            result = await FinanceService._quote_flights.do(
+                ("info", ticker), partial(self._fetch_stock_price, ticker)
+            )
 
+        valid = result.get("valid", False)
         return {
-            "valid": result.get("valid", False),
             "ticker": ticker,
             "name": result.get("name"),
-            "current_price": Decimal(str(result["current_price"])) if result.get("current_price") else None,
             "currency": result.get("currency"),
             "exchange": result.get("exchange"),
-            "error": result.get("error") if not result.get("valid") else None,
+            "valid": valid,
+            "error": result.get("error") if not valid else None,
+        }
+
+    async def validate_ticker(self, ticker: str) -> bool:
+        """
+        티커 유효성 검증 냥~ (메타데이터 캐시 기준)
+        """
+        meta = await self.get_ticker_metadata(ticker)
+        return meta["valid"]
+
+    async def validate_ticker_with_info(self, ticker: str) -> dict:
+        """
+        티커 검증 및 상세 정보 반환 냥~
+        프론트엔드에서 검증 결과를 표시하기 위한 상세 정보 포함
+        메타데이터는 캐시에서, 현재가는 공유 시세 캐시/일괄 조회에서
+        """
+        meta = await self.get_ticker_metadata(ticker)
+
+        current_price = None
+        if meta["valid"]:
+            quote = (await self.get_multiple_prices([ticker])).get(ticker) or {}
+            current_price = quote.get("current_price")
+
+        return {
+            "valid": meta["valid"],
+            "ticker": ticker,
+            "name": meta["name"],
+            "current_price": Decimal(str(current_price)) if current_price else None,
+            "currency": meta["currency"],
+            "exchange": meta["exchange"],
+            "error": meta["error"],
         }
 
-    async def enrich_assets_with_prices(self, assets: list[dict]) -> list[dict]:
+    async def enrich_assets_with_prices(
+        self,
+        assets: list[Holding],
+        fx: Optional[FxMatrix] = None,
+        prices: Optional[dict[str, dict]] = None,
+    ) -> list[ValuedHolding]:
         """
         자산 목록에 실시간 가격 정보 추가 냥~ 🐱
 
-        - 주식: yfinance에서 현재가 조회
+        - 주식: 시세 제공자에서 현재가 조회
         - 현금: current_value 사용
-        - 계산: 평가금액, 손익, 수익률
+        - 계산: 평가금액, 손익, 수익률 (valuation_engine에서 Decimal로 정확히 계산)
         - 환율: USD 자산의 원화 환산 매입가 계산
+        - fx: 요청에서 이미 조회한 환율 매트릭스 (없으면 여기서 조회)
+        - prices: 이미 일괄 조회한 시세 {ticker: 시세} (없으면 여기서 조회)
         """
         # 티커가 있는 자산만 필터링
         tickers = [
@@ -127,127 +575,68 @@ class FinanceService:
             if asset.get("ticker")
         ]
 
-        # 일괄 조회
-        prices = await self.get_multiple_prices(list(set(tickers)))
-
-        # 현재 환율 조회 (USD 자산이 있을 경우)
-        current_exchange_rate = await self.get_exchange_rate()
-
-        enriched = []
-        for asset in assets:
-            asset_copy = dict(asset)
-            ticker = asset.get("ticker")
-            quantity = Decimal(str(asset.get("quantity", 0)))
-            avg_price = Decimal(str(asset.get("average_price", 0)))
-            currency = asset.get("currency", "KRW")
-
-            # 현재 환율 추가
-            asset_copy["current_exchange_rate"] = Decimal(str(current_exchange_rate))
-
-            # 현재가 결정
-            if ticker and ticker in prices:
-                price_info = prices[ticker]
-                current_price = price_info.get("current_price")
-
-                # yfinance가 currency None 반환 시 DB의 자산 통화를 따름
-                price_currency = price_info.get("currency") or currency
-
-                if current_price:
-                    # 가격 통화가 USD인데 자산 통화가 KRW이면 원화 환산
-                    if price_currency == "USD" and currency == "KRW":
-                        current_price = float(current_price) * current_exchange_rate
-
-                    asset_copy["current_price"] = Decimal(str(current_price))
-                else:
-                    asset_copy["current_price"] = None
-            elif asset.get("current_value"):
-                # 티커 없는 자산 (현금, 금현물, 예금 등)
-                # current_value가 총 가치를 나타냄
-                asset_copy["current_price"] = None  # 단가는 없음
-                asset_copy["manual_value"] = True  # 수동 입력 표시
-            else:
-                asset_copy["current_price"] = None
-
-            # USD 자산의 원화 환산 매입가 계산
-            if currency == "USD" and quantity > 0:
-                # 매수 시점 환율이 있으면 사용, 없으면 현재 환율 사용
-                purchase_rate = asset.get("purchase_exchange_rate")
-                if purchase_rate:
-                    purchase_rate = Decimal(str(purchase_rate))
-                else:
-                    purchase_rate = Decimal(str(current_exchange_rate))
-
-                # 원화 환산 매입가 = 평균매수가(USD) × 수량 × 매수시점환율
-                asset_copy["cost_basis_krw"] = avg_price * quantity * purchase_rate
-            else:
-                asset_copy["cost_basis_krw"] = None
-
-            # 평가금액, 손익, 수익률 계산
-            if asset_copy.get("current_price") and quantity > 0:
-                # 티커가 있는 자산: 현재가 × 수량
-                current_price = Decimal(str(asset_copy["current_price"]))
-                market_value = current_price * quantity
-
-                # USD 자산인 경우 원화 환산
-                if currency == "USD":
-                    # USD 원본 금액 저장 (달러 표시용) 냥~
-                    asset_copy["market_value_usd"] = market_value
-                    # 원화 환산
-                    market_value_krw = market_value * Decimal(str(current_exchange_rate))
-                    # 원금도 원화 환산 (매수 시점 환율 사용)
-                    purchase_rate = asset.get("purchase_exchange_rate")
-                    if purchase_rate:
-                        purchase_rate = Decimal(str(purchase_rate))
-                    else:
-                        purchase_rate = Decimal(str(current_exchange_rate))
-                    principal_krw = avg_price * quantity * purchase_rate
-                    profit_loss = market_value_krw - principal_krw
-                    asset_copy["market_value"] = market_value_krw
-                else:
-                    principal = avg_price * quantity
-                    profit_loss = market_value - principal
-                    asset_copy["market_value"] = market_value
-
-                asset_copy["profit_loss"] = profit_loss
-
-                # 수익률은 원금 대비 계산
-                principal_for_rate = principal_krw if currency == "USD" else principal
-                if principal_for_rate > 0:
-                    asset_copy["profit_rate"] = float((profit_loss / principal_for_rate) * 100)
-                else:
-                    asset_copy["profit_rate"] = 0.0
-            elif asset.get("current_value"):
-                # 티커 없는 자산 (금현물, 현금, 예금 등)
-                current_value = Decimal(str(asset["current_value"]))
-                asset_copy["market_value"] = current_value
-
-                # 현금은 수익 개념 없음 냥~ 💰
-                if asset.get("asset_type") == "cash":
-                    asset_copy["profit_loss"] = Decimal("0")
-                    asset_copy["profit_rate"] = 0.0
-                else:
-                    # current_value = 현재 총 가치, average_price × quantity = 원금
-                    principal = avg_price * quantity
-                    asset_copy["profit_loss"] = current_value - principal
-
-                    if principal > 0:
-                        asset_copy["profit_rate"] = float(((current_value - principal) / principal) * 100)
-                    else:
-                        asset_copy["profit_rate"] = 0.0
-            else:
-                asset_copy["market_value"] = Decimal("0")
-                asset_copy["profit_loss"] = Decimal("0")
-                asset_copy["profit_rate"] = 0.0
-
-            enriched.append(asset_copy)
-
-        return enriched
+        # 시세와 환율 동시 조회 (넘겨받은 건 재사용)
+        if prices is None and fx is None:
+            prices, fx = await asyncio.gather(
+                self.get_multiple_prices(list(set(tickers))),
+                self.get_fx_matrix(asset.get("currency") for asset in assets),
+            )
+        elif prices is None:
+            prices = await self.get_multiple_prices(list(set(tickers)))
+        elif fx is None:
+            fx = await self.get_fx_matrix(asset.get("currency") for asset in assets)
+
+        # 평가액/손익/수익률은 평가 엔진에서 계산
+        return value_assets(assets, prices, fx)
 
     async def get_exchange_rate(self, from_currency: str = "USD", to_currency: str = "KRW") -> float:
         """
         환율 조회 냥~ (USDKRW=X 티커 사용)
+        캐시 TTL 이내면 재조회 없이 반환
         실패 시 캐시된 환율 사용, 캐시도 없으면 기본값 사용
         """
+        rate = await self._resolve_exchange_rate(from_currency, to_currency)
+        if rate is not None:
+            return rate
+
+        # 캐시도 없으면 기본값 반환
+        print(f"⚠️ 환율 조회 실패, 기본값 사용 냥: {settings.default_usd_krw_rate}")
+        return settings.default_usd_krw_rate
+
+    async def get_fx_matrix(self, currencies: Iterable[Optional[str]] = ()) -> FxMatrix:
+        """
+        포트폴리오 환율 매트릭스 조회 냥~ 🐱
+        필요한 통화의 KRW 환율을 동시에 한 번씩만 조회 (USD는 항상 포함)
+        요청 안에서는 이 매트릭스를 넘겨서 재사용
+        """
+        others = sorted({c for c in currencies if c and c not in ("USD", BASE_CURRENCY)})
+        # USD는 기본값 폴백이 있는 get_exchange_rate, 나머지는 조회 실패 시 매트릭스에서 제외
+        usd_rate, *resolved = await asyncio.gather(
+            self.get_exchange_rate("USD", BASE_CURRENCY),
+            *[self._resolve_exchange_rate(currency, BASE_CURRENCY) for currency in others],
+        )
+
+        rates: dict[str, float] = {"USD": usd_rate}
+        for currency, rate in zip(others, resolved):
+            if rate is not None:
+                rates[currency] = rate
+
+        return FxMatrix(rates)
+
+    async def _resolve_exchange_rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+        """TTL 캐시 → 조회 → 오래된 캐시 순으로 환율 결정 냥~ (모두 실패하면 None)"""
+        cache_key = f"{from_currency}{to_currency}"
+        cached = FinanceService._exchange_rate_cache.get(cache_key)
+        if cached and datetime.now() - cached["timestamp"] < timedelta(seconds=settings.exchange_rate_ttl_seconds):
+            return cached["rate"]
+
+        return await FinanceService._fx_flights.do(
+            cache_key,
+            partial(self._fetch_exchange_rate, from_currency, to_currency),
+        )
+
+    async def _fetch_exchange_rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+        """환율 실제 조회 냥~"""
         cache_key = f"{from_currency}{to_currency}"
         ticker = f"{cache_key}=X"
 
@@ -255,12 +644,17 @@ class FinanceService:
 
         if result.get("valid") and result.get("current_price"):
             rate = float(result["current_price"])
-            # 성공 시 캐시 업데이트
+            # 성공 시 캐시 업데이트 (영구 캐시에도 기록)
             FinanceService._exchange_rate_cache[cache_key] = {
                 "rate": rate,
                 "timestamp": datetime.now(),
-                "source": "yfinance"
+                "source": self.provider.name
             }
+            if persistent_cache is not None:
+                loop = asyncio.get_event_loop()
+                await loop.run_in_executor(
+                    self._executor, self._persist_sync, FX, {cache_key: {"rate": rate}}
+                )
             return rate
 
         # 실패 시 캐시된 환율 사용
@@ -269,47 +663,95 @@ class FinanceService:
             print(f"⚠️ 환율 조회 실패, 캐시된 환율 사용 냥: {cached['rate']} ({cached['source']})")
             return cached["rate"]
 
-        # 캐시도 없으면 기본값 반환
-        print(f"⚠️ 환율 조회 실패, 기본값 사용 냥: {settings.default_usd_krw_rate}")
-        return settings.default_usd_krw_rate
+        # 메모리에도 없으면 영구 캐시의 마지막 정상 환율
+        if persistent_cache is not None:
+            loop = asyncio.get_event_loop()
+            persisted = await loop.run_in_executor(
+                self._executor, self._persisted_sync, FX, cache_key
+            )
+            if persisted:
+                print(f"⚠️ 환율 조회 실패, 마지막 정상 환율 사용 냥: {persisted['rate']}")
+                return float(persisted["rate"])
+
+        return None
+
+    def _fetch_history_sync(self, ticker: str, start_date: date, end_date: date) -> tuple[np.ndarray, np.ndarray]:
+        """시세 제공자에서 [start_date, end_date] 일별 종가 조회 냥~ (dates, closes, 동기 제공자)"""
+        return self.provider.history(ticker, start_date, end_date)
+
+    async def _fetch_history(self, ticker: str, start_date: date, end_date: date) -> tuple[np.ndarray, np.ndarray]:
+        """시세 제공자에서 [start_date, end_date] 일별 종가 조회 냥~ (dates, closes, 비동기 제공자)"""
+        return await self.provider.history(ticker, start_date, end_date)
+
+    @staticmethod
+    def _offline_history_sync(ticker: str, start_date: date, end_date: date) -> tuple[np.ndarray, np.ndarray]:
+        """업스트림이 막혀 있을 때 쓰는 빈 조회 냥~ (저장소에 있는 구간만 반환되게)"""
+        return np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float64)
+
+    @staticmethod
+    async def _offline_history(ticker: str, start_date: date, end_date: date) -> tuple[np.ndarray, np.ndarray]:
+        return FinanceService._offline_history_sync(ticker, start_date, end_date)
+
+    def _get_closes_sync(
+        self, ticker: str, start_date: date, end_date: date, offline: bool = False
+    ) -> pd.Series:
+        """
+        종가 시리즈 조회 냥~
+        히스토리 저장소가 켜져 있으면 디스크에서 읽고 없는 구간만 시세 제공자에서 받음
+        offline이면 시세 제공자를 호출하지 않고 저장된 구간만 사용
+        """
+        fetch = self._offline_history_sync if offline else self._fetch_history_sync
+        if history_store is not None:
+            dates, closes = history_store.get_closes(ticker, start_date, end_date, fetch)
+        else:
+            dates, closes = fetch(ticker, start_date, end_date)
+        return pd.Series(closes, index=pd.DatetimeIndex(dates), dtype=np.float64)
+
+    async def _get_closes(
+        self, ticker: str, start_date: date, end_date: date, offline: bool = False
+    ) -> pd.Series:
+        """비동기 제공자용 _get_closes_sync 냥~ (제공자 조회는 이벤트 루프에서 바로 await)"""
+        fetch = self._offline_history if offline else self._fetch_history
+        if history_store is not None:
+            dates, closes = await history_store.get_closes_async(
+                ticker, start_date, end_date, fetch, self._executor
+            )
+        else:
+            dates, closes = await fetch(ticker, start_date, end_date)
+        return pd.Series(closes, index=pd.DatetimeIndex(dates), dtype=np.float64)
 
     def _get_benchmark_history_sync(
         self,
         ticker: str,
         start_date: date,
-        end_date: date
+        end_date: date,
+        offline: bool = False,
     ) -> list[dict]:
         """
         동기 방식으로 벤치마크 히스토리 조회 냥~
         """
         try:
-            stock = yf.Ticker(ticker)
-            history = stock.history(
-                start=start_date.isoformat(),
-                end=(end_date + timedelta(days=1)).isoformat()
-            )
-
-            if history.empty:
-                return []
-
-            data = []
-            first_close = None
-
-            for idx, row in history.iterrows():
-                close = float(row["Close"])
-                if first_close is None:
-                    first_close = close
-
-                # 시작점 대비 수익률 계산
-                return_rate = ((close - first_close) / first_close) * 100 if first_close else 0
+            history = self._get_closes_sync(ticker, start_date, end_date, offline)
 
-                data.append({
-                    "date": idx.date(),
-                    "close": Decimal(str(round(close, 2))),
-                    "return_rate": round(return_rate, 2)
-                })
+            # 시작점 대비 수익률까지 컬럼 연산으로 계산
+            return benchmark_points(history)
+        except Exception as e:
+            print(f"🙀 벤치마크 조회 실패 냥: {ticker} - {e}")
+            return []
 
-            return data
+    async def _get_benchmark_history_async(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        offline: bool = False,
+    ) -> list[dict]:
+        """
+        비동기 제공자용 벤치마크 히스토리 조회 냥~
+        """
+        try:
+            history = await self._get_closes(ticker, start_date, end_date, offline)
+            return benchmark_points(history)
         except Exception as e:
             print(f"🙀 벤치마크 조회 실패 냥: {ticker} - {e}")
             return []
@@ -332,13 +774,16 @@ class FinanceService:
             "^DJI": "Dow Jones",
         }
 
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(
-            self._executor,
-            self._get_benchmark_history_sync,
-            ticker,
-            start_date,
-            end_date
+        worker = self._get_benchmark_history_async if self._is_async else self._get_benchmark_history_sync
+        data = await FinanceService._history_flights.do(
+            ("benchmark", ticker, start_date, end_date),
+            partial(
+                self._guarded_history,
+                worker,
+                ticker,
+                start_date,
+                end_date,
+            ),
         )
 
         return {
@@ -350,49 +795,39 @@ class FinanceService:
     def _get_ticker_history_sync(
         self,
         ticker: str,
-        days: int = 30
+        days: int = 30,
+        offline: bool = False,
     ) -> dict:
         """
         동기 방식으로 티커 히스토리 조회 (Sparkline용) 냥~
         """
         try:
-            stock = yf.Ticker(ticker)
             end_date = date.today()
             start_date = end_date - timedelta(days=days)
 
-            history = stock.history(
-                start=start_date.isoformat(),
-                end=(end_date + timedelta(days=1)).isoformat()
-            )
-
-            if history.empty:
-                return {"ticker": ticker, "data": [], "change_rate": 0.0}
-
-            data = []
-            first_close = None
-            last_close = None
-
-            for idx, row in history.iterrows():
-                close = float(row["Close"])
-                if first_close is None:
-                    first_close = close
-                last_close = close
+            history = self._get_closes_sync(ticker, start_date, end_date, offline)
 
-                data.append({
-                    "date": idx.date().isoformat(),
-                    "close": round(close, 2)
-                })
+            # 종가 + 변화율 컬럼 연산으로 계산
+            return sparkline(ticker, history)
+        except Exception as e:
+            print(f"🙀 티커 히스토리 조회 실패 냥: {ticker} - {e}")
+            return {"ticker": ticker, "data": [], "change_rate": 0.0}
 
-            # 변화율 계산
-            change_rate = 0.0
-            if first_close and last_close:
-                change_rate = ((last_close - first_close) / first_close) * 100
+    async def _get_ticker_history_async(
+        self,
+        ticker: str,
+        days: int = 30,
+        offline: bool = False,
+    ) -> dict:
+        """
+        비동기 제공자용 티커 히스토리 조회 (Sparkline용) 냥~
+        """
+        try:
+            end_date = date.today()
+            start_date = end_date - timedelta(days=days)
 
-            return {
-                "ticker": ticker,
-                "data": data,
-                "change_rate": round(change_rate, 2)
-            }
+            history = await self._get_closes(ticker, start_date, end_date, offline)
+            return sparkline(ticker, history)
         except Exception as e:
             print(f"🙀 티커 히스토리 조회 실패 냥: {ticker} - {e}")
             return {"ticker": ticker, "data": [], "change_rate": 0.0}
@@ -406,100 +841,134 @@ class FinanceService:
         티커 히스토리 조회 (Sparkline용) 냥~ 🐱
         최근 N일간의 종가 데이터와 변화율 반환
         """
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            self._executor,
-            self._get_ticker_history_sync,
-            ticker,
-            days
+        worker = self._get_ticker_history_async if self._is_async else self._get_ticker_history_sync
+        result = await FinanceService._history_flights.do(
+            ("ticker", ticker, days),
+            partial(self._guarded_history, worker, ticker, days),
         )
         return result
 
-    def _get_gold_silver_ratio_sync(self) -> dict:
+    async def _guarded_history(self, fn: Callable[..., Any], *args: Any) -> Any:
         """
-        금/은 비율 조회 냥~ (GC=F / SI=F)
+        히스토리 조회를 업스트림 가드 아래에서 실행 냥~
+        업스트림이 막혀 있거나 타임아웃이면 로컬 저장소에 있는 구간만으로 응답
         """
         try:
-            gold = yf.Ticker("GC=F")
-            silver = yf.Ticker("SI=F")
+            return await self._call_upstream(fn, *args)
+        except UpstreamError as e:
+            print(f"⚠️ 히스토리 조회 생략, 저장된 구간만 사용 냥: {args[0]} - {e}")
+            if asyncio.iscoroutinefunction(fn):
+                return await fn(*args, offline=True)
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._executor, partial(fn, *args, offline=True))
 
-            gold_info = gold.info
-            silver_info = silver.info
+    async def get_gold_silver_ratio(self) -> dict:
+        """
+        금/은 현물 가격비 비동기 조회 냥~ 🐱 (GC=F / SI=F)
+        공유 시세 캐시/일괄 조회를 그대로 사용
+        """
+        prices = await self.get_multiple_prices(["GC=F", "SI=F"])
+        gold = prices.get("GC=F") or {}
+        silver = prices.get("SI=F") or {}
+        gold_price = gold.get("current_price") if gold.get("valid") else None
+        silver_price = silver.get("current_price") if silver.get("valid") else None
+
+        if gold_price and silver_price and float(silver_price) > 0:
+            ratio = float(gold_price) / float(silver_price)
+            return {
+                "gold_price": float(gold_price),
+                "silver_price": float(silver_price),
+                "ratio": round(ratio, 2),
+                "valid": True,
+            }
+        return {"valid": False, "ratio": None, "gold_price": None, "silver_price": None}
 
-            gold_price = (
-                gold_info.get("regularMarketPrice")
-                or gold_info.get("currentPrice")
-                or gold_info.get("previousClose")
-            )
-            silver_price = (
-                silver_info.get("regularMarketPrice")
-                or silver_info.get("currentPrice")
-                or silver_info.get("previousClose")
-            )
+    async def get_fundamentals(
+        self,
+        tickers: Iterable[str],
+        ttl_seconds: Optional[float] = None,
+    ) -> dict[str, Optional[dict]]:
+        """
+        여러 티커 펀더멘털(yfinance .info 형식) 동시 조회 냥~ 🐱
+        - 캐시에 있으면 바로, 없는 티커만 한꺼번에 병렬 조회 (같은 티커 동시 조회는 합쳐짐)
+        - ttl_seconds: 캐시 유지 시간 (생략 시 fundamentals_ttl_seconds)
+        - 조회 실패 시 만료된 값, 그것도 없으면 None
+        """
+        tickers = list(dict.fromkeys(tickers))
+        results = await asyncio.gather(*[
+            self._get_fundamentals(ticker, ttl_seconds) for ticker in tickers
+        ])
+        return dict(zip(tickers, results))
+
+    async def _get_fundamentals(self, ticker: str, ttl_seconds: Optional[float]) -> Optional[dict]:
+        cached = FinanceService._fundamentals_cache.get(ticker)
+        if cached is not None:
+            return cached
+        return await FinanceService._fundamentals_flights.do(
+            ticker, partial(self._fetch_fundamentals, ticker, ttl_seconds)
+        )
 
-            if gold_price and silver_price and float(silver_price) > 0:
-                ratio = float(gold_price) / float(silver_price)
-                return {
-                    "gold_price": float(gold_price),
-                    "silver_price": float(silver_price),
-                    "ratio": round(ratio, 2),
-                    "valid": True,
-                }
-            return {"valid": False, "ratio": None, "gold_price": None, "silver_price": None}
+    async def _fetch_fundamentals(self, ticker: str, ttl_seconds: Optional[float]) -> Optional[dict]:
+        """펀더멘털 하나 조회 후 캐시 냥~ (업스트림 가드 아래, 스레드 풀에서 실행)"""
+        try:
+            info = await self._call_upstream(self.provider.fundamentals, ticker)
         except Exception as e:
-            print(f"🙀 금/은 비율 조회 실패 냥: {e}")
-            return {"valid": False, "ratio": None, "gold_price": None, "silver_price": None}
+            print(f"🙀 펀더멘털 조회 실패 냥: {ticker} - {e}")
+            return FinanceService._fundamentals_cache.peek(ticker)
 
-    async def get_gold_silver_ratio(self) -> dict:
-        """금/은 현물 가격비 비동기 조회 냥~ 🐱"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, self._get_gold_silver_ratio_sync)
+        if info:
+            FinanceService._fundamentals_cache.set(ticker, info, ttl_seconds=ttl_seconds)
+        return info or FinanceService._fundamentals_cache.peek(ticker)
 
-    def _get_index_per_sync(self) -> dict:
+    async def get_index_per(self) -> dict:
         """
-        주요 지수 PER 조회 냥~
-        - S&P 500: ^GSPC trailingPE
+        주요 지수 PER 조회 냥~ 🐱
+        - S&P 500: SPY ETF trailingPE
         - NASDAQ: QQQ ETF trailingPE (나스닥 직접 PER 없음)
-        - KOSPI: 069500.KS (KODEX 200 ETF) trailingPE
+        - KOSPI: EWY ETF trailingPE
+        PER은 장중에 의미 있게 바뀌지 않으니 하루 캐시, 세 ETF는 동시에 조회
         """
-        results = {}
-
-        sources = [
-            ("sp500", "SPY", "S&P 500 (SPY)"),
-            ("nasdaq", "QQQ", "NASDAQ (QQQ)"),
-            ("kospi", "EWY", "KOSPI (EWY)"),
-        ]
-
-        for key, ticker, label in sources:
-            try:
-                t = yf.Ticker(ticker)
-                info = t.info
-                pe = info.get("trailingPE") or info.get("forwardPE")
-                results[key] = {
-                    "label": label,
-                    "ticker": ticker,
-                    "per": round(float(pe), 2) if pe else None,
-                    "type": "trailing" if info.get("trailingPE") else ("forward" if info.get("forwardPE") else None),
-                    "valid": pe is not None,
-                }
-            except Exception as e:
-                print(f"🙀 PER 조회 실패 냥: {ticker} - {e}")
-                results[key] = {"label": label, "ticker": ticker, "per": None, "type": None, "valid": False}
+        infos = await self.get_fundamentals(ticker for _, ticker, _ in INDEX_PER_SOURCES)
 
+        results = {}
+        for key, ticker, label in INDEX_PER_SOURCES:
+            info = infos.get(ticker) or {}
+            pe = info.get("trailingPE") or info.get("forwardPE")
+            results[key] = {
+                "label": label,
+                "ticker": ticker,
+                "per": round(float(pe), 2) if pe else None,
+                "type": "trailing" if info.get("trailingPE") else ("forward" if info.get("forwardPE") else None),
+                "valid": pe is not None,
+            }
         return results
 
-    async def get_index_per(self) -> dict:
-        """주요 지수 PER 비동기 조회 냥~ 🐱"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, self._get_index_per_sync)
-
 
-# 싱글톤 인스턴스 (필요시 사용)
+# 앱 전체에서 공유하는 싱글톤 인스턴스 냥~
 _finance_service: FinanceService | None = None
 
 
 def get_finance_service() -> FinanceService:
+    """
+    FinanceService 싱글톤 반환 냥~
+    보통 lifespan에서 만들어지고, 그 전에 호출되면 여기서 생성
+    """
     global _finance_service
     if _finance_service is None:
         _finance_service = FinanceService()
     return _finance_service
+
+
+def init_finance_service() -> FinanceService:
+    """앱 시작 시 FinanceService 생성 냥~ (영구 캐시가 있으면 미리 채움)"""
+    service = get_finance_service()
+    service.warm_start()
+    return service
+
+
+async def close_finance_service() -> None:
+    """앱 종료 시 시세 제공자 연결까지 닫고 FinanceService 정리 냥~"""
+    global _finance_service
+    if _finance_service is not None:
+        await _finance_service.aclose()
+        _finance_service = None
@@ -0,0 +1,49 @@
+"""
+FX Matrix - 요청 단위 환율 매트릭스 냥~ 🐱
+포트폴리오에 필요한 모든 통화의 KRW 환율을 한 번에 모아두고 KRW 경유로 환산
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional
+
+
+BASE_CURRENCY = "KRW"
+
+
+@dataclass(frozen=True)
+class FxMatrix:
+    """
+    통화 → KRW 환율 모음 냥~
+    A → B 환율은 (A → KRW) / (B → KRW)로 삼각 환산
+
+    예: rates = {"USD": 1350.0, "JPY": 9.1}
+        rate("USD", "JPY") = 1350.0 / 9.1
+    """
+
+    rates: dict[str, float] = field(default_factory=dict)
+
+    def to_base(self, currency: Optional[str]) -> Optional[float]:
+        """해당 통화 1단위의 KRW 가치 냥~ (모르면 None)"""
+        if not currency or currency == BASE_CURRENCY:
+            return 1.0
+        return self.rates.get(currency)
+
+    def rate(self, from_currency: Optional[str], to_currency: Optional[str] = BASE_CURRENCY) -> Optional[float]:
+        """from → to 환율 냥~ (둘 중 하나라도 모르면 None)"""
+        if from_currency == to_currency:
+            return 1.0
+        from_rate = self.to_base(from_currency)
+        to_rate = self.to_base(to_currency)
+        if from_rate is None or not to_rate:
+            return None
+        return from_rate / to_rate
+
+    def decimal_rate(self, from_currency: str, to_currency: str = BASE_CURRENCY) -> Optional[Decimal]:
+        """Decimal 환율 냥~ (금액 계산용)"""
+        value = self.rate(from_currency, to_currency)
+        return Decimal(str(value)) if value is not None else None
+
+    @property
+    def usd_krw(self) -> float:
+        """USD/KRW 환율 냥~ (USD 자산 계산에서 가장 많이 쓰임)"""
+        return self.rates["USD"]
@@ -0,0 +1,253 @@
+"""
+History Store - 티커별 종가 히스토리 로컬 저장소 냥~ 🐱
+지난 종가는 바뀌지 않으니 디스크에 쌓아두고, 마지막 저장일 이후(꼬리)만 새로 받아서 붙임
+
+- 티커마다 .npz 파일 하나 (dates: datetime64[D], closes: float64)
+- 요청 범위가 저장 범위보다 앞이면 앞부분만 추가로 받음 (backfill)
+- 조회한 적 없는 최근 구간이 요청되면 마지막 저장일부터 받아서 붙임
+- 최근 구간은 마지막 확인 후 refresh_seconds가 지나면 다시 받아서 덮어씀 (당일 종가 갱신)
+- get_closes(): 동기 조회 함수용 (executor 스레드에서 호출)
+- get_closes_async(): 비동기 조회 함수용 (조회는 이벤트 루프에서 await, 파일/병합만 executor)
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Generator, Optional
+
+import numpy as np
+
+from app.config import settings
+
+
+# (ticker, start, end) → (dates, closes) 조회 함수
+HistoryFetcher = Callable[[str, date, date], tuple[np.ndarray, np.ndarray]]
+AsyncHistoryFetcher = Callable[[str, date, date], Awaitable[tuple[np.ndarray, np.ndarray]]]
+# 조회할 구간 (start, end)를 내보내고 (dates, closes)를 받는 단계별 조회
+_Steps = Generator[tuple[date, date], tuple[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]]
+
+
+@dataclass
+class _Series:
+    dates: np.ndarray       # datetime64[D], 오름차순, 중복 없음
+    closes: np.ndarray      # float64
+    covered_from: date      # 조회한 구간 시작 (상장 전 구간 반복 조회 방지)
+    covered_to: date        # 조회한 구간 끝
+    checked_at: float       # 마지막 꼬리 조회 시각 (time.time())
+
+
+class HistoryStore:
+    """
+    티커별 종가 히스토리 저장소 냥~
+    같은 파일 동시 갱신은 티커별 락으로 막음 (동기 경로는 스레드 락, 비동기 경로는 asyncio 락)
+    한 저장소는 동기/비동기 경로 중 하나로만 쓰기 (시세 제공자마다 하나로 정해짐)
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        refresh_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.root = Path(root)
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._series: dict[str, _Series] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._async_locks: dict[str, asyncio.Lock] = {}
+
+    def get_closes(
+        self,
+        ticker: str,
+        start: date,
+        end: date,
+        fetch: HistoryFetcher,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        [start, end] 구간 종가 조회 냥~
+        없는 구간만 fetch로 받아서 저장하고 (dates, closes) 반환
+        """
+        with self._lock_for(ticker):
+            steps = self._closes(ticker, start, end)
+            done, value = _advance(steps, None)
+            while not done:
+                done, value = _advance(steps, fetch(ticker, *value))
+            return value
+
+    async def get_closes_async(
+        self,
+        ticker: str,
+        start: date,
+        end: date,
+        fetch: AsyncHistoryFetcher,
+        executor: Optional[Executor] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        비동기 조회 함수용 get_closes 냥~
+        fetch는 이벤트 루프에서 바로 await, 파일 읽기/저장과 병합만 executor 스레드에서
+        """
+        loop = asyncio.get_running_loop()
+        async with self._async_locks.setdefault(ticker, asyncio.Lock()):
+            steps = self._closes(ticker, start, end)
+            done, value = await loop.run_in_executor(executor, _advance, steps, None)
+            while not done:
+                fetched = await fetch(ticker, *value)
+                done, value = await loop.run_in_executor(executor, _advance, steps, fetched)
+            return value
+
+    def _closes(self, ticker: str, start: date, end: date) -> _Steps:
+        """없는 구간을 하나씩 내보내고 받은 결과를 저장하는 단계별 조회 냥~ (락은 호출하는 쪽에서)"""
+        series = self._series.get(ticker) or self._load(ticker)
+        changed = False
+
+        if series is None:
+            dates, closes = yield start, end
+            if len(dates) == 0:
+                # 조회 실패일 수도 있으니 빈 결과는 저장하지 않음
+                return _normalize(dates, closes)
+            series = _Series(
+                *_normalize(dates, closes),
+                covered_from=start,
+                covered_to=end,
+                checked_at=self._clock(),
+            )
+            changed = True
+        else:
+            # 앞부분 backfill
+            if start < series.covered_from:
+                dates, closes = yield start, series.covered_from - timedelta(days=1)
+                series = _merge(series, dates, closes)
+                series.covered_from = start
+                changed = True
+
+            # 꼬리 갱신 (마지막 저장일부터 다시 받아서 당일 종가도 덮어씀)
+            if self._needs_tail(series, end):
+                tail_start = _last_date(series) or series.covered_from
+                tail_end = max(end, series.covered_to)
+                dates, closes = yield tail_start, tail_end
+                # 꼬리는 마지막 저장일을 포함하므로 비어 있으면 조회 실패 - 다음 요청에서 다시 시도
+                if len(dates) > 0:
+                    series = _merge(series, dates, closes)
+                    series.covered_to = tail_end
+                    series.checked_at = self._clock()
+                    changed = True
+
+        self._series[ticker] = series
+        if changed:
+            self._save(ticker, series)
+
+        lo = np.searchsorted(series.dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(series.dates, np.datetime64(end, "D"), side="right")
+        return series.dates[lo:hi], series.closes[lo:hi]
+
+    def clear(self) -> None:
+        """메모리 캐시 비우기 냥~ (디스크 파일은 유지)"""
+        self._series.clear()
+
+    def _needs_tail(self, series: _Series, end: date) -> bool:
+        if end > series.covered_to:
+            return True
+        last = _last_date(series)
+        if last is not None and end < last:
+            # 저장된 마지막 날짜 이전 구간만 요청 - 지난 종가는 바뀌지 않음
+            return False
+        return self._clock() - series.checked_at >= self.refresh_seconds
+
+    def _lock_for(self, ticker: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(ticker, threading.Lock())
+
+    def _path(self, ticker: str) -> Path:
+        # ^KS11, USDKRW=X 같은 티커도 파일명으로 쓸 수 있게
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in ticker)
+        return self.root / f"{safe}.npz"
+
+    def _load(self, ticker: str) -> Optional[_Series]:
+        path = self._path(ticker)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                return _Series(
+                    dates=data["dates"].astype("datetime64[D]"),
+                    closes=data["closes"].astype(np.float64),
+                    covered_from=date.fromisoformat(str(data["covered_from"])),
+                    covered_to=date.fromisoformat(str(data["covered_to"])),
+                    checked_at=float(data["checked_at"]),
+                )
+        except Exception as e:
+            print(f"🙀 히스토리 파일 읽기 실패 냥: {path} - {e}")
+            return None
+
+    def _save(self, ticker: str, series: _Series) -> None:
+        """임시 파일에 쓰고 교체 (원자적 저장) 냥~"""
+        path = self._path(ticker)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp, "wb") as f:
+                np.savez(
+                    f,
+                    dates=series.dates,
+                    closes=series.closes,
+                    covered_from=np.array(series.covered_from.isoformat()),
+                    covered_to=np.array(series.covered_to.isoformat()),
+                    checked_at=np.array(series.checked_at),
+                )
+            os.replace(tmp, path)
+        except Exception as e:
+            print(f"🙀 히스토리 파일 저장 실패 냥: {path} - {e}")
+
+
+def _advance(steps: _Steps, value: Any) -> tuple[bool, Any]:
+    """
+    단계별 조회 한 단계 진행 냥~ (끝났으면 (True, 결과), 아니면 (False, 조회할 구간))
+    StopIteration은 executor future로 넘길 수 없어서 값으로 바꿔 반환
+    """
+    try:
+        return False, steps.send(value)
+    except StopIteration as done:
+        return True, done.value
+
+
+def _normalize(dates, closes) -> tuple[np.ndarray, np.ndarray]:
+    """날짜 오름차순 정렬, NaN 제거, 같은 날짜는 마지막 값 사용 냥~"""
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    closes = np.asarray(closes, dtype=np.float64)
+    valid = ~np.isnan(closes)
+    dates, closes = dates[valid], closes[valid]
+
+    # 뒤에 나온 값 우선: 뒤집어서 unique(첫 등장) 후 정렬
+    rev_dates = dates[::-1]
+    uniq, idx = np.unique(rev_dates, return_index=True)
+    return uniq, closes[::-1][idx]
+
+
+def _merge(series: _Series, dates, closes) -> _Series:
+    """기존 시리즈에 새 구간 합치기 냥~ (겹치는 날짜는 새 값 우선)"""
+    merged_dates, merged_closes = _normalize(
+        np.concatenate([series.dates, np.asarray(dates, dtype="datetime64[D]")]),
+        np.concatenate([series.closes, np.asarray(closes, dtype=np.float64)]),
+    )
+    return _Series(
+        merged_dates, merged_closes, series.covered_from, series.covered_to, series.checked_at
+    )
+
+
+def _last_date(series: _Series) -> Optional[date]:
+    if len(series.dates) == 0:
+        return None
+    return series.dates[-1].astype(date)
+
+
+# 프로세스 전역 히스토리 저장소 냥~ (history_store_enabled=False면 None)
+history_store: Optional[HistoryStore] = (
+    HistoryStore(settings.history_store_dir, settings.history_refresh_seconds)
+    if settings.history_store_enabled
+    else None
+)
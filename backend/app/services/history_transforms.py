@@ -0,0 +1,73 @@
+"""
+History Transforms - 종가 시리즈 → API 응답 변환 냥~ 🐱
+행마다 파이썬으로 계산하지 않고 NumPy 컬럼 연산으로 한 번에 계산한 뒤 한 번에 직렬화
+"""
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+
+def _round2(values: np.ndarray) -> list[float]:
+    """
+    소수 둘째 자리 반올림 후 파이썬 float 리스트로 냥~ (JSON 직렬화용)
+    np.round는 x.xx5 경계에서 내장 round와 결과가 달라서 tolist() 후 내장 round 사용
+    """
+    return [round(v, 2) for v in values.tolist()]
+
+
+def cumulative_returns(closes: np.ndarray) -> np.ndarray:
+    """첫 종가 대비 누적 수익률(%) 냥~ (첫 종가가 0이면 전부 0)"""
+    if len(closes) == 0:
+        return closes
+    first = closes[0]
+    if not first:
+        return np.zeros_like(closes)
+    return (closes - first) / first * 100
+
+
+def change_rate(closes: np.ndarray) -> float:
+    """기간 변화율(%) 냥~ (첫/마지막 종가 기준)"""
+    if len(closes) == 0 or not closes[0] or not closes[-1]:
+        return 0.0
+    return round(float((closes[-1] - closes[0]) / closes[0] * 100), 2)
+
+
+def benchmark_points(history: pd.Series) -> list[dict]:
+    """
+    벤치마크 차트 데이터 냥~
+    [{"date": date, "close": Decimal, "return_rate": float}, ...]
+    """
+    if history.empty:
+        return []
+
+    closes = history.to_numpy(dtype=np.float64)
+    dates = history.index.date
+    rounded = _round2(closes)
+    returns = _round2(cumulative_returns(closes))
+
+    return [
+        {"date": d, "close": Decimal(str(c)), "return_rate": r}
+        for d, c, r in zip(dates, rounded, returns)
+    ]
+
+
+def sparkline(ticker: str, history: pd.Series) -> dict:
+    """
+    스파크라인 데이터 냥~
+    {"ticker", "data": [{"date": "YYYY-MM-DD", "close": float}], "change_rate"}
+    """
+    if history.empty:
+        return {"ticker": ticker, "data": [], "change_rate": 0.0}
+
+    closes = history.to_numpy(dtype=np.float64)
+    dates = history.index.strftime("%Y-%m-%d").tolist()
+
+    return {
+        "ticker": ticker,
+        "data": [
+            {"date": d, "close": c}
+            for d, c in zip(dates, _round2(closes))
+        ],
+        "change_rate": change_rate(closes),
+    }
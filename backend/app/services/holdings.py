@@ -0,0 +1,145 @@
+"""
+Holdings - 보유 자산 레코드 냥~ 🐱
+DB 행을 한 번만 파싱해서(UUID/Decimal 변환, 카테고리 평탄화) 슬롯 객체로 들고 다님
+
+- Holding: assets 테이블 행 + 카테고리 이름/색/아이콘
+- ValuedHolding: Holding + 평가 결과 (현재가, 평가액, 손익, 수익률 ...)
+- 둘 다 읽기 전용 Mapping이라 asset["ticker"], asset.get("currency") 같은 기존 코드 그대로 사용
+  값이 없는 필드(행에 없던 컬럼, 해당 없는 평가 필드)는 키에도 없음 → dict와 같은 get/in 동작
+- AssetResponse(from_attributes)로 바로 직렬화
+"""
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any, Iterator, Optional
+from uuid import UUID
+
+
+_MISSING = object()
+
+def as_uuid(value: Any) -> Optional[UUID]:
+    """UUID/문자열 → UUID 냥~ (빈 값은 None)"""
+    if not value:
+        return None
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _as_decimal(value: Any) -> Optional[Decimal]:
+    """숫자/문자열 → Decimal 냥~ (float는 str 거쳐서, None은 그대로)"""
+    if value is None or isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def asset_key(asset: Mapping) -> str:
+    """자산 id 문자열 냥~ (Holding은 로드할 때 한 번만 변환해둔 값)"""
+    key = getattr(asset, "key", None)
+    return key if key is not None else str(asset.get("id"))
+
+
+class Holding(Mapping):
+    """
+    보유 자산 레코드 냥~
+
+    Holding.from_row(row)로 DB 행(카테고리 조인 포함)에서 생성
+    id/portfolio_id/category_id는 UUID, 수량/단가/현재가치/매수 환율은 Decimal
+    """
+
+    FIELDS = (
+        "id", "portfolio_id", "category_id", "name", "ticker", "asset_type",
+        "quantity", "average_price", "currency", "current_value", "purchase_exchange_rate",
+        "notes", "is_active", "created_at", "updated_at",
+        "category_name", "category_color", "category_icon",
+    )
+    _UUID_FIELDS = ("id", "portfolio_id", "category_id")
+    _DECIMAL_FIELDS = ("quantity", "average_price", "current_value", "purchase_exchange_rate")
+
+    __slots__ = FIELDS + ("key",)
+
+    def __init__(self, **fields: Any):
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self.key = str(self.id) if "id" in fields else None
+
+    @classmethod
+    def from_row(cls, row: Mapping) -> "Holding":
+        """DB 행 → Holding 냥~ (모르는 컬럼은 무시, 카테고리 조인은 평탄화)"""
+        fields = {name: row[name] for name in cls.FIELDS if name in row}
+        for name in cls._UUID_FIELDS:
+            if name in fields:
+                fields[name] = as_uuid(fields[name])
+        for name in cls._DECIMAL_FIELDS:
+            if name in fields:
+                fields[name] = _as_decimal(fields[name])
+
+        category = row.get("asset_categories")
+        if category:
+            fields["category_name"] = category.get("name")
+            fields["category_color"] = category.get("color")
+            fields["category_icon"] = category.get("icon")
+        return cls(**fields)
+
+    def __getitem__(self, name: str) -> Any:
+        value = getattr(self, name, _MISSING) if name in self._field_set else _MISSING
+        if value is _MISSING:
+            raise KeyError(name)
+        return value
+
+    # Mapping 기본 get/in은 KeyError를 거쳐서 느림 → 슬롯에서 바로 냥~
+    def get(self, name: str, default: Any = None) -> Any:
+        return getattr(self, name, default) if name in self._field_set else default
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._field_set and hasattr(self, name)
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self.FIELDS:
+            if hasattr(self, name):
+                yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+Holding._field_set = frozenset(Holding.FIELDS)
+
+
+class ValuedHolding(Holding):
+    """
+    평가된 보유 자산 냥~ (Holding 필드 + 평가 필드)
+
+    - market_value_usd: 시세 있는 USD 자산만
+    - manual_value: 시세 없이 current_value로 평가한 자산만
+    """
+
+    VALUATION_FIELDS = (
+        "current_price", "current_exchange_rate", "cost_basis_krw",
+        "market_value", "market_value_usd", "profit_loss", "profit_rate", "manual_value",
+    )
+    FIELDS = Holding.FIELDS + VALUATION_FIELDS
+
+    __slots__ = VALUATION_FIELDS
+
+    @classmethod
+    def of(cls, asset: Mapping, **valuation: Any) -> "ValuedHolding":
+        """자산(Holding 또는 dict) + 평가 결과 냥~ (입력은 그대로 두고 새 레코드)"""
+        valued = cls.__new__(cls)
+        if isinstance(asset, Holding):
+            for name in Holding.FIELDS:
+                value = getattr(asset, name, _MISSING)
+                if value is not _MISSING:
+                    setattr(valued, name, value)
+            valued.key = asset.key
+        else:
+            for name, value in asset.items():
+                if name in Holding._field_set:
+                    setattr(valued, name, value)
+            valued.key = str(asset["id"]) if "id" in asset else None
+        for name, value in valuation.items():
+            setattr(valued, name, value)
+        return valued
+
+
+ValuedHolding._field_set = frozenset(ValuedHolding.FIELDS)
@@ -0,0 +1,505 @@
+"""
+Market Data - 시세 제공자 인터페이스 냥~ 🐱
+FinanceService는 이 인터페이스만 사용하고, 실제 제공자는 설정(market_data_provider)으로 선택
+
+- YFinanceProvider: yfinance (동기 - 스레드 풀에서 실행)
+- YahooChartProvider: httpx AsyncClient로 야후 chart JSON 직접 조회 (비동기 - 이벤트 루프에서 바로 실행)
+- LocalMarketDataProvider: 네트워크 없이 시드 기반 가상 시세 (부하 테스트/벤치마크용)
+
+동기 제공자는 FinanceService가 스레드 풀 + 업스트림 가드 아래에서 호출하고
+비동기 제공자는 스레드 없이 업스트림 가드 아래에서 바로 await
+환율은 "USDKRW=X" 형식 티커의 시세로 조회
+"""
+import asyncio
+import random
+import threading
+import time
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Optional, Protocol
+
+import httpx
+import numpy as np
+import yfinance as yf
+from yfinance.exceptions import YFRateLimitError
+
+from app.config import settings
+
+
+# 티커 접미사로 통화 추정 냥~ (모르면 None → 자산의 DB 통화를 따름)
+_SUFFIX_CURRENCIES = {
+    ".KS": "KRW",
+    ".KQ": "KRW",
+    ".T": "JPY",
+    ".HK": "HKD",
+    ".L": "GBP",
+}
+
+
+def infer_currency(ticker: str) -> str | None:
+    """티커 형식으로 통화 추정 냥~"""
+    if ticker.endswith("=X") and len(ticker) == 8:
+        # USDKRW=X → KRW
+        return ticker[3:6]
+    for suffix, currency in _SUFFIX_CURRENCIES.items():
+        if ticker.endswith(suffix):
+            return currency
+    return None
+
+
+class MarketDataError(Exception):
+    """시세 제공자 조회 실패 냥~"""
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """
+    업스트림 장애로 집계할 예외인지 냥~
+    전송 오류/타임아웃/429·5xx/레이트 리밋만 장애
+    없는 티커나 잘못된 심볼 같은 요청 오류는 아님 (사용자 오타로 전체 서킷이 열리지 않게)
+    """
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    # OSError: requests/curl_cffi 전송 오류, ConnectionError, TimeoutError
+    return isinstance(exc, (MarketDataError, YFRateLimitError, httpx.TransportError, OSError))
+
+
+class MarketDataProvider(Protocol):
+    """
+    시세 제공자 인터페이스 냥~
+
+    - quote(ticker): {"current_price", "currency", "name", "exchange"} (현재가 없으면 current_price None)
+    - batch_closes(tickers): {티커: 마지막 종가} (데이터 없는 티커는 제외)
+    - history(ticker, start, end): [start, end] 일별 종가 (dates: datetime64[D], closes: float64)
+    - fundamentals(ticker): yfinance .info 형식 dict (shortName, currency, exchange, trailingPE 등)
+
+    조회 실패는 예외로 알림 (업스트림 가드가 실패로 집계)
+    """
+
+    name: str
+
+    def quote(self, ticker: str) -> dict: ...
+
+    def batch_closes(self, tickers: list[str]) -> dict[str, float]: ...
+
+    def history(self, ticker: str, start: date, end: date) -> tuple[np.ndarray, np.ndarray]: ...
+
+    def fundamentals(self, ticker: str) -> dict: ...
+
+
+class AsyncMarketDataProvider(Protocol):
+    """
+    비동기 시세 제공자 인터페이스 냥~
+    quote/batch_closes/history는 MarketDataProvider와 같은 형식이지만 코루틴
+    fundamentals는 동기 (yfinance에 위임, 스레드 풀에서 실행)
+    """
+
+    name: str
+
+    async def quote(self, ticker: str) -> dict: ...
+
+    async def batch_closes(self, tickers: list[str]) -> dict[str, float]: ...
+
+    async def history(self, ticker: str, start: date, end: date) -> tuple[np.ndarray, np.ndarray]: ...
+
+    def fundamentals(self, ticker: str) -> dict: ...
+
+    async def aclose(self) -> None: ...
+
+
+def _empty_history() -> tuple[np.ndarray, np.ndarray]:
+    return np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float64)
+
+
+class YFinanceProvider:
+    """yfinance 시세 제공자 냥~ 🐱"""
+
+    name = "yfinance"
+
+    def quote(self, ticker: str) -> dict:
+        info = yf.Ticker(ticker).info
+
+        # 현재가 가져오기 (여러 필드 시도)
+        current_price = (
+            info.get("currentPrice")
+            or info.get("regularMarketPrice")
+            or info.get("previousClose")
+            or info.get("open")
+        )
+        return {
+            "current_price": current_price,
+            "currency": info.get("currency"),  # None 유지 - 기본값 USD 가정하면 KRW 자산에 환율 곱히는 버그 발생
+            "name": info.get("shortName") or info.get("longName"),
+            "exchange": info.get("exchange"),
+        }
+
+    def batch_closes(self, tickers: list[str]) -> dict[str, float]:
+        """
+        한 번의 yf.download로 여러 티커 마지막 종가 조회 냥~
+        .info 스크랩 없이 최근 5일 일봉에서 마지막 종가 사용
+        """
+        data = yf.download(
+            tickers,
+            period="5d",
+            interval="1d",
+            group_by="column",
+            auto_adjust=False,
+            progress=False,
+            threads=True,
+            multi_level_index=True,
+        )
+
+        if data is None or data.empty or "Close" not in data.columns.get_level_values(0):
+            return {}
+
+        closes = data["Close"]
+        results = {}
+        for ticker in tickers:
+            if ticker not in closes.columns:
+                continue
+            series = closes[ticker].dropna()
+            if series.empty:
+                continue
+            results[ticker] = float(series.iloc[-1])
+        return results
+
+    def history(self, ticker: str, start: date, end: date) -> tuple[np.ndarray, np.ndarray]:
+        """
+        일봉 종가 냥~
+        수정주가(auto_adjust)는 분할/배당 때마다 과거 값이 바뀌어서 HistoryStore에 저장된 구간과
+        뒤에 이어 받은 구간의 기준이 달라짐 → 배치 시세처럼 실제 종가 사용
+        """
+        history = yf.Ticker(ticker).history(
+            start=start.isoformat(),
+            end=(end + timedelta(days=1)).isoformat(),
+            auto_adjust=False,
+        )
+        if history.empty:
+            return _empty_history()
+
+        dates = history.index.tz_localize(None).values.astype("datetime64[D]")
+        return dates, history["Close"].to_numpy(dtype=np.float64)
+
+    def fundamentals(self, ticker: str) -> dict:
+        return yf.Ticker(ticker).info
+
+
+class YahooChartProvider:
+    """
+    야후 chart API 비동기 제공자 냥~ 🐱
+    keep-alive 커넥션 풀(httpx.AsyncClient) 하나로 여러 티커를 동시에 조회
+    스레드 핸드오프나 yfinance 세션 준비 없이 워커 하나에서 수백 건 동시 조회 가능
+
+    - 시세/일괄 시세/히스토리: /v8/finance/chart/{ticker}
+    - PER 같은 펀더멘털: chart에 없어서 yfinance(.info)에 위임
+    - 없는 티커(404, chart.error)는 결과 없음으로, 429/5xx는 예외로 (업스트림 가드가 집계)
+    """
+
+    name = "yahoo"
+
+    BASE_URL = "https://query1.finance.yahoo.com"
+    # 기본 User-Agent는 야후가 막아서 브라우저 UA 사용
+    HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+        ),
+        "Accept": "application/json",
+    }
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive: int = 20,
+        concurrency: int = 32,
+        timeout_seconds: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.concurrency = max(1, concurrency)
+        self.timeout_seconds = timeout_seconds
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._fundamentals = YFinanceProvider()
+
+    async def quote(self, ticker: str) -> dict:
+        result = await self._chart(ticker, {"range": "1d", "interval": "1d"})
+        if result is None:
+            return {"current_price": None, "currency": None, "name": None, "exchange": None}
+
+        meta = result.get("meta", {})
+        return {
+            "current_price": meta.get("regularMarketPrice") or meta.get("chartPreviousClose"),
+            "currency": meta.get("currency"),
+            "name": meta.get("shortName") or meta.get("longName"),
+            "exchange": meta.get("exchangeName"),
+        }
+
+    async def batch_closes(self, tickers: list[str]) -> dict[str, float]:
+        """티커별 chart 조회를 동시에 냥~ (전부 예외면 첫 예외를 던짐)"""
+        results = await asyncio.gather(
+            *[self._chart(ticker, {"range": "5d", "interval": "1d"}) for ticker in tickers],
+            return_exceptions=True,
+        )
+
+        closes: dict[str, float] = {}
+        errors = []
+        for ticker, result in zip(tickers, results):
+            if isinstance(result, BaseException):
+                errors.append(result)
+                continue
+            if result is None:
+                continue
+            _, values = self._parse_closes(result)
+            values = values[~np.isnan(values)]
+            if len(values):
+                closes[ticker] = float(values[-1])
+
+        if errors and len(errors) == len(tickers):
+            raise errors[0]
+        return closes
+
+    async def history(self, ticker: str, start: date, end: date) -> tuple[np.ndarray, np.ndarray]:
+        period1 = int(datetime.combine(start, datetime.min.time(), timezone.utc).timestamp())
+        period2 = int(datetime.combine(end + timedelta(days=1), datetime.min.time(), timezone.utc).timestamp())
+        result = await self._chart(ticker, {"period1": period1, "period2": period2, "interval": "1d"})
+        if result is None:
+            return _empty_history()
+
+        dates, closes = self._parse_closes(result)
+        lo = np.searchsorted(dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end, "D"), side="right")
+        return dates[lo:hi], closes[lo:hi]
+
+    def fundamentals(self, ticker: str) -> dict:
+        return self._fundamentals.fundamentals(ticker)
+
+    async def aclose(self) -> None:
+        """커넥션 풀 닫기 냥~"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def _chart(self, ticker: str, params: dict) -> Optional[dict]:
+        """chart 결과 하나 조회 냥~ (없는 티커면 None)"""
+        client, semaphore = self._session()
+        async with semaphore:
+            response = await client.get(f"/v8/finance/chart/{ticker}", params=params)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+
+        chart = response.json().get("chart") or {}
+        if chart.get("error"):
+            return None
+        results = chart.get("result") or []
+        return results[0] if results else None
+
+    def _session(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """이벤트 루프별 클라이언트/세마포어 냥~ (보통 앱 전체에서 하나)"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                headers=self.HEADERS,
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive,
+                ),
+                transport=self._transport,
+            )
+            self._client_loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._client, self._semaphore
+
+    @staticmethod
+    def _parse_closes(result: dict) -> tuple[np.ndarray, np.ndarray]:
+        """chart 결과 → (거래소 현지 날짜, 종가) 냥~ (빈 값은 NaN)"""
+        timestamps = result.get("timestamp") or []
+        quotes = (result.get("indicators", {}).get("quote") or [{}])[0]
+        raw_closes = quotes.get("close") or []
+        if not timestamps or len(raw_closes) != len(timestamps):
+            return _empty_history()
+
+        offset = result.get("meta", {}).get("gmtoffset") or 0
+        local_seconds = np.asarray(timestamps, dtype=np.int64) + offset
+        dates = (local_seconds // 86400).astype("datetime64[D]")
+        closes = np.array([np.nan if c is None else c for c in raw_closes], dtype=np.float64)
+        return dates, closes
+
+
+# 가상 시세 기준값 냥~ (1단위당 원화)
+_LOCAL_KRW_PER_UNIT = {
+    "KRW": 1.0, "USD": 1350.0, "EUR": 1450.0, "GBP": 1700.0,
+    "JPY": 9.0, "CNY": 185.0, "HKD": 173.0,
+}
+_LOCAL_BASE_PRICES = {
+    "^KS11": 2500.0, "^KQ11": 850.0, "^GSPC": 5000.0, "^IXIC": 16000.0,
+    "^DJI": 38000.0, "^VIX": 15.0, "GC=F": 2000.0, "SI=F": 25.0,
+}
+_LOCAL_CURRENCIES = {"^KS11": "KRW", "^KQ11": "KRW"}
+_LOCAL_EXCHANGES = {".KS": "KSC", ".KQ": "KOE", ".T": "JPX", ".HK": "HKG", ".L": "LSE"}
+# 가상 시리즈 시작일 (이 날부터 랜덤 워크 - 오늘이 바뀌어도 지난 종가는 그대로)
+_LOCAL_EPOCH = np.datetime64("2000-01-03", "D")
+
+
+class LocalMarketDataProvider:
+    """
+    네트워크 없이 동작하는 가상 시세 제공자 냥~ 🎲
+    부하 테스트/벤치마크를 재현 가능하게 돌리기 위한 용도
+
+    - 티커마다 (seed, 티커)로 시드한 영업일 랜덤 워크 → 같은 시드면 항상 같은 시세
+    - 모든 티커를 유효한 티커로 취급
+    - latency_ms: 호출마다 블로킹 지연 (네트워크 대기 흉내)
+    - failure_rate: 호출이 MarketDataError로 실패할 확률 (seed 기반이라 호출 순서가 같으면 재현됨)
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        seed: int = 42,
+        latency_ms: float = 0.0,
+        failure_rate: float = 0.0,
+        today: Callable[[], date] = date.today,
+    ):
+        self.seed = seed
+        self.latency_ms = latency_ms
+        self.failure_rate = failure_rate
+        self._today = today
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._walks: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+    def quote(self, ticker: str) -> dict:
+        self._simulate_call(f"quote {ticker}")
+        _, closes = self._walk(ticker)
+        return {
+            "current_price": float(closes[-1]),
+            "currency": self._currency(ticker),
+            "name": f"{ticker} (local)",
+            "exchange": self._exchange(ticker),
+        }
+
+    def batch_closes(self, tickers: list[str]) -> dict[str, float]:
+        self._simulate_call(f"batch {len(tickers)}")
+        return {ticker: float(self._walk(ticker)[1][-1]) for ticker in tickers}
+
+    def history(self, ticker: str, start: date, end: date) -> tuple[np.ndarray, np.ndarray]:
+        self._simulate_call(f"history {ticker}")
+        dates, closes = self._walk(ticker)
+        lo = np.searchsorted(dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end, "D"), side="right")
+        return dates[lo:hi], closes[lo:hi]
+
+    def fundamentals(self, ticker: str) -> dict:
+        self._simulate_call(f"fundamentals {ticker}")
+        _, closes = self._walk(ticker)
+        pe = round(10 + self._ticker_hash(ticker) % 2000 / 100, 2)
+        return {
+            "shortName": f"{ticker} (local)",
+            "currency": self._currency(ticker),
+            "exchange": self._exchange(ticker),
+            "regularMarketPrice": float(closes[-1]),
+            "trailingPE": pe,
+            "forwardPE": round(pe * 0.9, 2),
+        }
+
+    def _simulate_call(self, operation: str) -> None:
+        """지연 + 확률적 실패 냥~"""
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000)
+        if self.failure_rate > 0:
+            with self._lock:
+                roll = self._rng.random()
+            if roll < self.failure_rate:
+                raise MarketDataError(f"가상 시세 조회 실패다옹: {operation}")
+
+    def _walk(self, ticker: str) -> tuple[np.ndarray, np.ndarray]:
+        """시작일부터 오늘까지 영업일 종가 시리즈 냥~ (티커별로 한 번만 생성)"""
+        today = np.datetime64(self._today(), "D")
+        with self._lock:
+            cached = self._walks.get(ticker)
+        if cached is not None and cached[0][-1] >= today - 3:
+            return cached
+
+        dates = np.arange(_LOCAL_EPOCH, today + 1, dtype="datetime64[D]")
+        dates = dates[np.is_busday(dates)]
+
+        # 같은 시드면 앞부분 난수가 같아서 날짜가 늘어나도 지난 종가는 그대로
+        rng = np.random.default_rng([self.seed, self._ticker_hash(ticker)])
+        volatility = 0.004 if ticker.endswith("=X") else 0.015
+        log_returns = rng.normal(0.0, volatility, len(dates))
+        log_returns[0] = 0.0
+        closes = self._base_price(ticker) * np.exp(np.cumsum(log_returns))
+        closes = np.round(closes, self._decimals(ticker))
+
+        with self._lock:
+            self._walks[ticker] = (dates, closes)
+        return dates, closes
+
+    def _base_price(self, ticker: str) -> float:
+        if ticker in _LOCAL_BASE_PRICES:
+            return _LOCAL_BASE_PRICES[ticker]
+        if ticker.endswith("=X") and len(ticker) == 8:
+            base = _LOCAL_KRW_PER_UNIT.get(ticker[:3], 1000.0)
+            quote = _LOCAL_KRW_PER_UNIT.get(ticker[3:6], 1.0)
+            return base / quote
+        spread = self._ticker_hash(ticker)
+        if self._currency(ticker) == "KRW":
+            return 10000.0 + spread % 190 * 1000
+        return 20.0 + spread % 480
+
+    def _decimals(self, ticker: str) -> int:
+        """호가 단위 흉내 냥~ (환율 4자리, 국내 주식 원 단위, 나머지 2자리)"""
+        if ticker.endswith("=X"):
+            return 4
+        if self._currency(ticker) == "KRW" and self._exchange(ticker) is not None:
+            return 0
+        return 2
+
+    @staticmethod
+    def _currency(ticker: str) -> str:
+        return _LOCAL_CURRENCIES.get(ticker) or infer_currency(ticker) or "USD"
+
+    @staticmethod
+    def _exchange(ticker: str) -> Optional[str]:
+        if ticker.startswith("^") or "=" in ticker:
+            return None
+        for suffix, exchange in _LOCAL_EXCHANGES.items():
+            if ticker.endswith(suffix):
+                return exchange
+        return "NMS"
+
+    @staticmethod
+    def _ticker_hash(ticker: str) -> int:
+        # hash()는 프로세스마다 달라서 crc32 사용
+        return zlib.crc32(ticker.encode())
+
+
+def create_market_data_provider(
+    name: Optional[str] = None,
+) -> MarketDataProvider | AsyncMarketDataProvider:
+    """설정에 맞는 시세 제공자 생성 냥~ (yfinance | yahoo | local)"""
+    name = (name or settings.market_data_provider).lower()
+    if name == "yfinance":
+        return YFinanceProvider()
+    if name == "yahoo":
+        return YahooChartProvider(
+            max_connections=settings.yahoo_max_connections,
+            max_keepalive=settings.yahoo_max_keepalive,
+            concurrency=settings.yahoo_concurrency,
+            timeout_seconds=settings.upstream_timeout_seconds,
+        )
+    if name == "local":
+        return LocalMarketDataProvider(
+            seed=settings.market_data_seed,
+            latency_ms=settings.market_data_latency_ms,
+            failure_rate=settings.market_data_failure_rate,
+        )
+    raise ValueError(f"알 수 없는 시세 제공자다옹: {name}")
@@ -0,0 +1,132 @@
+"""
+Market Hours - 거래소 장 시간 기반 시세 캐시 TTL 냥~ 🐱
+장중에는 짧은 TTL, 장 마감 후에는 다음 개장까지 캐시 (마감 후 시세는 안 바뀌니까)
+
+- 거래소는 yfinance의 exchange 코드(KSC, NMS 등) → 티커 접미사(.KS 등) 순으로 판단
+- 환율(=X), 선물(=F), 코인은 24시간 거래라 항상 장중으로 취급
+- 주말만 휴장으로 처리 (공휴일 캘린더는 없음 - 공휴일엔 짧은 TTL로 조회만 조금 더 함)
+"""
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Optional
+
+import pytz
+
+from app.config import settings
+
+
+@dataclass(frozen=True)
+class MarketSession:
+    """거래소 정규장 시간 냥~ (settle_minutes: 마감 후 종가 확정까지 장중으로 취급)"""
+
+    name: str
+    timezone: str
+    open: time
+    close: time
+    settle_minutes: int = 10
+
+    def _tz(self):
+        return pytz.timezone(self.timezone)
+
+    def is_open(self, at: datetime) -> bool:
+        """해당 시각에 장중(마감 정산 구간 포함)인지 냥~"""
+        local = at.astimezone(self._tz())
+        if local.weekday() >= 5:
+            return False
+        opens = self._at(local, self.open)
+        closes = self._at(local, self.close) + timedelta(minutes=self.settle_minutes)
+        return opens <= local < closes
+
+    def next_open(self, at: datetime) -> datetime:
+        """해당 시각 이후 첫 개장 시각 냥~ (주말 건너뜀)"""
+        local = at.astimezone(self._tz())
+        for offset in range(8):
+            day = local + timedelta(days=offset)
+            if day.weekday() >= 5:
+                continue
+            opens = self._at(day, self.open)
+            if opens > local:
+                return opens
+        raise ValueError(f"다음 개장 시각을 찾을 수 없다옹: {self.name}")
+
+    def _at(self, local: datetime, t: time) -> datetime:
+        return self._tz().localize(datetime.combine(local.date(), t))
+
+
+KRX = MarketSession("KRX", "Asia/Seoul", time(9, 0), time(15, 30))
+US = MarketSession("US", "America/New_York", time(9, 30), time(16, 0))
+TSE = MarketSession("TSE", "Asia/Tokyo", time(9, 0), time(15, 30))
+HKEX = MarketSession("HKEX", "Asia/Hong_Kong", time(9, 30), time(16, 0))
+LSE = MarketSession("LSE", "Europe/London", time(8, 0), time(16, 30))
+
+# yfinance exchange 코드 → 장 냥~
+_EXCHANGE_SESSIONS = {
+    "KSC": KRX, "KOE": KRX,
+    "NMS": US, "NGM": US, "NCM": US, "NYQ": US, "PCX": US, "ASE": US, "BTS": US,
+    "SNP": US, "NIM": US, "DJI": US,
+    "JPX": TSE,
+    "HKG": HKEX,
+    "LSE": LSE,
+}
+
+# 티커 접미사 → 장 냥~
+_SUFFIX_SESSIONS = {
+    ".KS": KRX, ".KQ": KRX,
+    ".T": TSE,
+    ".HK": HKEX,
+    ".L": LSE,
+}
+
+# 자주 쓰는 지수 티커 (일괄 조회 결과에는 exchange가 없어서) 냥~
+_TICKER_SESSIONS = {
+    "^KS11": KRX, "^KQ11": KRX, "^KS200": KRX,
+    "^GSPC": US, "^IXIC": US, "^DJI": US, "^NDX": US,
+}
+
+# 24시간 거래 (환율, 선물, 코인)
+_ALWAYS_OPEN_SUFFIXES = ("=X", "=F", "-USD", "-KRW", "-USDT")
+_ALWAYS_OPEN_EXCHANGES = {"CCY", "CCC", "CMX", "NYM", "CBT", "CME"}
+
+
+def session_for(ticker: str, exchange: Optional[str] = None) -> Optional[MarketSession]:
+    """티커의 거래소 장 냥~ (24시간 거래거나 모르면 None)"""
+    if exchange and exchange in _EXCHANGE_SESSIONS:
+        return _EXCHANGE_SESSIONS[exchange]
+    if ticker in _TICKER_SESSIONS:
+        return _TICKER_SESSIONS[ticker]
+    for suffix, session in _SUFFIX_SESSIONS.items():
+        if ticker.endswith(suffix):
+            return session
+    return None
+
+
+def is_always_open(ticker: str, exchange: Optional[str] = None) -> bool:
+    """24시간 거래 종목인지 냥~"""
+    return ticker.endswith(_ALWAYS_OPEN_SUFFIXES) or exchange in _ALWAYS_OPEN_EXCHANGES
+
+
+def quote_ttl(
+    ticker: str,
+    exchange: Optional[str] = None,
+    fetched_at: Optional[datetime] = None,
+    now: Optional[datetime] = None,
+) -> float:
+    """
+    시세 캐시 TTL(초) 냥~ 🐱
+
+    - 장중 / 24시간 거래 / 거래소 모름: quote_cache_ttl_seconds
+    - 장 마감 후 조회한 시세: 다음 개장까지
+    fetched_at은 시세를 받은 시각 (영구 캐시에서 불러올 때처럼 과거일 수 있음)
+    """
+    ttl = float(settings.quote_cache_ttl_seconds)
+    now = now or datetime.now(pytz.utc)
+    fetched_at = fetched_at or now
+
+    if not settings.quote_cache_market_hours or is_always_open(ticker, exchange):
+        return ttl - (now - fetched_at).total_seconds()
+
+    session = session_for(ticker, exchange)
+    if session is None or session.is_open(fetched_at):
+        return ttl - (now - fetched_at).total_seconds()
+
+    return (session.next_open(fetched_at) - now).total_seconds()
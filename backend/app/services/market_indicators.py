@@ -0,0 +1,135 @@
+"""
+Market Indicators - 시장 지표 스냅샷 냥~ 🐱
+지수/환율/금은 비율/PER 묶음을 스케줄러가 주기적으로 계산해두고
+/dashboard/market-indicators는 스냅샷만 읽음 (대시보드를 몇 개 열어도 업스트림 호출 없음)
+"""
+import asyncio
+from datetime import datetime
+from functools import partial
+from typing import Optional
+
+from app.config import settings
+from app.services.finance_service import FinanceService, MARKET_INDICATORS
+from app.services.single_flight import SingleFlight
+
+
+async def build_market_indicators(finance_service: FinanceService) -> dict:
+    """
+    시장 지표 묶음 계산 냥~
+
+    - KOSPI, S&P 500, NASDAQ
+    - VIX (공포지수)
+    - USD/KRW 환율
+    - 금/은 현물 가격비
+    - 주요 지수 PER (S&P 500, NASDAQ, KOSPI)
+    """
+    # 지수 가격, 금/은 비율, PER 병렬 조회
+    (
+        *indicator_results,
+        exchange_rate,
+        gold_silver,
+        per_data,
+    ) = await asyncio.gather(
+        *[finance_service.get_ticker_history(m["ticker"], 2) for m in MARKET_INDICATORS],
+        finance_service.get_exchange_rate(),
+        finance_service.get_gold_silver_ratio(),
+        finance_service.get_index_per(),
+        return_exceptions=True,
+    )
+
+    results = []
+
+    for meta, data in zip(MARKET_INDICATORS, indicator_results):
+        if isinstance(data, Exception):
+            continue
+        if data and data.get("data"):
+            latest = data["data"][-1]
+            results.append({
+                "ticker": meta["ticker"],
+                "name": meta["name"],
+                "price": latest["close"],
+                "change_rate": data.get("change_rate", 0),
+                "currency": meta["currency"],
+            })
+
+    # 환율 추가
+    if not isinstance(exchange_rate, Exception):
+        results.append({
+            "ticker": "USDKRW=X",
+            "name": "USD/KRW",
+            "price": exchange_rate,
+            "change_rate": 0,
+            "currency": "KRW",
+        })
+
+    # 금/은 비율
+    gold_silver_result = None
+    if not isinstance(gold_silver, Exception) and gold_silver.get("valid"):
+        gold_silver_result = {
+            "gold_price": gold_silver["gold_price"],
+            "silver_price": gold_silver["silver_price"],
+            "ratio": gold_silver["ratio"],
+        }
+
+    # PER 데이터
+    per_result = None
+    if not isinstance(per_data, Exception):
+        per_result = per_data
+
+    return {
+        "indicators": results,
+        "gold_silver_ratio": gold_silver_result,
+        "index_per": per_result,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+class MarketIndicatorsSnapshot:
+    """
+    시장 지표 스냅샷 냥~
+
+    - refresh(): 새로 계산해서 교체 (지표를 하나도 못 받았으면 이전 스냅샷 유지)
+    - get(): 스냅샷 + 나이(age_seconds) + stale 여부
+      서버 시작 직후처럼 스냅샷이 없을 때만 한 번 계산 (동시 요청은 합쳐짐)
+    """
+
+    def __init__(self, stale_after_seconds: float):
+        self.stale_after_seconds = stale_after_seconds
+        self._data: Optional[dict] = None
+        self._updated_at: Optional[datetime] = None
+        self._flights = SingleFlight()
+
+    async def refresh(self, finance_service: FinanceService) -> Optional[dict]:
+        """지표 다시 계산 냥~ (동시에 불려도 계산은 한 번)"""
+        return await self._flights.do("refresh", partial(self._refresh, finance_service))
+
+    async def _refresh(self, finance_service: FinanceService) -> Optional[dict]:
+        data = await build_market_indicators(finance_service)
+        if data["indicators"] or self._data is None:
+            self._data = data
+            self._updated_at = datetime.now()
+        else:
+            print("⚠️ 시장 지표를 하나도 못 받아서 이전 스냅샷 유지 냥")
+        return self._data
+
+    async def get(self, finance_service: FinanceService) -> dict:
+        """스냅샷 읽기 냥~ (없을 때만 계산)"""
+        if self._data is None:
+            await self.refresh(finance_service)
+
+        age = (datetime.now() - self._updated_at).total_seconds()
+        return {
+            **self._data,
+            "age_seconds": round(age, 1),
+            "stale": age > self.stale_after_seconds,
+        }
+
+    def clear(self) -> None:
+        self._data = None
+        self._updated_at = None
+
+
+# 프로세스 전역 시장 지표 스냅샷 냥~ (갱신 주기 두 번을 놓치면 stale)
+market_indicators = MarketIndicatorsSnapshot(
+    stale_after_seconds=settings.market_indicators_refresh_seconds * 2,
+)
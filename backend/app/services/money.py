@@ -0,0 +1,324 @@
+"""
+Money - 고정소수점 금액/수량 타입 냥~ 🐱
+금액/수량을 "값 × 10^SCALE" 파이썬 정수로 들고 다니면서 합산/환산/비율 계산
+Decimal(str(x)) 왕복 없이 정수 연산만 하고, API 응답으로 내보낼 때만 Decimal로 변환
+
+- Money: 금액 (통화 태그 포함, 백만분의 1 단위) - 다른 통화끼리 더하면 CurrencyMismatch
+- Quantity: 수량 (1억분의 1 단위, 코인 사토시까지)
+- 반올림 정책: ROUNDING(은행가 반올림) 하나로 통일
+  입력값이 SCALE보다 자릿수가 많을 때, 곱셈/나눗셈 결과를 SCALE에 맞출 때만 반올림
+- scaled_column()/round_div_column(): 자산 목록처럼 행이 많을 때 쓰는 열 단위 버전
+  (파이썬 객체를 행마다 만들면 C로 된 Decimal보다 느려서, 변환은 numpy로 한 번에 하고 정수 열로 계산)
+- 쓰는 곳: 대시보드 요약 합계(calculate_summary, PortfolioState)만
+  자산별 평가(valuation_engine)와 리밸런싱 제안은 행 단위라 Decimal 그대로
+"""
+from decimal import Context, Decimal, MAX_EMAX, MAX_PREC, MIN_EMIN, ROUND_HALF_EVEN, localcontext
+from functools import lru_cache
+from typing import Any, Sequence, Union
+
+import numpy as np
+from app.services.fx_matrix import BASE_CURRENCY
+
+
+# 반올림 정책 냥~ (0.5는 짝수 쪽으로: 합계에서 한쪽으로 쏠리지 않음)
+ROUNDING = ROUND_HALF_EVEN
+
+MONEY_SCALE = 6
+QUANTITY_SCALE = 8
+
+# 통화별 표시/정산 최소 단위 (소수 자릿수) - 없는 통화는 2자리
+MINOR_UNITS = {"KRW": 0, "JPY": 0, "USD": 2, "EUR": 2, "GBP": 2, "CNY": 2, "HKD": 2}
+
+# Decimal 변환용 무제한 정밀도 컨텍스트 (반올림 없음)
+_EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+# 환율 열 자릿수 (소수 10자리까지, 넘치면 ROUNDING)
+RATE_SCALE = 10
+
+Number = Union[int, float, Decimal, str]
+
+# float 빠른 경로 범위/오차 냥~
+# scaled < 2^52면 float 간격이 10^-scale보다 촘촘해서 되돌림 판정이 정확하고,
+# str(x)와 x의 차이 + 곱셈 오차는 |scaled| × 2^-52 이내 (여유 4배)
+_FAST_LIMIT = 2.0 ** 52
+_FAST_ERROR = 2.0 ** -50
+
+
+def _round_div(numerator: int, denominator: int) -> int:
+    """정수 나눗셈을 ROUNDING 정책으로 반올림 냥~ (denominator > 0)"""
+    quotient, remainder = divmod(numerator, denominator)
+    twice = remainder * 2
+    if twice > denominator or (twice == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+@lru_cache(maxsize=1024)
+def _float_ratio(value: float) -> tuple[int, int]:
+    """float → Decimal(str(x))의 (분자, 분모) 냥~ (환율처럼 같은 값이 반복되니까 캐시)"""
+    return Decimal(repr(value)).as_integer_ratio()
+
+
+def _ratio(value: Number) -> tuple[int, int]:
+    """숫자 → (분자, 분모>0) 냥~ (float는 Decimal(str(x))와 같은 값)"""
+    if isinstance(value, int):
+        return value, 1
+    if isinstance(value, float):
+        return _float_ratio(value)
+    if not isinstance(value, Decimal):
+        value = Decimal(value)
+    return value.as_integer_ratio()
+
+
+def _scaled(value: Any, scale: int) -> int:
+    """숫자 → 값 × 10^scale 정수 냥~ (자릿수가 넘치면 ROUNDING 정책으로 반올림)"""
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value * 10 ** scale
+    unit = 10 ** scale
+    if isinstance(value, float):
+        # float 정밀도 안쪽이면 Decimal을 거치지 않고 바로 냥~
+        # - 되돌려서 같은 float면 자릿수가 SCALE 안쪽이라 그대로
+        # - 아니어도 .5 경계에서 float 오차보다 멀면 round() 결과가 Decimal 반올림과 같음
+        scaled = value * unit
+        magnitude = abs(scaled)
+        if magnitude < _FAST_LIMIT:
+            units = round(scaled)
+            if units / unit == value or abs(abs(scaled - units) - 0.5) > magnitude * _FAST_ERROR + 2 ** -40:
+                return units
+    numerator, denominator = _ratio(value)
+    return _round_div(numerator * unit, denominator)
+
+
+def scaled_column(values: Sequence[Any], scale: int) -> np.ndarray:
+    """
+    숫자 목록 → 값 × 10^scale 정수 열(object 배열, 파이썬 int) 냥~
+    float/int는 numpy로 한 번에 (_scaled와 같은 판정), 판정 밖이나 Decimal/str/None만 하나씩
+    """
+    unit = 10 ** scale
+    if set(map(type, values)) <= {float, int}:
+        floats = np.array(values, dtype=np.float64)
+    else:
+        floats = np.fromiter(
+            (value if type(value) in (float, int) else np.nan for value in values),
+            dtype=np.float64,
+            count=len(values),
+        )
+    scaled = floats * unit
+    units = np.rint(scaled)
+    magnitude = np.abs(scaled)
+    with np.errstate(invalid="ignore"):
+        fast = (magnitude < _FAST_LIMIT) & (
+            (units / unit == floats)
+            | (np.abs(np.abs(scaled - units) - 0.5) > magnitude * _FAST_ERROR + 2.0 ** -40)
+        )
+    column = np.where(fast, units, 0).astype(np.int64).astype(object)
+    rest = np.flatnonzero(~fast).tolist()
+    # Decimal(DB에서 읽은 수량/단가, 평가 엔진 결과)은 object 열 곱셈으로 한 번에
+    decimal_rows = [i for i in rest if type(values[i]) is Decimal]
+    if decimal_rows:
+        column[decimal_rows] = _decimal_column([values[i] for i in decimal_rows], scale)
+    for i in rest:
+        if type(values[i]) is not Decimal:
+            column[i] = _scaled(values[i], scale)
+    return column
+
+
+_to_int = np.frompyfunc(int, 1, 1)
+
+
+def _decimal_column(values: list[Decimal], scale: int) -> np.ndarray:
+    """Decimal 목록 → 정수 열 냥~ (자릿수가 scale 안쪽이면 곱해서 바로, 넘치면 ROUNDING)"""
+    with localcontext(_EXACT):
+        scaled = np.array(values, dtype=object) * Decimal(10 ** scale)
+    column = _to_int(scaled)
+    for i in np.flatnonzero(~(column == scaled).astype(bool)).tolist():
+        column[i] = _scaled(values[i], scale)
+    return column
+
+
+def round_div_column(numerator: np.ndarray, denominator: Any) -> np.ndarray:
+    """정수 열 나눗셈을 ROUNDING 정책으로 반올림 냥~ (denominator는 양수 또는 양수 열)"""
+    quotient = numerator // denominator
+    twice = (numerator - quotient * denominator) * 2
+    up = (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+    return quotient + up.astype(np.int64)
+
+
+def _to_decimal(units: int, scale: int) -> Decimal:
+    """정수 × 10^-scale → Decimal 냥~ (끝자리 0 정리, 정수면 정수로)"""
+    whole, fraction = divmod(units, 10 ** scale)
+    if not fraction:
+        return Decimal(whole)
+    return Decimal(units).scaleb(-scale, _EXACT).normalize(_EXACT)
+
+
+class CurrencyMismatch(ValueError):
+    """다른 통화 금액끼리 계산하려고 함 냥 🙀"""
+
+
+class _Value:
+    """불변 값 타입 냥~ (생성 후 필드 변경 금지, 연산은 항상 새 인스턴스)"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__}는 불변 값이다옹 🙀")
+
+    __delattr__ = __setattr__
+
+
+class Quantity(_Value):
+    """
+    수량 냥~ (값 × 10^QUANTITY_SCALE 정수)
+
+    Quantity.of(0.5) + Quantity.of("0.00000001")
+    """
+
+    __slots__ = ("units",)
+
+    SCALE = QUANTITY_SCALE
+
+    def __init__(self, units: int = 0):
+        object.__setattr__(self, "units", units)
+
+    @classmethod
+    def of(cls, value: Any) -> "Quantity":
+        """숫자(int/float/Decimal/str/None)로 생성 냥~"""
+        return cls(_scaled(value, cls.SCALE))
+
+    def to_decimal(self) -> Decimal:
+        return _to_decimal(self.units, self.SCALE)
+
+    def __add__(self, other: "Quantity") -> "Quantity":
+        return Quantity(self.units + other.units)
+
+    def __sub__(self, other: "Quantity") -> "Quantity":
+        return Quantity(self.units - other.units)
+
+    def __neg__(self) -> "Quantity":
+        return Quantity(-self.units)
+
+    def __bool__(self) -> bool:
+        return self.units != 0
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Quantity) and self.units == other.units
+
+    def __lt__(self, other: "Quantity") -> bool:
+        return self.units < other.units
+
+    def __gt__(self, other: "Quantity") -> bool:
+        return self.units > other.units
+
+    def __hash__(self) -> int:
+        return hash(("Quantity", self.units))
+
+    def __repr__(self) -> str:
+        return f"Quantity('{self.to_decimal()}')"
+
+
+class Money(_Value):
+    """
+    금액 냥~ (값 × 10^MONEY_SCALE 정수 + 통화)
+
+    - 같은 통화끼리만 +, -, 비교 (0과의 덧셈은 허용 → sum() 가능)
+    - × Quantity / 숫자: 결과를 MONEY_SCALE로 반올림
+    - convert(rate, currency): 환율 곱해서 다른 통화로
+    - ratio(other): 같은 통화 금액 비율 (float, 비중/수익률용)
+    - quantity_at(price): 이 금액으로 살 수 있는 수량
+    """
+
+    __slots__ = ("units", "currency")
+
+    SCALE = MONEY_SCALE
+
+    def __init__(self, units: int = 0, currency: str = BASE_CURRENCY):
+        object.__setattr__(self, "units", units)
+        object.__setattr__(self, "currency", currency)
+
+    @classmethod
+    def of(cls, value: Any, currency: str = BASE_CURRENCY) -> "Money":
+        """숫자(int/float/Decimal/str/None)로 생성 냥~"""
+        return cls(_scaled(value, cls.SCALE), currency)
+
+    @classmethod
+    def zero(cls, currency: str = BASE_CURRENCY) -> "Money":
+        return cls(0, currency)
+
+    def to_decimal(self) -> Decimal:
+        """API 응답용 Decimal 냥~"""
+        return _to_decimal(self.units, self.SCALE)
+
+    def round_minor(self) -> "Money":
+        """통화 최소 단위로 반올림 냥~ (KRW는 원, USD는 센트)"""
+        step = 10 ** (self.SCALE - MINOR_UNITS.get(self.currency, 2))
+        return Money(_round_div(self.units, step) * step, self.currency)
+
+    def _same(self, other: "Money") -> int:
+        if self.currency != other.currency:
+            raise CurrencyMismatch(f"{self.currency} 금액과 {other.currency} 금액은 같이 계산할 수 없다옹")
+        return other.units
+
+    def __add__(self, other: Union["Money", int]) -> "Money":
+        if isinstance(other, int) and other == 0:
+            return self
+        return Money(self.units + self._same(other), self.currency)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: "Money") -> "Money":
+        return Money(self.units - self._same(other), self.currency)
+
+    def __neg__(self) -> "Money":
+        return Money(-self.units, self.currency)
+
+    def __abs__(self) -> "Money":
+        return Money(abs(self.units), self.currency)
+
+    def __mul__(self, other: Union[Quantity, Number]) -> "Money":
+        if isinstance(other, Quantity):
+            return Money(_round_div(self.units * other.units, 10 ** Quantity.SCALE), self.currency)
+        numerator, denominator = _ratio(other)
+        return Money(_round_div(self.units * numerator, denominator), self.currency)
+
+    __rmul__ = __mul__
+
+    def convert(self, rate: Number, currency: str = BASE_CURRENCY) -> "Money":
+        """환율(1 self.currency = rate currency) 곱해서 currency 금액으로 냥~"""
+        return Money((self * rate).units, currency)
+
+    def ratio(self, other: "Money") -> float:
+        """self / other 냥~ (other가 0이면 0.0)"""
+        units = self._same(other)
+        return self.units / units if units else 0.0
+
+    def quantity_at(self, price: "Money") -> Quantity:
+        """이 금액 ÷ 단가 = 수량 냥~ (단가는 양수)"""
+        units = self._same(price)
+        return Quantity(_round_div(self.units * 10 ** Quantity.SCALE, units))
+
+    def __bool__(self) -> bool:
+        return self.units != 0
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Money) and self.currency == other.currency and self.units == other.units
+
+    def __lt__(self, other: "Money") -> bool:
+        return self.units < self._same(other)
+
+    def __le__(self, other: "Money") -> bool:
+        return self.units <= self._same(other)
+
+    def __gt__(self, other: "Money") -> bool:
+        return self.units > self._same(other)
+
+    def __ge__(self, other: "Money") -> bool:
+        return self.units >= self._same(other)
+
+    def __hash__(self) -> int:
+        return hash((self.currency, self.units))
+
+    def __repr__(self) -> str:
+        return f"Money('{self.to_decimal()}', '{self.currency}')"
@@ -0,0 +1,115 @@
+"""
+Persistent Cache - 재시작해도 남는 시세/환율/메타데이터 캐시 냥~ 🐱
+SQLite 파일 하나에 마지막으로 성공한 값을 저장해두고
+- 앱 시작 시 메모리 캐시를 미리 채우고 (warm start)
+- yfinance 조회가 실패하면 기본값 대신 마지막 정상값으로 폴백
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from app.config import settings
+
+
+# 네임스페이스 냥~
+QUOTES = "quote"    # 티커 → 시세 dict
+FX = "fx"           # USDKRW 등 → {"rate": float}
+META = "meta"       # 티커 → {"name", "currency", "exchange"}
+
+
+class PersistentCache:
+    """
+    SQLite 기반 key-value 캐시 냥~
+    executor 스레드에서도 호출되므로 연결 하나를 락으로 보호해서 사용
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            self._conn.commit()
+
+    def get(self, namespace: str, key: str) -> Optional[tuple[Any, float]]:
+        """(값, 저장 시각) 반환 냥~ 없으면 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, updated_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def put_many(self, namespace: str, items: dict[str, Any]) -> None:
+        """여러 값 한 번에 저장 냥~ (같은 키는 덮어씀)"""
+        if not items:
+            return
+        now = time.time()
+        rows = [
+            (namespace, key, json.dumps(value, default=str), now)
+            for key, value in items.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def load(self, namespace: str, limit: Optional[int] = None) -> dict[str, tuple[Any, float]]:
+        """네임스페이스 전체 조회 냥~ (최근 저장 순으로 최대 limit개)"""
+        query = (
+            "SELECT key, value, updated_at FROM cache_entries "
+            "WHERE namespace = ? ORDER BY updated_at DESC"
+        )
+        params: tuple = (namespace,)
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (namespace, limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return {key: (json.loads(value), updated_at) for key, value, updated_at in rows}
+
+    def close(self) -> None:
+        """연결 종료 냥~"""
+        with self._lock:
+            self._conn.close()
+
+
+def _open_persistent_cache() -> Optional[PersistentCache]:
+    """설정에 경로가 있으면 열기 냥~ (실패하면 캐시 없이 동작)"""
+    if not settings.persistent_cache_path:
+        return None
+    try:
+        return PersistentCache(settings.persistent_cache_path)
+    except Exception as e:
+        print(f"🙀 영구 캐시 열기 실패 냥: {settings.persistent_cache_path} - {e}")
+        return None
+
+
+# 프로세스 전역 영구 캐시 냥~ (persistent_cache_path 미설정 시 None)
+persistent_cache: Optional[PersistentCache] = _open_persistent_cache()
+
+
+def close_persistent_cache() -> None:
+    """앱 종료 시 영구 캐시 연결 닫기 냥~"""
+    if persistent_cache is not None:
+        persistent_cache.close()
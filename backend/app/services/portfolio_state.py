@@ -0,0 +1,327 @@
+"""
+Portfolio State - 포트폴리오별 평가 상태 냥~ 🐱
+자산별 평가액/원금, 카테고리 합, 전체 합계를 메모리에 들고 있다가 바뀐 것만 반영
+
+- 시세 틱: 그 티커를 가진 자산만 다시 평가해서 이전 값 빼고 새 값 더하기
+- 자산 생성/수정/소프트 삭제 (AssetService): 그 자산 하나만 반영
+- 환율이 바뀌면 들고 있는 자산 전체를 메모리에서 다시 평가 (DB 조회 없음)
+- /dashboard/summary는 합계만 읽음 (calculate_summary 전체 재계산 없음)
+
+다른 워커나 DB 직접 수정은 알 수 없으니 ttl_seconds가 지나면 DB에서 다시 만듦
+"""
+import asyncio
+import time
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from app.config import settings
+from app.models.schemas import CategoryAllocation, DashboardSummary
+from app.services.fx_matrix import FxMatrix
+from app.services.holdings import Holding, as_uuid
+from app.services.money import Money
+from app.services.single_flight import SingleFlight
+from app.services.valuation_engine import summary_columns, value_assets
+
+
+def build_summary(
+    total_value: Money,
+    total_principal: Money,
+    categories: dict[str, dict],
+    asset_count: int,
+) -> DashboardSummary:
+    """
+    합계와 카테고리 합으로 대시보드 요약 만들기 냥~
+    categories: {카테고리 이름: {"category_id", "color", "units"(Money 단위 평가액)}}
+    """
+    total_profit = total_value - total_principal
+    profit_rate = total_profit.ratio(total_principal) * 100 if total_principal.units > 0 else 0.0
+
+    # 카테고리별 비율 계산
+    allocations = []
+    for cat_name, data in categories.items():
+        market_value = Money(data["units"])
+        percentage = market_value.ratio(total_value) * 100 if total_value.units > 0 else 0.0
+        allocations.append(
+            CategoryAllocation(
+                category_id=as_uuid(data["category_id"]),
+                category_name=cat_name,
+                color=data["color"],
+                market_value=market_value.to_decimal(),
+                percentage=round(percentage, 2),
+            )
+        )
+
+    # 비율 내림차순 정렬
+    allocations.sort(key=lambda x: x.percentage, reverse=True)
+
+    return DashboardSummary(
+        total_value=total_value.to_decimal(),
+        total_principal=total_principal.to_decimal(),
+        total_profit=total_profit.to_decimal(),
+        profit_rate=round(profit_rate, 2),
+        asset_count=asset_count,
+        allocations=allocations,
+        last_updated=datetime.now(),
+    )
+
+
+def _price_key(quote: Optional[dict]) -> tuple:
+    """평가에 쓰는 시세 필드만 냥~ (같으면 다시 평가할 필요 없음)"""
+    if not quote:
+        return (None, None)
+    return (quote.get("current_price"), quote.get("currency"))
+
+
+class PortfolioState:
+    """
+    포트폴리오 하나의 평가 상태 냥~
+
+    - 자산별 (평가액, 원금, 카테고리)와 합계는 Money 단위 정수
+    - quotes: 평가에 쓴 시세 {ticker: 시세}, fx: 평가에 쓴 환율 매트릭스
+    """
+
+    def __init__(self, portfolio_id: Optional[UUID], fx: FxMatrix, built_at: float):
+        self.portfolio_id = portfolio_id
+        self.fx = fx
+        self.built_at = built_at
+        self.quotes: dict[str, dict] = {}
+        self.total_value = 0
+        self.total_principal = 0
+        self._holdings: dict[str, Holding] = {}
+        self._entries: dict[str, tuple[int, int, str]] = {}
+        self._by_ticker: dict[str, set[str]] = {}
+        self._categories: dict[str, dict] = {}
+        # 카테고리 조인 없이 돌아오는 행(insert/update 결과)에 이름/색 채우기용
+        self._category_names: dict[str, tuple[Any, Any]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        portfolio_id: Optional[UUID],
+        holdings: list[Holding],
+        quotes: dict[str, dict],
+        fx: FxMatrix,
+        built_at: float,
+    ) -> "PortfolioState":
+        """자산 전체를 한 번에 평가해서 상태 만들기 냥~"""
+        state = cls(portfolio_id, fx, built_at)
+        state.quotes = dict(quotes)
+        state._revalue(holdings)
+        return state
+
+    @property
+    def tickers(self) -> list[str]:
+        return list(self._by_ticker)
+
+    @property
+    def currencies(self) -> set[Optional[str]]:
+        return {holding.get("currency") for holding in self._holdings.values()}
+
+    def __len__(self) -> int:
+        return len(self._holdings)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._holdings
+
+    def _revalue(self, holdings: list[Holding]) -> None:
+        """자산들을 다시 평가해서 이전 값 빼고 새 값 더하기 냥~"""
+        if not holdings:
+            return
+        valued = value_assets(holdings, self.quotes, self.fx)
+        # 대시보드와 같은 원금 환율 폴백 (매수 환율 없는 USD 자산)
+        current_rate = self.fx.decimal_rate("USD") or settings.default_usd_krw_rate
+        market, principal = summary_columns(valued, current_rate)
+        for holding, market_units, principal_units in zip(holdings, market.tolist(), principal.tolist()):
+            self._discard(holding.key)
+            self._add(holding, market_units, principal_units)
+
+    def _add(self, holding: Holding, market: int, principal: int) -> None:
+        key = holding.key
+        cat_name = holding.get("category_name", "기타")
+        self._holdings[key] = holding
+        self._entries[key] = (market, principal, cat_name)
+        if holding.get("ticker"):
+            self._by_ticker.setdefault(holding["ticker"], set()).add(key)
+        if holding.get("category_id") and "category_name" in holding:
+            self._category_names[str(holding["category_id"])] = (
+                holding["category_name"], holding.get("category_color"),
+            )
+
+        category = self._categories.get(cat_name)
+        if category is None:
+            category = self._categories[cat_name] = {
+                "category_id": holding.get("category_id"),
+                "color": holding.get("category_color", "#6b7280"),
+                "units": 0,
+                "count": 0,
+            }
+        category["units"] += market
+        category["count"] += 1
+        self.total_value += market
+        self.total_principal += principal
+
+    def _discard(self, key: str) -> Optional[Holding]:
+        holding = self._holdings.pop(key, None)
+        if holding is None:
+            return None
+        market, principal, cat_name = self._entries.pop(key)
+        ticker = holding.get("ticker")
+        if ticker:
+            lots = self._by_ticker[ticker]
+            lots.discard(key)
+            if not lots:
+                del self._by_ticker[ticker]
+
+        category = self._categories[cat_name]
+        category["units"] -= market
+        category["count"] -= 1
+        if not category["count"]:
+            del self._categories[cat_name]
+        self.total_value -= market
+        self.total_principal -= principal
+        return holding
+
+    def apply_quotes(self, quotes: dict[str, dict]) -> int:
+        """
+        시세 틱 반영 냥~
+        가격/통화가 바뀐 티커의 자산만 다시 평가, 다시 평가한 자산 수 반환
+        """
+        changed = []
+        for ticker, quote in quotes.items():
+            lots = self._by_ticker.get(ticker)
+            if lots and _price_key(quote) != _price_key(self.quotes.get(ticker)):
+                self.quotes[ticker] = quote
+                changed.extend(self._holdings[key] for key in lots)
+        self._revalue(changed)
+        return len(changed)
+
+    def apply_fx(self, fx: FxMatrix) -> bool:
+        """환율이 바뀌었으면 전체 다시 평가 냥~ (바뀌었으면 True)"""
+        if fx.rates == self.fx.rates:
+            return False
+        self.fx = fx
+        self._revalue(list(self._holdings.values()))
+        return True
+
+    def upsert(self, holding: Holding) -> bool:
+        """
+        자산 생성/수정 반영 냥~
+        카테고리 조인이 없는 행은 알고 있는 카테고리 이름으로 채움 (모르는 카테고리면 False → 다시 만들어야 함)
+        비활성 자산은 빠짐
+        """
+        if not holding.get("is_active", True):
+            self.remove(holding.key)
+            return True
+
+        if holding.get("category_id") and "category_name" not in holding:
+            known = self._category_names.get(str(holding["category_id"]))
+            if known is None:
+                return False
+            name, color = known
+            holding = Holding(**{**holding, "category_name": name, "category_color": color})
+        self._revalue([holding])
+        return True
+
+    def remove(self, key: str) -> bool:
+        """자산 삭제 반영 냥~ (있었으면 True)"""
+        return self._discard(key) is not None
+
+    def summary(self) -> DashboardSummary:
+        """합계로 대시보드 요약 냥~"""
+        return build_summary(
+            Money(self.total_value),
+            Money(self.total_principal),
+            self._categories,
+            asset_count=len(self._holdings),
+        )
+
+
+class PortfolioStates:
+    """
+    프로세스 전역 포트폴리오 평가 상태 모음 냥~
+
+    - get(): 상태가 없거나 ttl_seconds가 지났으면 DB/시세에서 새로 만들고 (동시 요청은 합쳐짐)
+      있으면 시세/환율만 다시 확인해서 바뀐 만큼 반영
+    - apply_quotes(): FinanceService가 새 시세를 받을 때마다 호출
+    - upsert()/remove(): AssetService가 자산을 바꿀 때마다 호출
+    기본 포트폴리오(None)로 조회한 상태는 실제 id로도 찾을 수 있게 같이 저장
+    """
+
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._states: dict[Optional[str], PortfolioState] = {}
+        self._flights = SingleFlight()
+
+    def _unique(self) -> list[PortfolioState]:
+        return list({id(state): state for state in self._states.values()}.values())
+
+    async def get(self, portfolio_id: Optional[UUID], asset_service, finance_service) -> PortfolioState:
+        """포트폴리오 평가 상태 냥~"""
+        key = str(portfolio_id) if portfolio_id else None
+        state = self._states.get(key)
+        if state is None or self._clock() - state.built_at > self.ttl_seconds:
+            return await self._flights.do(key, partial(self._build, key, portfolio_id, asset_service, finance_service))
+
+        # 새로 받은 시세는 틱으로 이미 반영됨, stale 시세 갱신 예약과 환율 확인만
+        quotes, fx = await asyncio.gather(
+            finance_service.get_multiple_prices(state.tickers),
+            finance_service.get_fx_matrix(state.currencies),
+        )
+        state.apply_fx(fx)
+        state.apply_quotes(quotes)
+        return state
+
+    async def _build(self, key: Optional[str], portfolio_id: Optional[UUID], asset_service, finance_service) -> PortfolioState:
+        holdings = await asset_service.get_assets(portfolio_id)
+        tickers = list({holding["ticker"] for holding in holdings if holding.get("ticker")})
+        quotes, fx = await asyncio.gather(
+            finance_service.get_multiple_prices(tickers),
+            finance_service.get_fx_matrix(holding.get("currency") for holding in holdings),
+        )
+
+        actual_id = portfolio_id or (holdings[0].get("portfolio_id") if holdings else None)
+        state = PortfolioState.build(actual_id, holdings, quotes, fx, self._clock())
+        self._states[key] = state
+        if actual_id:
+            self._states[str(actual_id)] = state
+        return state
+
+    def apply_quotes(self, quotes: dict[str, dict]) -> int:
+        """새 시세를 모든 상태에 반영 냥~ (다시 평가한 자산 수)"""
+        return sum(state.apply_quotes(quotes) for state in self._unique())
+
+    def upsert(self, holding: Holding) -> None:
+        """자산 생성/수정 반영 냥~ (반영 못 하면 그 포트폴리오 상태를 버림)"""
+        key = str(holding.get("portfolio_id"))
+        state = self._states.get(key)
+        if state is None:
+            # 자산이 없던 기본 포트폴리오 상태는 id를 몰라서 찾을 수 없음 → 버리고 다음 조회 때 새로
+            default = self._states.get(None)
+            if default is not None and default.portfolio_id is None:
+                del self._states[None]
+            return
+        if not state.upsert(holding):
+            self.invalidate(holding.get("portfolio_id"))
+
+    def remove(self, asset_id: UUID) -> None:
+        """자산 삭제 반영 냥~"""
+        key = str(asset_id)
+        for state in self._unique():
+            if state.remove(key):
+                return
+
+    def invalidate(self, portfolio_id: Optional[UUID] = None) -> None:
+        """포트폴리오 상태 버리기 냥~ (다음 조회 때 새로 만듦)"""
+        state = self._states.pop(str(portfolio_id) if portfolio_id else None, None)
+        if state is not None:
+            self._states = {key: other for key, other in self._states.items() if other is not state}
+
+    def clear(self) -> None:
+        self._states.clear()
+
+
+# 프로세스 전역 포트폴리오 평가 상태 냥~
+portfolio_states = PortfolioStates(ttl_seconds=settings.portfolio_state_ttl_seconds)
@@ -0,0 +1,69 @@
+"""
+Portfolio Valuation - 요청 단위 포트폴리오 평가 컨텍스트 냥~ 🐱
+자산 조회 + 시세/환율 조회 + 평가액 계산을 한 번만 하고 플랜/배분/그룹/알림 계산에서 같이 사용
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from app.services.asset_index import AssetIndex
+from app.services.fx_matrix import FxMatrix
+from app.services.holdings import Holding, ValuedHolding, asset_key
+
+
+@dataclass
+class PortfolioValuation:
+    """
+    포트폴리오 평가 결과 냥~
+
+    - assets: DB에서 조회한 자산 목록 (Holding)
+    - enriched: enrich_assets_with_prices 결과 (ValuedHolding: 현재가, 평가액, 손익 포함)
+    - index: 배분 항목 매칭용 AssetIndex
+    - asset_values: {자산 id 문자열: ValuedHolding}
+    - total_value: 전체 평가액 (원화)
+    - fx: 이번 평가에 쓴 환율 매트릭스
+    """
+
+    portfolio_id: Optional[UUID]
+    assets: list[Holding]
+    enriched: list[ValuedHolding]
+    index: AssetIndex
+    asset_values: dict[str, ValuedHolding]
+    total_value: Decimal
+    fx: FxMatrix = field(default_factory=FxMatrix)
+
+    @classmethod
+    def from_enriched(
+        cls,
+        portfolio_id: Optional[UUID],
+        assets: list[Holding],
+        enriched: list[ValuedHolding],
+        fx: FxMatrix,
+    ) -> "PortfolioValuation":
+        """enrich 결과로 평가 컨텍스트 생성 냥~"""
+        total_value, asset_values = collect_asset_values(assets, enriched)
+        return cls(
+            portfolio_id=portfolio_id,
+            assets=assets,
+            enriched=enriched,
+            index=AssetIndex(assets),
+            asset_values=asset_values,
+            total_value=total_value,
+            fx=fx,
+        )
+
+
+def collect_asset_values(
+    assets: list[Holding], enriched: list[ValuedHolding]
+) -> tuple[Decimal, dict[str, ValuedHolding]]:
+    """enrich 결과에서 자산별 평가 레코드와 평가액 합계 추출 냥~"""
+    total_value = Decimal("0")
+    asset_values = {}
+
+    for asset, valued in zip(assets, enriched):
+        # 키는 로드할 때 만들어둔 id 문자열 (UUID 객체 대응) 냥~
+        asset_values[asset_key(asset)] = valued
+        total_value += valued.get("market_value") or Decimal("0")
+
+    return total_value, asset_values
@@ -0,0 +1,118 @@
+"""
+Quote Cache - 프로세스 전역 시세 캐시 냥~ 🐱
+TTL + LRU + stale-while-revalidate
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from app.config import settings
+
+
+# 캐시 조회 상태 냥~
+FRESH = "fresh"   # TTL 이내 - 그대로 사용
+STALE = "stale"   # TTL 지남, stale 허용 구간 - 사용하되 백그라운드 갱신
+MISS = "miss"     # 없음 또는 너무 오래됨 - 새로 조회
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    stored_at: float
+    expires_at: float
+    stale_until: float
+
+
+class QuoteCache:
+    """
+    시세 캐시 냥~ 🐱
+    요청마다 FinanceService를 새로 만들어도 캐시는 프로세스 전체에서 공유
+
+    - ttl_seconds: 이 시간 동안은 신선한 값으로 간주
+    - stale_seconds: TTL이 지난 뒤에도 이 시간 동안은 오래된 값을 돌려주고 백그라운드에서 갱신
+    - max_size: 최대 항목 수, 넘치면 가장 오래 안 쓴 항목부터 제거 (LRU)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        stale_seconds: float,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+
+    def lookup(self, key: str) -> tuple[Optional[Any], str]:
+        """캐시 조회 - (값, 상태) 반환 냥~"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, MISS
+
+        now = self._clock()
+        if now < entry.expires_at:
+            self._entries.move_to_end(key)
+            return entry.value, FRESH
+        if now < entry.stale_until:
+            self._entries.move_to_end(key)
+            return entry.value, STALE
+        return None, MISS
+
+    def get(self, key: str) -> Optional[Any]:
+        """신선한 값만 반환 (stale이면 None) 냥~"""
+        value, state = self.lookup(key)
+        return value if state == FRESH else None
+
+    def peek(self, key: str) -> Optional[Any]:
+        """나이와 상관없이 남아있는 값 반환 냥~ (LRU 순서는 건드리지 않음)"""
+        entry = self._entries.get(key)
+        return entry.value if entry else None
+
+    def ttl_remaining(self, key: str) -> Optional[float]:
+        """신선 구간이 남은 시간(초) 냥~ (없으면 None, 이미 지났으면 음수)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return entry.expires_at - self._clock()
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """캐시 저장 냥~ ttl_seconds 생략 시 기본 TTL 사용"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        now = self._clock()
+        self._entries[key] = _CacheEntry(
+            value=value,
+            stored_at=now,
+            expires_at=now + ttl,
+            stale_until=now + ttl + self.stale_seconds,
+        )
+        self._entries.move_to_end(key)
+
+        # LRU 제거
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """특정 키 삭제 냥~"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 비우기 냥~"""
+        self._entries.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 프로세스 전역 시세 캐시 인스턴스 냥~
+quote_cache = QuoteCache(
+    ttl_seconds=settings.quote_cache_ttl_seconds,
+    stale_seconds=settings.quote_cache_stale_seconds,
+    max_size=settings.quote_cache_max_size,
+)
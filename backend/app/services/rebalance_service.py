@@ -3,19 +3,25 @@
 플랜 관리 및 개별 자산 기준 리밸런싱 계산
 """
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Union
 from uuid import UUID
 
-from app.db.supabase import get_supabase_client
-from app.services.finance_service import FinanceService
+from app.db.supabase import get_supabase_client, execute
+from app.services.finance_service import FinanceService, get_finance_service
+from app.services.fx_matrix import FxMatrix
+from app.services.holdings import Holding, ValuedHolding, asset_key
+from app.services.asset_index import AssetIndex
+from app.services.portfolio_valuation import PortfolioValuation, collect_asset_values
 
 
 class RebalanceService:
     """리밸런싱 플랜 서비스 냥~"""
 
-    def __init__(self):
+    def __init__(self, finance_service: Optional[FinanceService] = None):
         self.supabase = get_supabase_client()
-        self.finance_service = FinanceService()
+        self.finance_service = finance_service or get_finance_service()
+        # 요청 단위 평가 캐시 (서비스 인스턴스가 요청마다 새로 생성됨) 냥~
+        self._valuations: dict[Optional[str], PortfolioValuation] = {}
 
     async def get_plans(self, portfolio_id: Optional[UUID] = None) -> list[dict]:
         """플랜 목록 조회 냥~"""
@@ -26,7 +32,7 @@ class RebalanceService:
         if portfolio_id:
             query = query.eq("portfolio_id", str(portfolio_id))
 
-        response = query.order("created_at", desc=True).execute()
+        response = await execute(query.order("created_at", desc=True))
         plans = response.data or []
 
         # 각 플랜의 필드명 정리 및 그룹 정보 추가
@@ -39,11 +45,10 @@ class RebalanceService:
 
     async def get_plan(self, plan_id: UUID) -> Optional[dict]:
         """플랜 상세 조회 냥~"""
-        response = (
+        response = await execute(
             self.supabase.table("rebalance_plans")
             .select("*, plan_allocations(*)")
             .eq("id", str(plan_id))
-            .execute()
         )
         if not response.data:
             return None
@@ -54,6 +59,16 @@ class RebalanceService:
         plan["groups"] = await self.get_groups(plan_id)
         return plan
 
+    async def get_main_plan_ref(self, portfolio_id: Optional[UUID] = None) -> Optional[dict]:
+        """메인 플랜 id/이름만 조회 냥~ (배분/그룹 평가 없음, 대시보드 요약용)"""
+        query = self.supabase.table("rebalance_plans").select("id, name").eq("is_main", True).eq("is_active", True)
+
+        if portfolio_id:
+            query = query.eq("portfolio_id", str(portfolio_id))
+
+        response = await execute(query.limit(1))
+        return response.data[0] if response.data else None
+
     async def get_main_plan(self, portfolio_id: Optional[UUID] = None) -> Optional[dict]:
         """메인 플랜 조회 냥~"""
         query = self.supabase.table("rebalance_plans").select(
@@ -63,18 +78,20 @@ class RebalanceService:
         if portfolio_id:
             query = query.eq("portfolio_id", str(portfolio_id))
 
-        response = query.limit(1).execute()
+        response = await execute(query.limit(1))
         if response.data:
             plan = response.data[0]
             portfolio_id = UUID(plan["portfolio_id"])
+            # 포트폴리오 평가는 한 번만 하고 배분/그룹 계산에서 같이 사용
+            valuation = await self.get_valuation(portfolio_id)
             # plan_allocations -> allocations 키 변환 (current_value 포함)
             allocations = plan.pop("plan_allocations", [])
             plan["allocations"] = await self.get_allocations_with_values(
-                allocations, portfolio_id
+                allocations, portfolio_id, valuation
             )
             # groups도 조회해서 추가 (current_value 포함) 냥~
             plan["groups"] = await self.get_groups_with_values(
-                UUID(plan["id"]), portfolio_id
+                UUID(plan["id"]), portfolio_id, valuation
             )
             return plan
         return None
@@ -85,7 +102,9 @@ class RebalanceService:
         portfolio_id = data.get("portfolio_id")
         if not portfolio_id:
             # 기본 포트폴리오 조회
-            portfolio_response = self.supabase.table("portfolios").select("id").limit(1).execute()
+            portfolio_response = await execute(
+                self.supabase.table("portfolios").select("id").limit(1)
+            )
             if portfolio_response.data:
                 portfolio_id = portfolio_response.data[0]["id"]
             else:
@@ -105,7 +124,7 @@ class RebalanceService:
             "strategy_prompt": data.get("strategy_prompt"),
         }
 
-        response = self.supabase.table("rebalance_plans").insert(plan_data).execute()
+        response = await execute(self.supabase.table("rebalance_plans").insert(plan_data))
         plan = response.data[0]
 
         # 배분 설정이 있으면 저장
@@ -138,17 +157,21 @@ class RebalanceService:
             update_data["is_active"] = data["is_active"]
 
         if update_data:
-            self.supabase.table("rebalance_plans").update(update_data).eq(
-                "id", str(plan_id)
-            ).execute()
+            await execute(
+                self.supabase.table("rebalance_plans")
+                .update(update_data)
+                .eq("id", str(plan_id))
+            )
 
         return await self.get_plan(plan_id)
 
     async def delete_plan(self, plan_id: UUID) -> bool:
         """플랜 삭제 (soft delete) 냥~"""
-        self.supabase.table("rebalance_plans").update({"is_active": False}).eq(
-            "id", str(plan_id)
-        ).execute()
+        await execute(
+            self.supabase.table("rebalance_plans")
+            .update({"is_active": False})
+            .eq("id", str(plan_id))
+        )
         return True
 
     async def set_main_plan(self, plan_id: UUID) -> dict:
@@ -161,26 +184,33 @@ class RebalanceService:
         await self._unset_main_plan(plan["portfolio_id"])
 
         # 새 메인 플랜 설정
-        self.supabase.table("rebalance_plans").update({"is_main": True}).eq(
-            "id", str(plan_id)
-        ).execute()
+        await execute(
+            self.supabase.table("rebalance_plans")
+            .update({"is_main": True})
+            .eq("id", str(plan_id))
+        )
 
         return await self.get_plan(plan_id)
 
     async def _unset_main_plan(self, portfolio_id: str):
         """기존 메인 플랜 해제 냥~"""
-        self.supabase.table("rebalance_plans").update({"is_main": False}).eq(
-            "portfolio_id", str(portfolio_id)
-        ).eq("is_main", True).execute()
+        await execute(
+            self.supabase.table("rebalance_plans")
+            .update({"is_main": False})
+            .eq("portfolio_id", str(portfolio_id))
+            .eq("is_main", True)
+        )
 
     async def save_allocations(
         self, plan_id: UUID, allocations: list[dict]
     ) -> list[dict]:
         """배분 설정 저장 냥~"""
         # 기존 배분 삭제
-        self.supabase.table("plan_allocations").delete().eq(
-            "plan_id", str(plan_id)
-        ).execute()
+        await execute(
+            self.supabase.table("plan_allocations")
+            .delete()
+            .eq("plan_id", str(plan_id))
+        )
 
         if not allocations:
             return []
@@ -206,7 +236,9 @@ class RebalanceService:
                 item["relative_band"] = alloc["relative_band"]
             allocation_data.append(item)
 
-        response = self.supabase.table("plan_allocations").insert(allocation_data).execute()
+        response = await execute(
+            self.supabase.table("plan_allocations").insert(allocation_data)
+        )
         return response.data or []
 
     # ============================================
@@ -215,12 +247,11 @@ class RebalanceService:
 
     async def get_groups(self, plan_id: UUID) -> list[dict]:
         """플랜의 배분 그룹 목록 조회 냥~"""
-        response = (
+        response = await execute(
             self.supabase.table("allocation_groups")
             .select("*, allocation_group_items(*)")
             .eq("plan_id", str(plan_id))
             .order("display_order")
-            .execute()
         )
         groups = response.data or []
 
@@ -231,36 +262,36 @@ class RebalanceService:
         return groups
 
     async def get_groups_with_values(
-        self, plan_id: UUID, portfolio_id: UUID
+        self,
+        plan_id: UUID,
+        portfolio_id: UUID,
+        valuation: Optional[PortfolioValuation] = None,
     ) -> list[dict]:
         """플랜의 배분 그룹 목록 조회 (current_value 포함) 냥~"""
-        from app.services.asset_service import AssetService
-
         # 기존 그룹 조회
         groups = await self.get_groups(plan_id)
         if not groups:
             return groups
 
-        # 자산 데이터 조회
-        asset_service = AssetService(self.supabase)
-        assets = await asset_service.get_assets(portfolio_id=portfolio_id)
-        if not assets:
+        # 자산 평가 (이미 평가했으면 재사용)
+        valuation = valuation or await self.get_valuation(portfolio_id)
+        if not valuation.assets:
             # 자산이 없으면 모든 그룹의 current_value를 0으로 설정
             for group in groups:
                 group["current_value"] = 0.0
                 group["current_percentage"] = 0.0
             return groups
 
-        # 자산 시가 계산
-        total_value, asset_values = await self._get_asset_values(assets)
+        total_value, asset_values = valuation.total_value, valuation.asset_values
+        index = valuation.index
 
         # 각 그룹의 current_value 계산
         for group in groups:
             group_value = Decimal("0")
             for item in group.get("items", []):
-                matched_asset = self.match_item_to_asset(item, assets)
+                matched_asset = self.match_item_to_asset(item, index)
                 if matched_asset:
-                    asset_data = asset_values.get(str(matched_asset["id"]))
+                    asset_data = asset_values.get(asset_key(matched_asset))
                     if asset_data:
                         group_value += asset_data["market_value"]
 
@@ -272,33 +303,33 @@ class RebalanceService:
         return groups
 
     async def get_allocations_with_values(
-        self, allocations: list[dict], portfolio_id: UUID
+        self,
+        allocations: list[dict],
+        portfolio_id: UUID,
+        valuation: Optional[PortfolioValuation] = None,
     ) -> list[dict]:
         """개별 배분 항목에 current_value 추가 냥~"""
-        from app.services.asset_service import AssetService
-
         if not allocations:
             return allocations
 
-        # 자산 데이터 조회
-        asset_service = AssetService(self.supabase)
-        assets = await asset_service.get_assets(portfolio_id=portfolio_id)
-        if not assets:
+        # 자산 평가 (이미 평가했으면 재사용)
+        valuation = valuation or await self.get_valuation(portfolio_id)
+        if not valuation.assets:
             for alloc in allocations:
                 alloc["current_value"] = 0.0
                 alloc["current_percentage"] = 0.0
             return allocations
 
-        # 자산 시가 계산
-        total_value, asset_values = await self._get_asset_values(assets)
+        total_value, asset_values = valuation.total_value, valuation.asset_values
+        index = valuation.index
 
         # 각 배분 항목의 current_value 계산
         for alloc in allocations:
-            matched_asset = self.match_item_to_asset(alloc, assets)
+            matched_asset = self.match_item_to_asset(alloc, index)
             current_value = Decimal("0")
 
             if matched_asset:
-                asset_data = asset_values.get(str(matched_asset["id"]))
+                asset_data = asset_values.get(asset_key(matched_asset))
                 if asset_data:
                     current_value = asset_data["market_value"]
                 alloc["matched_asset_name"] = matched_asset.get("name")
@@ -313,9 +344,11 @@ class RebalanceService:
     async def save_groups(self, plan_id: UUID, groups: list[dict]) -> list[dict]:
         """배분 그룹 저장 냥~"""
         # 기존 그룹 삭제 (CASCADE로 아이템도 삭제됨)
-        self.supabase.table("allocation_groups").delete().eq(
-            "plan_id", str(plan_id)
-        ).execute()
+        await execute(
+            self.supabase.table("allocation_groups")
+            .delete()
+            .eq("plan_id", str(plan_id))
+        )
 
         if not groups:
             return []
@@ -329,7 +362,9 @@ class RebalanceService:
                 "target_percentage": group["target_percentage"],
                 "display_order": group.get("display_order", idx),
             }
-            group_response = self.supabase.table("allocation_groups").insert(group_data).execute()
+            group_response = await execute(
+                self.supabase.table("allocation_groups").insert(group_data)
+            )
             saved_group = group_response.data[0]
 
             # 그룹 아이템 생성 (weight 없이 단순 소속 관계만)
@@ -350,7 +385,9 @@ class RebalanceService:
                         item_data["alias"] = item["alias"]
                     items_data.append(item_data)
 
-                items_response = self.supabase.table("allocation_group_items").insert(items_data).execute()
+                items_response = await execute(
+                    self.supabase.table("allocation_group_items").insert(items_data)
+                )
                 saved_items = items_response.data or []
 
             saved_group["items"] = saved_items
@@ -362,90 +399,61 @@ class RebalanceService:
     # 매칭 로직 냥~
     # ============================================
 
-    def match_item_to_asset(self, item: dict, assets: list[dict]) -> Optional[dict]:
+    def match_item_to_asset(
+        self, item: dict, assets: Union[list[dict], AssetIndex]
+    ) -> Optional[dict]:
         """배분 항목을 실제 자산에 매칭 냥~
 
         매칭 우선순위:
         1. asset_id - 직접 참조
         2. ticker - 티커 매칭
         3. alias - 이름 기반 fuzzy match
+
+        여러 항목을 매칭할 때는 AssetIndex를 한 번 만들어서 넘기기
         """
-        # 1. asset_id 매칭
-        if item.get("asset_id"):
-            asset_id = str(item["asset_id"])
-            for asset in assets:
-                if str(asset.get("id")) == asset_id:
-                    return asset
-
-        # 2. ticker 매칭
-        if item.get("ticker"):
-            ticker = item["ticker"]
-            for asset in assets:
-                if asset.get("ticker") == ticker:
-                    return asset
-
-            # 2-1. ticker 값이 실제로는 name일 수 있음 (사용자 입력 오류 대응)
-            # 예: 사용자가 그룹 아이템에 '국내 금현물'을 ticker로 입력
-            for asset in assets:
-                if asset.get("name") == ticker:
-                    return asset
-
-        # 3. alias 매칭 (이름 포함 검사)
-        if item.get("alias"):
-            alias_lower = item["alias"].lower()
-            for asset in assets:
-                asset_name = asset.get("name", "").lower()
-                if alias_lower in asset_name or asset_name in alias_lower:
-                    return asset
+        index = assets if isinstance(assets, AssetIndex) else AssetIndex(assets)
+        return index.match(item)
 
-        return None
+    async def get_valuation(self, portfolio_id: Optional[UUID] = None) -> PortfolioValuation:
+        """
+        포트폴리오 평가 컨텍스트 조회 냥~ 🐱
+        자산 조회 + 시세/환율 일괄 조회를 요청당 한 번만 하고 결과를 재사용
+        """
+        key = str(portfolio_id) if portfolio_id else None
+        if key in self._valuations:
+            return self._valuations[key]
 
-    async def _get_asset_values(
-        self, assets: list[dict]
-    ) -> tuple[Decimal, dict[str, dict]]:
-        """자산들의 현재가 및 시장 가치 계산 냥~"""
-        total_value = Decimal("0")
-        asset_values = {}
-
-        for asset in assets:
-            market_value = Decimal("0")
-            current_price = None
-
-            if asset.get("ticker"):
-                price_data = await self.finance_service.get_stock_price(asset["ticker"])
-                if price_data.get("current_price"):
-                    current_price = Decimal(str(price_data["current_price"]))
-
-                    # USD 자산의 경우 환율 적용
-                    if asset.get("currency") == "USD":
-                        exchange_rate = await self.finance_service.get_exchange_rate()
-                        market_value = (
-                            current_price
-                            * Decimal(str(asset["quantity"]))
-                            * Decimal(str(exchange_rate))
-                        )
-                    else:
-                        market_value = current_price * Decimal(str(asset["quantity"]))
-            elif asset.get("current_value"):
-                market_value = Decimal(str(asset["current_value"]))
-
-            # 키를 문자열로 통일 (UUID 객체 대응) 냥~
-            asset_id_str = str(asset["id"])
-            asset_values[asset_id_str] = {
-                "asset": asset,
-                "market_value": market_value,
-                "current_price": current_price,
-            }
-            total_value += market_value
+        from app.services.asset_service import AssetService
 
-        return total_value, asset_values
+        asset_service = AssetService(self.supabase)
+        assets = await asset_service.get_assets(portfolio_id=portfolio_id)
+        fx = await self.finance_service.get_fx_matrix(a.get("currency") for a in assets)
+        enriched = await self.finance_service.enrich_assets_with_prices(assets, fx)
+
+        valuation = PortfolioValuation.from_enriched(portfolio_id, assets, enriched, fx)
+        self._valuations[key] = valuation
+        # 기본 포트폴리오(None)로 조회한 경우 실제 id로도 찾을 수 있게
+        if assets and assets[0].get("portfolio_id"):
+            self._valuations.setdefault(str(assets[0]["portfolio_id"]), valuation)
+        return valuation
+
+    async def _get_asset_values(
+        self, assets: list[Holding], fx: Optional[FxMatrix] = None
+    ) -> tuple[Decimal, dict[str, ValuedHolding]]:
+        """
+        자산들의 현재가 및 시장 가치 계산 냥~
+        enrich_assets_with_prices와 같은 일괄 조회(시세 + 환율 한 번)를 그대로 사용
+        """
+        enriched = await self.finance_service.enrich_assets_with_prices(assets, fx)
+        return collect_asset_values(assets, enriched)
 
     async def calculate_rebalance_by_plan(
-        self, plan_id: UUID, portfolio_id: Optional[UUID] = None
+        self,
+        plan_id: UUID,
+        portfolio_id: Optional[UUID] = None,
+        valuation: Optional[PortfolioValuation] = None,
     ) -> dict:
-        """플랜 기준 리밸런싱 계산 냥~"""
-        from app.services.asset_service import AssetService
-
+        """플랜 기준 리밸런싱 계산 냥~ (valuation 생략 시 요청 단위 평가 재사용)"""
         # 플랜 조회
         plan = await self.get_plan(plan_id)
         if not plan:
@@ -463,13 +471,12 @@ class RebalanceService:
                 "group_suggestions": [],
             }
 
-        # 현재 보유 자산 조회
-        asset_service = AssetService(self.supabase)
-        assets = await asset_service.get_assets(
-            portfolio_id=portfolio_id or UUID(plan["portfolio_id"])
+        # 현재 보유 자산 평가 (get_main_plan 등에서 이미 평가했으면 재사용)
+        valuation = valuation or await self.get_valuation(
+            portfolio_id or UUID(plan["portfolio_id"])
         )
 
-        if not assets:
+        if not valuation.assets:
             return {
                 "plan_id": str(plan_id),
                 "plan_name": plan["name"],
@@ -478,14 +485,16 @@ class RebalanceService:
                 "group_suggestions": [],
             }
 
-        # 자산 가치 계산
-        total_value, asset_values = await self._get_asset_values(assets)
+        total_value, asset_values = valuation.total_value, valuation.asset_values
+        index = valuation.index
 
         # user_settings에서 기본 밴드값 조회 냥~
         DEFAULT_USER_ID = "00000000-0000-0000-0000-000000000001"
-        settings_result = self.supabase.table("user_settings").select(
-            "default_absolute_band,default_relative_band"
-        ).eq("user_id", DEFAULT_USER_ID).execute()
+        settings_result = await execute(
+            self.supabase.table("user_settings")
+            .select("default_absolute_band,default_relative_band")
+            .eq("user_id", DEFAULT_USER_ID)
+        )
         settings_row = settings_result.data[0] if settings_result.data else {}
         default_abs_band = Decimal(str(settings_row.get("default_absolute_band") or 5))
         default_rel_band = Decimal(str(settings_row.get("default_relative_band") or 25))
@@ -494,8 +503,9 @@ class RebalanceService:
         suggestions = []
         for alloc in allocations:
             suggestion = await self._calculate_allocation_suggestion(
-                alloc, assets, asset_values, total_value,
-                default_abs_band, default_rel_band
+                alloc, index, asset_values, total_value,
+                default_abs_band, default_rel_band,
+                exchange_rate=valuation.fx.decimal_rate("USD"),
             )
             suggestions.append(suggestion)
 
@@ -503,7 +513,7 @@ class RebalanceService:
         group_suggestions = []
         for group in groups:
             group_suggestion = await self._calculate_group_suggestion(
-                group, assets, asset_values, total_value,
+                group, index, asset_values, total_value,
                 default_abs_band, default_rel_band
             )
             group_suggestions.append(group_suggestion)
@@ -519,13 +529,14 @@ class RebalanceService:
     async def _calculate_allocation_suggestion(
         self,
         alloc: dict,
-        assets: list[dict],
+        assets: Union[list[dict], AssetIndex],
         asset_values: dict,
         total_value: Decimal,
         default_absolute_band: Decimal = Decimal("5"),
         default_relative_band: Decimal = Decimal("25"),
+        exchange_rate: Optional[Decimal] = None,
     ) -> dict:
-        """개별 배분 제안 계산 냥~"""
+        """개별 배분 제안 계산 냥~ (exchange_rate 생략 시 USD 자산에서 직접 조회)"""
         target_pct = Decimal(str(alloc["target_percentage"]))
         target_value = total_value * target_pct / Decimal("100")
 
@@ -534,8 +545,8 @@ class RebalanceService:
         current_value = Decimal("0")
 
         if matched_asset:
-            # 키를 문자열로 변환하여 조회 (UUID 객체 대응) 냥~
-            asset_data = asset_values.get(str(matched_asset["id"]))
+            # 자산 id 문자열 키로 조회 냥~
+            asset_data = asset_values.get(asset_key(matched_asset))
             if asset_data:
                 current_value = asset_data["market_value"]
 
@@ -561,12 +572,13 @@ class RebalanceService:
         # 매수/매도 수량 계산
         suggested_qty = None
         if matched_asset:
-            # 키를 문자열로 변환하여 조회 냥~
-            current_price = asset_values.get(str(matched_asset["id"]), {}).get("current_price")
+            # 자산 id 문자열 키로 조회 냥~
+            current_price = asset_values.get(asset_key(matched_asset), {}).get("current_price")
             if current_price and current_price > 0:
                 if matched_asset.get("currency") == "USD":
-                    exchange_rate = await self.finance_service.get_exchange_rate()
-                    suggested_qty = suggested_amount / (current_price * Decimal(str(exchange_rate)))
+                    if exchange_rate is None:
+                        exchange_rate = Decimal(str(await self.finance_service.get_exchange_rate()))
+                    suggested_qty = suggested_amount / (current_price * exchange_rate)
                 else:
                     suggested_qty = suggested_amount / current_price
 
@@ -601,7 +613,7 @@ class RebalanceService:
     async def _calculate_group_suggestion(
         self,
         group: dict,
-        assets: list[dict],
+        assets: Union[list[dict], AssetIndex],
         asset_values: dict,
         total_value: Decimal,
         default_absolute_band: Decimal = Decimal("5"),
@@ -614,16 +626,17 @@ class RebalanceService:
         items = group.get("items", [])
         group_current_value = Decimal("0")
         item_details = []
+        index = assets if isinstance(assets, AssetIndex) else AssetIndex(assets)
 
         # 그룹 내 모든 자산의 시가를 단순 합산
         for item in items:
-            matched_asset = self.match_item_to_asset(item, assets)
+            matched_asset = self.match_item_to_asset(item, index)
             item_current_value = Decimal("0")
             asset_name = None
 
             if matched_asset:
-                # 키를 문자열로 변환하여 조회 (UUID 객체 대응) 냥~
-                asset_data = asset_values.get(str(matched_asset["id"]))
+                # 자산 id 문자열 키로 조회 냥~
+                asset_data = asset_values.get(asset_key(matched_asset))
                 if asset_data:
                     item_current_value = asset_data["market_value"]
                 asset_name = matched_asset.get("name")
@@ -2,15 +2,18 @@
 Scheduler Service - 백그라운드 작업 스케줄러 냥~ 🐱
 매일 밤 11시에 자산 스냅샷 및 벤치마크 데이터 저장
 """
+import asyncio
 import pytz
 from datetime import datetime, date
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from app.config import settings
-from app.db.supabase import get_supabase_client
+from app.db.supabase import get_supabase_client, execute
 from app.services.asset_service import AssetService
-from app.services.finance_service import FinanceService
+from app.services.finance_service import get_finance_service, MARKET_INDICATOR_TICKERS
+from app.services.market_indicators import market_indicators
 
 
 # 벤치마크 티커 목록 냥~
@@ -29,48 +32,77 @@ async def take_daily_snapshot():
     """
     일일 자산 스냅샷 저장 냥~ 🐱
 
-    모든 포트폴리오에 대해:
-    1. 현재 자산 조회
-    2. 실시간 가격 조회
-    3. 요약 계산
-    4. asset_history에 저장
+    1. 모든 포트폴리오의 자산 조회
+    2. 전체 포트폴리오의 티커를 모아서 시세/환율 한 번에 조회
+    3. 포트폴리오별 요약 계산 (동시 실행, snapshot_concurrency로 제한)
+    4. asset_history에 한 번에 저장
     """
     print(f"📸 [{datetime.now()}] 일일 스냅샷 시작 냥~!")
 
     try:
         db = get_supabase_client()
         asset_service = AssetService(db)
-        finance_service = FinanceService()
+        finance_service = get_finance_service()
+        semaphore = asyncio.Semaphore(max(1, settings.snapshot_concurrency))
 
         # 모든 포트폴리오 조회
         portfolio_ids = await asset_service.get_all_portfolio_ids()
 
-        # 현재 환율 조회 (모든 포트폴리오에 동일하게 적용)
-        from decimal import Decimal
-        exchange_rate = await finance_service.get_exchange_rate()
-
-        for portfolio_id in portfolio_ids:
-            try:
-                # 자산 조회 및 가격 조회
-                assets = await asset_service.get_assets(portfolio_id)
-                enriched_assets = await finance_service.enrich_assets_with_prices(assets)
+        async def load_assets(portfolio_id):
+            async with semaphore:
+                return await asset_service.get_assets(portfolio_id)
+
+        # 포트폴리오별 자산 조회 (실패한 포트폴리오는 건너뜀)
+        loaded = await asyncio.gather(
+            *[load_assets(pid) for pid in portfolio_ids], return_exceptions=True
+        )
+        portfolio_assets = {}
+        for portfolio_id, assets in zip(portfolio_ids, loaded):
+            if isinstance(assets, Exception):
+                print(f"❌ 포트폴리오 {portfolio_id} 스냅샷 실패 냥: {assets}")
+            else:
+                portfolio_assets[portfolio_id] = assets
+
+        # 전체 티커/통화를 모아서 시세와 환율을 한 번만 조회
+        all_assets = [a for assets in portfolio_assets.values() for a in assets]
+        tickers = sorted({a["ticker"] for a in all_assets if a.get("ticker")})
+        prices, fx = await asyncio.gather(
+            finance_service.get_multiple_prices(tickers),
+            finance_service.get_fx_matrix(a.get("currency") for a in all_assets),
+        )
+        print(f"💰 티커 {len(tickers)}개 시세 조회 완료 (포트폴리오 {len(portfolio_assets)}개)")
+
+        async def build_row(portfolio_id, assets):
+            async with semaphore:
+                enriched_assets = await finance_service.enrich_assets_with_prices(
+                    assets, fx, prices
+                )
 
                 # 요약 계산 (환율 전달)
                 summary = await asset_service.calculate_summary(
-                    enriched_assets, portfolio_id, Decimal(str(exchange_rate))
+                    enriched_assets, portfolio_id, fx.decimal_rate("USD")
                 )
 
-                # 스냅샷 저장
-                await asset_service.save_snapshot(portfolio_id, summary)
-
-                print(f"✅ 포트폴리오 {portfolio_id} 스냅샷 완료!")
+                print(f"✅ 포트폴리오 {portfolio_id} 스냅샷 계산 완료!")
                 print(f"   총 자산: {summary.total_value:,.0f}원")
                 print(f"   수익률: {summary.profit_rate:+.2f}%")
+                return asset_service.build_snapshot_row(portfolio_id, summary)
 
-            except Exception as e:
-                print(f"❌ 포트폴리오 {portfolio_id} 스냅샷 실패 냥: {e}")
+        built = await asyncio.gather(
+            *[build_row(pid, assets) for pid, assets in portfolio_assets.items()],
+            return_exceptions=True,
+        )
+        rows = []
+        for portfolio_id, row in zip(portfolio_assets, built):
+            if isinstance(row, Exception):
+                print(f"❌ 포트폴리오 {portfolio_id} 스냅샷 실패 냥: {row}")
+            else:
+                rows.append(row)
+
+        # 스냅샷 일괄 저장
+        await asset_service.save_snapshots(rows)
 
-        print(f"🎉 [{datetime.now()}] 모든 스냅샷 완료 냥~!")
+        print(f"🎉 [{datetime.now()}] 모든 스냅샷 완료 냥~! ({len(rows)}/{len(portfolio_ids)})")
 
     except Exception as e:
         print(f"🙀 스냅샷 작업 전체 실패 냥: {e}")
@@ -106,6 +138,30 @@ def start_scheduler():
         replace_existing=True,
     )
 
+    # 보유 티커 + 시장 지표 시세 예열 (만료 임박한 시세만 갱신하므로 장 마감 종목은 건너뜀)
+    if settings.quote_prewarm_enabled:
+        scheduler.add_job(
+            prewarm_quotes,
+            trigger=IntervalTrigger(seconds=settings.quote_prewarm_interval_seconds, timezone=tz),
+            id="quote_prewarm",
+            name="보유 티커 시세 예열 냥~",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+
+    # 시장 지표 스냅샷 갱신 (시작하자마자 한 번 계산)
+    scheduler.add_job(
+        refresh_market_indicators,
+        trigger=IntervalTrigger(seconds=settings.market_indicators_refresh_seconds, timezone=tz),
+        id="market_indicators",
+        name="시장 지표 스냅샷 갱신 냥~",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now(tz),
+    )
+
     scheduler.start()
     print(f"⏰ 스케줄러 시작! 매일 {settings.snapshot_hour}:{settings.snapshot_minute:02d}에 스냅샷 저장 냥~")
 
@@ -128,6 +184,39 @@ async def run_snapshot_now():
     await take_daily_snapshot()
 
 
+async def prewarm_quotes() -> list[str]:
+    """
+    시세 예열 냥~ 🔥
+    전체 포트폴리오의 활성 자산 티커 + 시장 지표 티커 중
+    다음 예열 전에 만료될 시세만 미리 받아서 공유 캐시를 채움
+    (대시보드 요청이 yfinance를 기다리지 않도록)
+    """
+    try:
+        asset_service = AssetService(get_supabase_client())
+        finance_service = get_finance_service()
+
+        tickers = await asset_service.get_active_tickers()
+        refreshed = await finance_service.prewarm_quotes(
+            tickers + MARKET_INDICATOR_TICKERS,
+            horizon_seconds=settings.quote_prewarm_interval_seconds,
+        )
+        # 환율도 TTL 만료 시에만 갱신됨
+        await finance_service.get_exchange_rate()
+        return refreshed
+
+    except Exception as e:
+        print(f"🙀 시세 예열 실패 냥: {e}")
+        return []
+
+
+async def refresh_market_indicators() -> None:
+    """시장 지표 스냅샷 갱신 냥~ 📈 (실패하면 이전 스냅샷 유지)"""
+    try:
+        await market_indicators.refresh(get_finance_service())
+    except Exception as e:
+        print(f"🙀 시장 지표 갱신 실패 냥: {e}")
+
+
 async def take_benchmark_snapshot():
     """
     벤치마크 일별 종가 스냅샷 저장 냥~ 📊
@@ -138,7 +227,7 @@ async def take_benchmark_snapshot():
 
     try:
         db = get_supabase_client()
-        finance_service = FinanceService()
+        finance_service = get_finance_service()
 
         today = date.today()
 
@@ -151,14 +240,14 @@ async def take_benchmark_snapshot():
                     close_price = float(result["current_price"])
 
                     # DB에 저장 (upsert)
-                    db.table("benchmark_history").upsert(
+                    await execute(db.table("benchmark_history").upsert(
                         {
                             "ticker": ticker,
                             "snapshot_date": today.isoformat(),
                             "close_price": close_price,
                         },
                         on_conflict="ticker,snapshot_date"
-                    ).execute()
+                    ))
 
                     print(f"✅ {ticker} 종가 저장: {close_price:,.2f}")
                 else:
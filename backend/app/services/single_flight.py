@@ -0,0 +1,92 @@
+"""
+Single Flight - 동시에 들어온 같은 조회를 하나로 합치기 냥~ 🐱
+같은 키로 진행 중인 작업이 있으면 새로 시작하지 않고 그 결과를 함께 기다림
+"""
+import asyncio
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional
+
+
+class SingleFlight:
+    """
+    진행 중인 비동기 작업 중복 제거 냥~
+
+    - do(key, fn): key로 진행 중인 작업이 있으면 합류, 없으면 fn() 실행
+    - do_many(keys, fn): 진행 중이 아닌 키만 모아서 fn(keys) 한 번 실행 (일괄 조회용)
+
+    작업은 별도 태스크로 돌기 때문에 먼저 요청한 쪽이 취소돼도 나머지는 결과를 받음
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    def _live(self, key: Hashable) -> Optional[asyncio.Future]:
+        """현재 이벤트 루프에서 진행 중인 작업 반환 냥~"""
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            return None
+        if task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    def _register(self, key: Hashable, task: asyncio.Future) -> None:
+        self._inflight[key] = task
+        task.add_done_callback(partial(self._forget, key))
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 아무도 기다리지 않은 예외 경고 방지 냥~
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """key 단위로 합쳐서 fn() 실행 냥~"""
+        task = self._live(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._register(key, task)
+        return await asyncio.shield(task)
+
+    async def do_many(
+        self,
+        keys: Iterable[Hashable],
+        fn: Callable[[list], Awaitable[dict]],
+    ) -> dict:
+        """
+        여러 키 일괄 조회 냥~
+        진행 중인 키는 합류하고, 나머지만 fn(claimed)으로 한 번에 조회
+        fn은 {key: value} dict를 반환해야 하며 빠진 키는 결과에서 제외됨
+        """
+        waiting: dict[Hashable, asyncio.Future] = {}
+        claimed: list = []
+
+        for key in dict.fromkeys(keys):
+            task = self._live(key)
+            if task is None:
+                claimed.append(key)
+            else:
+                waiting[key] = task
+
+        if claimed:
+            batch = asyncio.ensure_future(fn(claimed))
+            for key in claimed:
+                task = asyncio.ensure_future(_pick(batch, key))
+                self._register(key, task)
+                waiting[key] = task
+
+        values = await asyncio.gather(*[asyncio.shield(t) for t in waiting.values()])
+        return {
+            key: value
+            for key, value in zip(waiting, values)
+            if value is not None
+        }
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+async def _pick(batch: asyncio.Future, key: Hashable) -> Any:
+    """일괄 작업 결과에서 한 키만 꺼내기 냥~"""
+    results = await asyncio.shield(batch)
+    return results.get(key)
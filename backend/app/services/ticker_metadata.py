@@ -0,0 +1,79 @@
+"""
+Ticker Metadata - 티커 메타데이터 캐시 냥~ 🐱
+이름/통화/거래소/유효성은 거의 안 바뀌니까 시세와 따로 하루 단위로 캐시
+티커 검증, 자산 추가/수정은 여기서 바로 확인하고 시세 조회 경로에서도 같이 채움
+"""
+import time
+from typing import Callable, Optional
+
+from app.config import settings
+from app.services.quote_cache import QuoteCache
+
+
+class TickerMetadataCache:
+    """
+    티커 메타데이터 캐시 냥~
+
+    - 유효한 티커: {"name", "currency", "exchange", "valid": True}를 ttl_seconds 동안
+    - 없는 티커: {"valid": False}를 invalid_ttl_seconds 동안 (새로 상장될 수도 있으니 짧게)
+    - 업스트림 실패(시세 dict에 "error")는 유효성을 알 수 없으므로 저장하지 않음
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        invalid_ttl_seconds: float,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.invalid_ttl_seconds = invalid_ttl_seconds
+        self._cache = QuoteCache(
+            ttl_seconds=ttl_seconds,
+            stale_seconds=0,
+            max_size=max_size,
+            clock=clock,
+        )
+
+    def get(self, ticker: str) -> Optional[dict]:
+        """TTL 이내 메타데이터 냥~ (없으면 None)"""
+        return self._cache.get(ticker)
+
+    def remember(self, ticker: str, quote: dict, ttl_seconds: Optional[float] = None) -> None:
+        """
+        시세 조회 결과로 메타데이터 저장 냥~
+        이름/거래소가 없는 유효 시세(일괄 조회 결과)는 메타데이터를 모르므로 건너뜀
+        """
+        if quote.get("valid"):
+            if not (quote.get("name") or quote.get("exchange")):
+                return
+            meta = {
+                "name": quote.get("name"),
+                "currency": quote.get("currency"),
+                "exchange": quote.get("exchange"),
+                "valid": True,
+            }
+            self._cache.set(ticker, meta, ttl_seconds=self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+        elif not quote.get("error"):
+            self._cache.set(
+                ticker,
+                {"name": None, "currency": None, "exchange": None, "valid": False},
+                ttl_seconds=self.invalid_ttl_seconds,
+            )
+
+    def invalidate(self, ticker: str) -> None:
+        self._cache.invalidate(ticker)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# 프로세스 전역 티커 메타데이터 캐시 냥~
+ticker_metadata = TickerMetadataCache(
+    ttl_seconds=settings.ticker_metadata_ttl_seconds,
+    invalid_ttl_seconds=settings.ticker_metadata_invalid_ttl_seconds,
+    max_size=settings.quote_cache_max_size,
+)
@@ -0,0 +1,223 @@
+"""
+Upstream Guard - yfinance 호출 보호막 냥~ 🐱
+야후가 요청을 제한하기 시작하면 타임아웃까지 기다리는 스레드가 쌓여서 서버 전체가 느려지므로
+모든 외부 시세 호출을 이 가드를 거쳐 실행
+
+- AIMD 동시성 제한: 성공하면 조금씩(+1/limit) 늘리고, 실패/타임아웃이면 절반으로 줄임
+- 호출별 타임아웃: 오래 걸리는 호출은 실패로 보고 기다리지 않음
+- 실패 집계는 is_failure(예외)가 True인 예외만 (없는 티커 같은 요청 오류는 업스트림이 응답한 것)
+- 서킷 브레이커: 연속 실패가 쌓이면 일정 시간 호출 자체를 막고 (open)
+  그 뒤 한 번만 시험 호출 (half-open) → 성공하면 정상 (closed), 실패하면 다시 open
+  막혀 있는 동안 호출 측은 캐시/마지막 정상값으로 폴백
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+from app.config import settings
+from app.services.market_data import is_upstream_failure
+
+
+T = TypeVar("T")
+
+# 서킷 상태 냥~
+CLOSED = "closed"         # 정상
+OPEN = "open"             # 차단 중 - 호출하지 않고 바로 실패
+HALF_OPEN = "half_open"   # 시험 호출 한 번만 허용
+
+
+class UpstreamError(Exception):
+    """업스트림 호출 실패 (가드가 만든 에러) 냥~"""
+
+
+class UpstreamUnavailable(UpstreamError):
+    """서킷이 열려 있어서 호출하지 않음 냥~"""
+
+
+class UpstreamTimeout(UpstreamError):
+    """호출 타임아웃 냥~"""
+
+
+class UpstreamGuard:
+    """
+    외부 API 호출 가드 냥~ 🐱
+
+    - call(fn): fn()을 동시성 제한/타임아웃/서킷 브레이커 아래에서 실행
+    - is_failure(exc): 실패로 집계할 예외인지 (아니면 예외는 그대로 던지고 성공으로 집계)
+    - snapshot(): 헬스 체크용 상태
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_concurrency: int,
+        max_concurrency: int,
+        timeout_seconds: float,
+        failure_threshold: int,
+        open_seconds: float,
+        is_failure: Callable[[BaseException], bool],
+        backoff: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.timeout_seconds = timeout_seconds
+        self.failure_threshold = max(1, failure_threshold)
+        self.open_seconds = open_seconds
+        self.backoff = backoff
+        self.is_failure = is_failure
+        self._clock = clock
+        self.reset()
+
+    def reset(self) -> None:
+        """초기 상태로 되돌리기 냥~"""
+        self.limit = float(self.max_concurrency)
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self.total_calls = 0
+        self.total_failures = 0
+        self.total_timeouts = 0
+        self.total_rejected = 0
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        가드 아래에서 fn() 실행 냥~
+        서킷이 열려 있으면 UpstreamUnavailable, 타임아웃이면 UpstreamTimeout
+        fn의 예외는 is_failure면 실패로 집계한 뒤 그대로 다시 던짐
+        타임아웃은 await만 끊으므로 스레드 풀 작업은 호출 측에서 따로 제한해야 함
+        (풀 슬롯 대기는 fn 밖에서 - 안에서 기다리면 로컬 풀 포화가 업스트림 타임아웃으로 집계됨)
+        """
+        probe = self._admit()
+        try:
+            await self._acquire()
+            try:
+                self.total_calls += 1
+                try:
+                    result = await asyncio.wait_for(fn(), timeout=self.timeout_seconds)
+                except asyncio.TimeoutError:
+                    self.total_timeouts += 1
+                    self._on_failure()
+                    raise UpstreamTimeout(
+                        f"{self.name} 호출이 {self.timeout_seconds}초 안에 끝나지 않았다옹"
+                    ) from None
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if self.is_failure(e):
+                        self._on_failure()
+                    else:
+                        # 업스트림은 응답함 (없는 티커 등)
+                        self._on_success()
+                    raise
+
+                self._on_success()
+                return result
+            finally:
+                self._release()
+        finally:
+            if probe:
+                self._probing = False
+
+    def snapshot(self) -> dict:
+        """헬스 체크용 상태 냥~"""
+        retry_in = None
+        if self.state == OPEN:
+            retry_in = round(max(0.0, self._opened_at + self.open_seconds - self._clock()), 1)
+        return {
+            "name": self.name,
+            "state": self.state,
+            "concurrency_limit": round(self.limit, 2),
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in_seconds": retry_in,
+            "total_calls": self.total_calls,
+            "total_failures": self.total_failures,
+            "total_timeouts": self.total_timeouts,
+            "total_rejected": self.total_rejected,
+        }
+
+    def _admit(self) -> bool:
+        """서킷 상태 확인 냥~ (half-open 시험 호출이면 True)"""
+        if self.state == OPEN:
+            if self._clock() - self._opened_at < self.open_seconds:
+                self.total_rejected += 1
+                raise UpstreamUnavailable(f"{self.name} 서킷이 열려 있다옹")
+            self.state = HALF_OPEN
+            self._probing = False
+
+        if self.state == HALF_OPEN:
+            if self._probing:
+                self.total_rejected += 1
+                raise UpstreamUnavailable(f"{self.name} 시험 호출 중이다옹")
+            self._probing = True
+            return True
+        return False
+
+    def _on_success(self) -> None:
+        self.consecutive_failures = 0
+        if self.state == HALF_OPEN:
+            self.state = CLOSED
+            print(f"😺 {self.name} 서킷 닫힘, 정상 호출 재개 냥~")
+        # 가산 증가: 동시성 limit만큼 성공하면 +1
+        self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+        self._wake()
+
+    def _on_failure(self) -> None:
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        # 승산 감소
+        self.limit = max(float(self.min_concurrency), self.limit * self.backoff)
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                print(f"🙀 {self.name} 연속 {self.consecutive_failures}회 실패, "
+                      f"{self.open_seconds}초 동안 서킷 열림 냥")
+            self.state = OPEN
+            self._opened_at = self._clock()
+
+    async def _acquire(self) -> None:
+        """동시성 슬롯 얻기 냥~ (limit이 꽉 차면 대기)"""
+        while self._in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # 깨워졌는데 취소됨 - 다음 대기자에게 넘김
+                    self._wake()
+                raise
+        self._in_flight += 1
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """빈 슬롯 수만큼 대기자 깨우기 냥~"""
+        free = int(self.limit) - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+# 프로세스 전역 yfinance 가드 냥~ (FinanceService 인스턴스 간 공유)
+upstream_guard = UpstreamGuard(
+    name="yfinance",
+    min_concurrency=settings.upstream_min_concurrency,
+    max_concurrency=settings.upstream_max_concurrency,
+    timeout_seconds=settings.upstream_timeout_seconds,
+    failure_threshold=settings.upstream_failure_threshold,
+    open_seconds=settings.upstream_open_seconds,
+    is_failure=is_upstream_failure,
+)
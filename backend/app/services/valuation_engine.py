@@ -0,0 +1,176 @@
+"""
+Valuation Engine - 자산 평가 냥~ 🐱
+자산마다 평가액/원금/손익/수익률을 계산해서 평가 레코드(ValuedHolding)로 반환
+
+- value_assets(): 행 단위 Decimal 루프 (열 단위 벡터화 아님)
+  int64 열로는 8자리 소수 수량 × 가격 × 환율 곱이 안 담기고, 파이썬 정수 object 배열은 루프보다 빠르지 않음
+- 금액 계산은 정밀도 제한 없는 Decimal 컨텍스트(EXACT)에서 → 계수 × 10^지수 정수 연산이라 반올림 없음
+  (코인 0.00000001개 × 가격 × 환율도 28자리 기본 정밀도에 잘리지 않음)
+- 입력 변환(Decimal(str(...)))은 같은 값이면 한 번만 (공통 환율, 같은 티커 현재가 등)
+- 수익률(%)만 float
+- summary_columns(): 대시보드 요약용 평가액/원금 열 (고정소수점 정수)
+"""
+from collections.abc import Mapping, Sequence
+from decimal import Context, Decimal, MAX_EMAX, MAX_PREC, MIN_EMIN, localcontext
+from typing import Any, Optional
+
+import numpy as np
+
+from app.services.fx_matrix import FxMatrix
+from app.services.holdings import ValuedHolding
+from app.services.money import MONEY_SCALE, QUANTITY_SCALE, RATE_SCALE, round_div_column, scaled_column
+
+
+ZERO = Decimal("0")
+
+# 자릿수/지수 제한 없는 컨텍스트 냥~ (곱셈/덧셈/뺄셈 전용, 나눗셈은 무한소수가 될 수 있어서 금지)
+EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """입력값 → Decimal 냥~ (None은 0, float는 str 거쳐서)"""
+    if value is None:
+        return ZERO
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+class _Memo(dict):
+    """입력값 → Decimal 변환 메모 냥~ (공통 환율, 같은 단가 등은 한 번만 변환)"""
+
+    def __missing__(self, value: Any) -> Decimal:
+        decimal = self[value] = _to_decimal(value)
+        return decimal
+
+
+def _asset_price(asset: Mapping, prices: dict[str, dict], fx: FxMatrix) -> Optional[Decimal]:
+    """자산 통화 기준 현재가 냥~ (시세 없으면 None)"""
+    ticker = asset.get("ticker")
+    if not ticker or ticker not in prices:
+        return None
+
+    price_info = prices[ticker]
+    current_price = price_info.get("current_price")
+    if not current_price:
+        return None
+
+    currency = asset.get("currency", "KRW")
+    # 시세 통화가 None이면 DB의 자산 통화를 따름
+    price_currency = price_info.get("currency") or currency
+    # 가격 통화와 자산 통화가 다르면 자산 통화로 환산 (예: USD 시세 → KRW 자산)
+    if price_currency != currency:
+        conversion = fx.rate(price_currency, currency)
+        if conversion is not None:
+            current_price = float(current_price) * conversion
+    return _to_decimal(current_price)
+
+
+def value_assets(assets: Sequence[Mapping], prices: dict[str, dict], fx: FxMatrix) -> list[ValuedHolding]:
+    """
+    자산 목록 평가 냥~ 🐱 (자산마다 한 행씩)
+
+    - 시세 있는 자산: 현재가 × 수량 (USD 자산은 현재 환율로 원화 환산, 원금은 매수 시점 환율)
+    - 시세 없이 current_value가 있는 자산(현금, 금현물 등): current_value가 평가액
+    - 나머지: 평가액/손익 0
+    결과 ValuedHolding 필드: current_price, current_exchange_rate, cost_basis_krw, market_value(_usd),
+    profit_loss, profit_rate, manual_value(수동 입력 자산만)
+    """
+    if not assets:
+        return []
+
+    rate = _to_decimal(fx.usd_krw)
+    memo = _Memo()
+
+    # 같은 티커 로트가 많아도 (티커, 자산 통화)마다 한 번만 환산
+    price_memo: dict[tuple, Optional[Decimal]] = {}
+
+    enriched = []
+    with localcontext(EXACT):
+        for asset in assets:
+            currency = asset.get("currency", "KRW")
+            ticker = asset.get("ticker")
+            key = (ticker, currency)
+            if key not in price_memo:
+                price_memo[key] = _asset_price(asset, prices, fx)
+            current_price = price_memo[key]
+
+            quantity = memo[asset.get("quantity", 0)]
+            average = memo[asset.get("average_price", 0)]
+            is_usd = currency == "USD"
+            positive = quantity > 0
+            valuation: dict[str, Any] = {"cost_basis_krw": None}
+
+            # USD 자산의 원화 환산 매입가 = 평균매수가(USD) × 수량 × 매수시점환율 (없으면 현재 환율)
+            cost_krw = None
+            if is_usd and positive:
+                cost_krw = average * quantity * memo[asset.get("purchase_exchange_rate") or rate]
+                valuation["cost_basis_krw"] = cost_krw
+
+            if current_price is not None and positive:
+                # 시세 자산: 현재가 × 수량 (USD는 × 현재 환율, 원금은 매수 시점 환율)
+                market_native = current_price * quantity
+                if is_usd:
+                    # USD 원본 금액 (달러 표시용) 냥~
+                    valuation["market_value_usd"] = market_native
+                    market_value = market_native * rate
+                    principal = cost_krw
+                else:
+                    market_value = market_native
+                    principal = average * quantity
+                profit_loss = market_value - principal
+            elif asset.get("current_value"):
+                # 시세 없이 current_value가 있는 자산 (현금, 금현물, 예금 등)
+                market_value = memo[asset["current_value"]]
+                if asset.get("asset_type") == "cash":
+                    # 현금은 수익 개념 없음 냥~ 💰
+                    principal = profit_loss = ZERO
+                else:
+                    principal = average * quantity
+                    profit_loss = market_value - principal
+            else:
+                market_value = principal = profit_loss = ZERO
+
+            # 티커 시세가 아예 없는 수동 입력 자산 표시용
+            if asset.get("current_value") and not (ticker and ticker in prices):
+                valuation["manual_value"] = True
+
+            # 수익률(%)은 표시용 float
+            profit_rate = float(profit_loss) / float(principal) * 100 if principal > 0 else 0.0
+
+            enriched.append(ValuedHolding.of(
+                asset,
+                current_exchange_rate=rate,
+                current_price=current_price,
+                market_value=market_value,
+                profit_loss=profit_loss,
+                profit_rate=profit_rate,
+                **valuation,
+            ))
+
+    return enriched
+
+
+def summary_columns(enriched: Sequence[Mapping], current_rate: Any) -> tuple[np.ndarray, np.ndarray]:
+    """
+    요약용 평가액/원금 열 냥~ (Money 단위 정수, object 배열)
+
+    - 평가액: enrich 결과의 market_value (이미 원화 환산)
+    - 원금: 평균단가 × 수량 (USD 자산은 × 매수시점 환율, 없으면 current_rate)
+    - 현금은 수익 계산에서 제외: 원금 = 평가액
+    """
+    market = scaled_column([asset.get("market_value", 0) for asset in enriched], MONEY_SCALE)
+    quantity = scaled_column([asset.get("quantity", 0) for asset in enriched], QUANTITY_SCALE)
+    average = scaled_column([asset.get("average_price", 0) for asset in enriched], MONEY_SCALE)
+
+    principal = round_div_column(average * quantity, 10 ** QUANTITY_SCALE)
+    is_usd = np.array([asset.get("currency", "KRW") == "USD" for asset in enriched], dtype=bool)
+    if is_usd.any():
+        rates = scaled_column([
+            asset.get("purchase_exchange_rate") or current_rate
+            for asset, usd in zip(enriched, is_usd.tolist()) if usd
+        ], RATE_SCALE)
+        principal[is_usd] = round_div_column(principal[is_usd] * rates, 10 ** RATE_SCALE)
+    is_cash = np.array([asset.get("asset_type") == "cash" for asset in enriched], dtype=bool)
+    principal[is_cash] = market[is_cash]
+    return market, principal
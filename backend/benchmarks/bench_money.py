@@ -0,0 +1,158 @@
+"""
+Money 마이크로 벤치마크 냥~ 🐱
+Decimal(str(x)) 경로와 고정소수점(Money/열 단위) 경로 비교
+행마다 Money 객체를 만드는 쪽은 C로 된 Decimal보다 느리고, 열 단위(scaled_column)가 빠름
+
+    cd backend && python -m benchmarks.bench_money [자산 수]
+"""
+import asyncio
+import random
+import sys
+import timeit
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from app.models.schemas import CategoryAllocation, DashboardSummary
+from app.services.asset_service import AssetService
+from app.services.money import (
+    MONEY_SCALE,
+    QUANTITY_SCALE,
+    RATE_SCALE,
+    Money,
+    Quantity,
+    round_div_column,
+    scaled_column,
+)
+
+
+RATE = 1385.5
+
+
+def make_assets(count: int, seed: int = 7) -> list[dict]:
+    """enrich_assets_with_prices() 결과 모양의 자산 목록 냥~"""
+    rng = random.Random(seed)
+    categories = ["국내주식", "해외주식", "코인", "현금"]
+    assets = []
+    for i in range(count):
+        currency = "USD" if i % 3 == 0 else "KRW"
+        quantity = rng.choice([rng.randint(1, 300), round(rng.uniform(0.001, 2), 8)])
+        average = round(rng.uniform(10, 500), 2) if currency == "USD" else float(rng.randint(1000, 500000))
+        assets.append({
+            "currency": currency,
+            "asset_type": "cash" if i % 17 == 0 else "stock",
+            "quantity": quantity,
+            "average_price": average,
+            "purchase_exchange_rate": round(rng.uniform(1100, 1450), 2) if currency == "USD" and i % 2 else None,
+            "market_value": average * quantity * rng.uniform(0.7, 1.5) * (RATE if currency == "USD" else 1),
+            "category_name": categories[i % len(categories)],
+            "category_id": None,
+        })
+    return assets
+
+
+def legacy_calculate_summary(assets: list[dict], exchange_rate: float) -> DashboardSummary:
+    """이전 calculate_summary (행마다 Decimal(str(x))) 냥~"""
+    current_rate = Decimal(str(exchange_rate))
+    total_value = Decimal("0")
+    total_principal = Decimal("0")
+    category_totals: dict[str, dict] = {}
+    for asset in assets:
+        market_value = Decimal(str(asset.get("market_value", 0)))
+        quantity = Decimal(str(asset.get("quantity", 0)))
+        avg_price = Decimal(str(asset.get("average_price", 0)))
+        if asset.get("asset_type") == "cash":
+            principal = market_value
+        elif asset.get("currency", "KRW") == "USD":
+            purchase_rate = asset.get("purchase_exchange_rate")
+            purchase_rate = Decimal(str(purchase_rate)) if purchase_rate else current_rate
+            principal = quantity * avg_price * purchase_rate
+        else:
+            principal = quantity * avg_price
+        total_value += market_value
+        total_principal += principal
+
+        cat_name = asset.get("category_name", "기타")
+        if cat_name not in category_totals:
+            category_totals[cat_name] = {
+                "category_id": asset.get("category_id"),
+                "color": asset.get("category_color", "#6b7280"),
+                "market_value": Decimal("0"),
+            }
+        category_totals[cat_name]["market_value"] += market_value
+
+    total_profit = total_value - total_principal
+    profit_rate = float((total_profit / total_principal * 100)) if total_principal > 0 else 0.0
+    allocations = [
+        CategoryAllocation(
+            category_id=None,
+            category_name=cat_name,
+            color=data["color"],
+            market_value=data["market_value"],
+            percentage=round(float(data["market_value"] / total_value * 100) if total_value > 0 else 0.0, 2),
+        )
+        for cat_name, data in category_totals.items()
+    ]
+    allocations.sort(key=lambda x: x.percentage, reverse=True)
+    return DashboardSummary(
+        total_value=total_value,
+        total_principal=total_principal,
+        total_profit=total_profit,
+        profit_rate=round(profit_rate, 2),
+        asset_count=len(assets),
+        allocations=allocations,
+        last_updated=datetime.now(),
+    )
+
+
+def bench(label: str, func, number: int) -> float:
+    best = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"  {label:<40} {best * 1e3:9.3f} ms")
+    return best
+
+
+def main(count: int = 5000) -> None:
+    assets = make_assets(count)
+    values = [asset["market_value"] for asset in assets]
+    service = AssetService(MagicMock())
+    number = max(1, 20000 // count)
+
+    print(f"🐱 자산 {count}개")
+
+    print("합계 (market_value)")
+    base = bench("Decimal(str(x)) 합", lambda: sum(Decimal(str(v)) for v in values), number)
+    scalar = bench("Money.of 합", lambda: sum(Money.of(v) for v in values), number)
+    column = bench("scaled_column 합", lambda: int(scaled_column(values, MONEY_SCALE).sum()), number)
+    print(f"  → Money.of x{base / scalar:.2f}, 열 단위 x{base / column:.2f}")
+
+    print("원금 (평균단가 × 수량 × 환율)")
+    base = bench("Decimal", lambda: [
+        Decimal(str(a["average_price"])) * Decimal(str(a["quantity"])) * Decimal(str(RATE)) for a in assets
+    ], number)
+    scalar = bench("Money × Quantity", lambda: [
+        (Money.of(a["average_price"], "USD") * Quantity.of(a["quantity"])).convert(RATE) for a in assets
+    ], number)
+    average = [asset["average_price"] for asset in assets]
+    quantity = [asset["quantity"] for asset in assets]
+    column = bench("scaled_column × 열", lambda: round_div_column(
+        round_div_column(
+            scaled_column(average, MONEY_SCALE) * scaled_column(quantity, QUANTITY_SCALE), 10 ** QUANTITY_SCALE
+        ) * scaled_column([RATE] * len(assets), RATE_SCALE),
+        10 ** RATE_SCALE,
+    ), number)
+    print(f"  → Money × Quantity x{base / scalar:.2f}, 열 단위 x{base / column:.2f}")
+
+    print("calculate_summary")
+    base = bench("이전 Decimal 루프", lambda: legacy_calculate_summary(assets, RATE), number)
+    loop = asyncio.new_event_loop()
+    summary = bench(
+        "AssetService.calculate_summary",
+        lambda: loop.run_until_complete(service.calculate_summary(assets, exchange_rate=RATE)),
+        number,
+    )
+    loop.close()
+    print(f"  → x{base / summary:.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
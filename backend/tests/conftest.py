@@ -1,9 +1,22 @@
 """
 pytest 설정 및 fixtures 냥~ 🐱
 """
+import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 from app.main import app
+from app.services.finance_service import FinanceService
+from app.services.portfolio_state import portfolio_states
+from app.services.ticker_metadata import ticker_metadata
+from app.services.upstream_guard import upstream_guard
+
+
+@pytest.fixture(autouse=True)
+def reset_upstream_guard():
+    """테스트 간 업스트림 가드 상태(서킷, 동시성 limit) 초기화 냥~"""
+    upstream_guard.reset()
+    yield
+    upstream_guard.reset()
 
 
 @pytest_asyncio.fixture
@@ -12,3 +25,27 @@ async def client():
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
+
+
+@pytest.fixture(autouse=True)
+def clear_ticker_metadata():
+    """테스트 간 티커 메타데이터 캐시 비우기 냥~"""
+    ticker_metadata.clear()
+    yield
+    ticker_metadata.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_fundamentals():
+    """테스트 간 펀더멘털 캐시 비우기 냥~"""
+    FinanceService._fundamentals_cache.clear()
+    yield
+    FinanceService._fundamentals_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_portfolio_states():
+    """테스트 간 포트폴리오 평가 상태 비우기 냥~"""
+    portfolio_states.clear()
+    yield
+    portfolio_states.clear()
@@ -2,6 +2,9 @@
 AssetService 단위 테스트 냥~ 🐱
 v0.6.0: USD 원화 환산 테스트 추가 (exchange_rate 파라미터 방식)
 """
+import asyncio
+import threading
+import time
 import pytest
 from decimal import Decimal
 from unittest.mock import MagicMock
@@ -511,3 +514,36 @@ class TestEdgeCases:
 
         assert summary.total_value == Decimal("1000000")
         assert summary.total_principal == Decimal("1000000")
+
+
+class TestNonBlockingDb:
+    """DB 호출이 이벤트 루프를 막지 않는지 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_execute_runs_off_event_loop(self):
+        """느린 쿼리가 도는 동안에도 다른 코루틴이 진행됨 냥~"""
+        query_threads = []
+
+        def slow_execute():
+            query_threads.append(threading.get_ident())
+            time.sleep(0.1)
+            return MagicMock(data=[{"id": "550e8400-e29b-41d4-a716-446655440000"}])
+
+        db = MagicMock()
+        db.table.return_value.select.return_value.execute.side_effect = slow_execute
+        service = AssetService(db)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ids, _ = await asyncio.gather(service.get_all_portfolio_ids(), ticker())
+
+        assert len(ids) == 1
+        assert query_threads[0] != threading.get_ident()
+        # 쿼리가 끝나기 전에 다른 코루틴이 모두 돌았어야 함
+        assert ticks == 5
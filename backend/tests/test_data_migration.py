@@ -1,6 +1,10 @@
 """
 데이터 마이그레이션 API 테스트 냥~ 🐱
 """
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
 import pytest
 from httpx import AsyncClient
 
@@ -87,3 +91,53 @@ async def test_export_import_roundtrip(client: AsyncClient):
     data = import_response.json()
     assert data["success"] == True
     assert "stats" in data
+
+
+@pytest.mark.asyncio
+async def test_import_replace_invalidates_portfolio_state():
+    """replace 가져오기 후 대시보드 요약은 가져온 자산 기준 냥~ (캐시된 평가 상태 버림)"""
+    from app.api.v1.data_migration import ImportRequest, import_data
+    from app.services.fx_matrix import FxMatrix
+    from app.services.holdings import Holding
+    from app.services.portfolio_state import portfolio_states
+
+    portfolio_id = uuid4()
+    category_id = uuid4()
+    db = {"assets": [Holding(
+        id=uuid4(), portfolio_id=portfolio_id, category_id=category_id, name="비상금",
+        ticker=None, asset_type="cash", currency="KRW", quantity=Decimal("1"),
+        average_price=Decimal("0"), current_value=Decimal("1000000"), is_active=True,
+        category_name="현금", category_color="#22c55e",
+    )]}
+
+    class FakeAssetService:
+        async def get_assets(self, portfolio_id=None):
+            return list(db["assets"])
+
+    class FakeFinanceService:
+        async def get_multiple_prices(self, tickers):
+            return {}
+
+        async def get_fx_matrix(self, currencies=()):
+            return FxMatrix({"USD": 1350.0})
+
+    state = await portfolio_states.get(portfolio_id, FakeAssetService(), FakeFinanceService())
+    assert state.summary().total_value == Decimal("1000000")
+
+    async def fake_execute(query):
+        # replace: 기존 포트폴리오를 지우고 가져온 자산으로 교체
+        db["assets"] = [Holding(**{**db["assets"][0], "id": uuid4(), "current_value": Decimal("2500000")})]
+        return MagicMock(data=[{"id": str(portfolio_id)}])
+
+    request = ImportRequest(data={
+        "schema_version": "1.0.0",
+        "portfolios": [{"name": "기본 포트폴리오"}],
+        "assets": [{"name": "비상금", "asset_type": "cash", "current_value": 2500000}],
+    }, merge_strategy="replace")
+    with patch("app.api.v1.data_migration.execute", side_effect=fake_execute), \
+            patch("app.api.v1.data_migration.supabase"):
+        result = await import_data(request)
+
+    assert result["success"]
+    state = await portfolio_states.get(portfolio_id, FakeAssetService(), FakeFinanceService())
+    assert state.summary().total_value == Decimal("2500000")
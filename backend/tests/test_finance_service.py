@@ -2,11 +2,23 @@
 FinanceService 단위 테스트 냥~ 🐱
 v0.7.2: current_value 자산(현금, 금 등) 처리 테스트
 """
+import asyncio
+import threading
+import time
+
 import pytest
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
 from decimal import Decimal
 from unittest.mock import MagicMock, AsyncMock, patch
 
 from app.services.finance_service import FinanceService
+from app.services.quote_cache import quote_cache
+from app.services.fx_matrix import FxMatrix
+from app.services.history_store import HistoryStore
+from app.services.holdings import Holding
+from app.services.ticker_metadata import ticker_metadata
 
 
 class TestEnrichAssetsWithPrices:
@@ -275,3 +287,382 @@ class TestEnrichAssetsWithPrices:
 
         # current_value가 USD이므로 그대로 저장 (원화 환산은 summary에서)
         assert usd_cash["market_value"] == Decimal("1000")
+
+
+class TestBatchQuotes:
+    """일괄 시세 조회 엔진 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        quote_cache.clear()
+        yield
+        quote_cache.clear()
+
+    @pytest.fixture
+    def service(self):
+        return FinanceService()
+
+    @staticmethod
+    def _download_frame(closes: dict[str, list]) -> pd.DataFrame:
+        """yf.download(group_by="column") 형태의 DataFrame 생성 냥~"""
+        index = pd.DatetimeIndex(["2026-10-14", "2026-10-15"])
+        columns = pd.MultiIndex.from_product([["Close", "Open"], list(closes)])
+        rows = []
+        for i in range(len(index)):
+            row = [closes[t][i] for t in closes] * 2
+            rows.append(row)
+        return pd.DataFrame(rows, index=index, columns=columns)
+
+    def test_parse_batch_download(self, service):
+        """일괄 다운로드 결과를 개별 조회와 같은 형태로 변환 냥~"""
+        for ticker, currency, exchange in [("AAPL", "USD", "NMS"), ("005930.KS", "KRW", "KSC")]:
+            ticker_metadata.remember(ticker, {"currency": currency, "exchange": exchange, "valid": True})
+        frame = self._download_frame({
+            "AAPL": [200.0, 210.0],
+            "005930.KS": [70000.0, float("nan")],
+            "ZZZ": [float("nan"), float("nan")],
+        })
+
+        with patch("app.services.market_data.yf.download", return_value=frame):
+            results = service._get_batch_quotes_sync(["AAPL", "005930.KS", "ZZZ"])
+
+        assert results["AAPL"]["current_price"] == 210.0
+        assert results["AAPL"]["valid"] is True
+        # 마지막 값이 NaN이면 직전 종가 사용
+        assert results["005930.KS"]["current_price"] == 70000.0
+        assert results["005930.KS"]["currency"] == "KRW"
+        assert results["005930.KS"]["exchange"] == "KSC"
+        # 데이터가 없는 티커는 결과에서 제외
+        assert "ZZZ" not in results
+
+    @pytest.mark.asyncio
+    async def test_batch_quote_uses_market_hours_ttl(self, service):
+        """배치 시세에도 거래소를 채워서 장 시간 TTL 적용 냥~ (거래소만 다른 캐시에 있어도)"""
+        ticker_metadata.remember("AAPL", {"name": "Apple Inc.", "currency": "USD", "exchange": None, "valid": True})
+        frame = self._download_frame({"AAPL": [200.0, 210.0]})
+
+        with patch("app.services.market_data.yf.download", return_value=frame), \
+                patch.object(service, "_persisted_sync", return_value={"exchange": "NMS"}), \
+                patch("app.services.finance_service.quote_ttl", return_value=60.0) as mock_ttl:
+            results = await service.get_multiple_prices(["AAPL"])
+
+        assert results["AAPL"]["exchange"] == "NMS"
+        mock_ttl.assert_called_with("AAPL", "NMS")
+
+    def test_batch_skips_unknown_metadata(self, service):
+        """통화/거래소를 모르는 티커는 배치 결과에서 빼서 개별 조회로 넘김 냥~"""
+        frame = self._download_frame({"AAPL": [200.0, 210.0], "005930.KS": [70000.0, 71000.0]})
+
+        with patch("app.services.market_data.yf.download", return_value=frame):
+            results = service._get_batch_quotes_sync(["AAPL", "005930.KS"])
+
+        assert results == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_path_converts_usd_ticker_in_krw_asset(self, service):
+        """KRW 자산에 든 USD 티커도 배치 경로에서 환율 환산 냥~ (처음엔 개별 조회로 통화 확인)"""
+        asset = Holding(
+            id="a-1", name="애플", ticker="AAPL", currency="KRW", asset_type="stock",
+            quantity=Decimal("2"), average_price=Decimal("300000"), current_value=None,
+        )
+        fx = FxMatrix({"USD": 1400.0})
+        info = {"currentPrice": 29.83, "currency": "USD", "exchange": "NMS", "shortName": "Apple Inc."}
+        frame = self._download_frame({"AAPL": [29.0, 30.0]})
+
+        with patch("app.services.market_data.yf.download", return_value=frame), \
+                patch("app.services.market_data.yf.Ticker") as mock_ticker:
+            mock_ticker.return_value.info = info
+            first = await service.enrich_assets_with_prices([asset], fx)
+            quote_cache.clear()
+            second = await service.enrich_assets_with_prices([asset], fx)
+
+        mock_ticker.assert_called_once_with("AAPL")
+        assert first[0]["current_price"] == pytest.approx(29.83 * 1400)
+        # 두 번째는 기억한 메타데이터로 배치 종가만 사용
+        assert second[0]["current_price"] == pytest.approx(30.0 * 1400)
+        assert quote_cache.peek("AAPL")["exchange"] == "NMS"
+
+    def test_batch_keeps_known_metadata(self, service):
+        """이전에 조회한 이름/통화는 배치 결과에 유지 냥~"""
+        quote_cache.set("AAPL", {
+            "ticker": "AAPL", "current_price": 190.0, "currency": "USD",
+            "name": "Apple Inc.", "exchange": "NMS", "valid": True,
+        })
+        frame = self._download_frame({"AAPL": [200.0, 210.0]})
+
+        with patch("app.services.market_data.yf.download", return_value=frame):
+            results = service._get_batch_quotes_sync(["AAPL"])
+
+        assert results["AAPL"]["currency"] == "USD"
+        assert results["AAPL"]["name"] == "Apple Inc."
+
+    @pytest.mark.asyncio
+    async def test_multiple_prices_uses_batch_and_falls_back(self, service):
+        """배치에 없는 티커만 개별 조회로 폴백 냥~"""
+        batch = {
+            "AAPL": {"ticker": "AAPL", "current_price": 210.0, "currency": "USD", "valid": True},
+        }
+        single = {"ticker": "BRK.B", "current_price": 480.0, "currency": "USD", "valid": True}
+
+        with patch.object(FinanceService, "_get_batch_quotes_sync", return_value=batch) as mock_batch, \
+                patch.object(FinanceService, "_get_stock_info_sync", return_value=single) as mock_single:
+            results = await service.get_multiple_prices(["AAPL", "BRK.B", "AAPL"])
+
+        assert mock_batch.call_count == 1
+        assert mock_batch.call_args.args[0] == ["AAPL", "BRK.B"]
+        mock_single.assert_called_once_with("BRK.B")
+        assert results["AAPL"]["current_price"] == 210.0
+        assert results["BRK.B"]["current_price"] == 480.0
+
+    @pytest.mark.asyncio
+    async def test_multiple_prices_chunked(self, service):
+        """quote_batch_size 단위로 청크 분할 냥~"""
+        tickers = [f"T{i}" for i in range(5)]
+
+        def fake_batch(chunk):
+            return {t: {"ticker": t, "current_price": 1.0, "currency": "USD", "valid": True} for t in chunk}
+
+        with patch("app.services.finance_service.settings.quote_batch_size", 2), \
+                patch.object(FinanceService, "_get_batch_quotes_sync", side_effect=fake_batch) as mock_batch:
+            results = await service.get_multiple_prices(tickers)
+
+        assert mock_batch.call_count == 3
+        assert set(results) == set(tickers)
+
+    @pytest.mark.asyncio
+    async def test_multiple_prices_served_from_cache(self, service):
+        """캐시에 있는 티커는 다시 조회하지 않음 냥~"""
+        quote_cache.set("AAPL", {"ticker": "AAPL", "current_price": 210.0, "valid": True})
+
+        with patch.object(FinanceService, "_get_batch_quotes_sync", return_value={}) as mock_batch:
+            results = await service.get_multiple_prices(["AAPL"])
+
+        mock_batch.assert_not_called()
+        assert results["AAPL"]["current_price"] == 210.0
+
+
+class TestFinanceServiceLifecycle:
+    """앱 전체 싱글톤 및 스레드 풀 수명 관리 테스트"""
+
+    def test_singleton_shared(self):
+        """get_finance_service는 같은 인스턴스를 반환 냥~"""
+        from app.services.finance_service import get_finance_service
+
+        assert get_finance_service() is get_finance_service()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_executor(self):
+        """종료 시 스레드 풀을 닫고 다음 호출에서 새로 생성 냥~"""
+        from app.services.finance_service import (
+            init_finance_service,
+            close_finance_service,
+            get_finance_service,
+        )
+
+        service = init_finance_service()
+        await close_finance_service()
+
+        assert service._executor._shutdown is True
+        assert get_finance_service() is not service
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_running_work(self):
+        """종료 시 실행 중인 작업은 끝날 때까지 기다리고, 대기열 작업은 취소 냥~"""
+        service = FinanceService(max_workers=1)
+        finished = []
+
+        def work():
+            time.sleep(0.1)
+            finished.append(True)
+
+        running = service._executor.submit(work)
+        queued = service._executor.submit(work)
+        await service.aclose()
+
+        assert running.done() and finished == [True]
+        assert queued.cancelled()
+
+    def test_close_bounded_by_timeout(self):
+        """멈춘 작업은 timeout까지만 기다림 냥~"""
+        release = threading.Event()
+        service = FinanceService(max_workers=1)
+        service._executor.submit(release.wait, 5)
+
+        started = time.monotonic()
+        service.close(timeout=0.05)
+        assert time.monotonic() - started < 1
+        release.set()
+
+    def test_executor_bounded_by_settings(self):
+        """스레드 풀 크기는 설정값을 따름 냥~"""
+        with patch("app.services.finance_service.settings.finance_max_workers", 3):
+            service = FinanceService()
+        assert service._executor._max_workers == 3
+        service.close()
+
+    def test_rebalance_service_receives_shared_instance(self):
+        """RebalanceService는 주입받은 FinanceService를 사용 냥~"""
+        from app.services.rebalance_service import RebalanceService
+
+        shared = FinanceService()
+        with patch("app.services.rebalance_service.get_supabase_client"):
+            rebalance_service = RebalanceService(shared)
+        assert rebalance_service.finance_service is shared
+        shared.close()
+
+
+class TestExchangeRate:
+    """환율 캐시 및 환율 매트릭스 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        quote_cache.clear()
+        FinanceService._exchange_rate_cache.clear()
+        yield
+        quote_cache.clear()
+        FinanceService._exchange_rate_cache.clear()
+
+    @pytest.fixture
+    def service(self):
+        return FinanceService()
+
+    def test_fx_matrix_triangulation(self):
+        """KRW 경유 삼각 환산 냥~"""
+        fx = FxMatrix({"USD": 1400.0, "JPY": 9.5})
+
+        assert fx.rate("USD") == 1400.0
+        assert fx.rate("KRW", "KRW") == 1.0
+        assert fx.rate("USD", "JPY") == pytest.approx(1400.0 / 9.5)
+        assert fx.rate("KRW", "USD") == pytest.approx(1 / 1400.0)
+        assert fx.rate("EUR") is None
+        assert fx.decimal_rate("USD") == Decimal("1400.0")
+
+    @pytest.mark.asyncio
+    async def test_exchange_rate_served_from_cache_within_ttl(self, service):
+        """TTL 이내 환율은 재조회하지 않음 냥~"""
+        with patch.object(service, "get_stock_price", new_callable=AsyncMock) as mock_price:
+            mock_price.return_value = {"current_price": 1400.0, "valid": True}
+
+            first = await service.get_exchange_rate()
+            second = await service.get_exchange_rate()
+
+        assert first == second == 1400.0
+        assert mock_price.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fx_matrix_fetches_each_currency_once(self, service):
+        """필요한 통화만 한 번씩 조회, 실패한 통화는 USD 기본값을 쓰지 않음 냥~"""
+        quotes = {
+            "USDKRW=X": {"current_price": 1400.0, "valid": True},
+            "JPYKRW=X": {"current_price": 9.5, "valid": True},
+            "EURKRW=X": {"current_price": None, "valid": False},
+        }
+
+        async def fake_price(ticker):
+            return quotes[ticker]
+
+        with patch.object(service, "get_stock_price", side_effect=fake_price) as mock_price:
+            fx = await service.get_fx_matrix(["KRW", "USD", "JPY", "JPY", "EUR", None])
+
+        assert mock_price.call_count == 3
+        assert fx.rates == {"USD": 1400.0, "JPY": 9.5}
+
+    @pytest.mark.asyncio
+    async def test_enrich_uses_given_fx_matrix(self, service):
+        """환율 매트릭스를 넘기면 환율을 다시 조회하지 않음 냥~"""
+        assets = [{
+            "id": "jp-1",
+            "name": "토요타",
+            "ticker": "7203.T",
+            "quantity": 10,
+            "average_price": 25000,
+            "currency": "KRW",
+        }]
+        fx = FxMatrix({"USD": 1400.0, "JPY": 9.5})
+
+        with patch.object(service, "get_multiple_prices", new_callable=AsyncMock) as mock_prices:
+            with patch.object(service, "get_exchange_rate", new_callable=AsyncMock) as mock_rate:
+                mock_prices.return_value = {
+                    "7203.T": {"current_price": 3000.0, "currency": "JPY", "valid": True},
+                }
+                enriched = await service.enrich_assets_with_prices(assets, fx)
+
+        mock_rate.assert_not_called()
+        # JPY 시세가 KRW 자산 통화로 환산됨
+        assert enriched[0]["current_price"] == pytest.approx(Decimal(str(3000.0 * 9.5)))
+
+
+class TestHistoryFromStore:
+    """히스토리 조회가 로컬 저장소를 거치는지 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_ticker_history_reads_store(self, tmp_path):
+        """두 번째 스파크라인 조회는 yfinance 없이 로컬에서 냥~"""
+        end = date.today()
+        dates = np.array([end - timedelta(days=1), end], dtype="datetime64[D]")
+        closes = np.array([100.0, 110.0])
+
+        with patch("app.services.finance_service.history_store", HistoryStore(tmp_path, refresh_seconds=3600)):
+            with patch.object(FinanceService, "_fetch_history_sync", return_value=(dates, closes)) as mock_fetch:
+                service = FinanceService()
+                first = service._get_ticker_history_sync("^KS11", 30)
+                second = service._get_ticker_history_sync("^KS11", 30)
+
+        assert mock_fetch.call_count == 1
+        assert first == second
+        assert first["change_rate"] == 10.0
+        assert first["data"][-1] == {"date": end.isoformat(), "close": 110.0}
+
+
+class TestFundamentals:
+    """펀더멘털 병렬 조회 + 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_index_per_fetched_concurrently(self):
+        """SPY/QQQ/EWY를 순서대로가 아니라 동시에 조회 냥~"""
+        def slow_info(ticker):
+            time.sleep(0.1)
+            return {"trailingPE": 20.0}
+
+        service = FinanceService()
+        with patch.object(service.provider, "fundamentals", side_effect=slow_info):
+            started = time.perf_counter()
+            per = await service.get_index_per()
+            elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.25
+        assert [item["per"] for item in per.values()] == [20.0, 20.0, 20.0]
+        assert all(item["type"] == "trailing" for item in per.values())
+
+    @pytest.mark.asyncio
+    async def test_per_cached(self):
+        """PER은 캐시에서 재사용, 업스트림은 티커당 한 번 냥~"""
+        service = FinanceService()
+        with patch.object(service.provider, "fundamentals", return_value={"forwardPE": 15.0}) as mock_info:
+            await service.get_index_per()
+            per = await service.get_index_per()
+
+        assert mock_info.call_count == 3
+        assert per["kospi"] == {
+            "label": "KOSPI (EWY)", "ticker": "EWY", "per": 15.0, "type": "forward", "valid": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_fetch(self):
+        """같은 티커를 동시에 요청하면 한 번만 조회 냥~"""
+        service = FinanceService()
+        with patch.object(service.provider, "fundamentals", return_value={"trailingPE": 30.0}) as mock_info:
+            results = await asyncio.gather(*[service.get_fundamentals(["SPY"]) for _ in range(5)])
+
+        assert mock_info.call_count == 1
+        assert all(result["SPY"]["trailingPE"] == 30.0 for result in results)
+
+    @pytest.mark.asyncio
+    async def test_failure_falls_back_to_expired(self):
+        """조회 실패 시 만료된 값으로 폴백, 그것도 없으면 None 냥~"""
+        FinanceService._fundamentals_cache.set("SPY", {"trailingPE": 25.0}, ttl_seconds=-1)
+        service = FinanceService()
+        with patch.object(service.provider, "fundamentals", side_effect=RuntimeError("429")):
+            result = await service.get_fundamentals(["SPY", "QQQ"], ttl_seconds=60)
+
+        assert result == {"SPY": {"trailingPE": 25.0}, "QQQ": None}
@@ -0,0 +1,149 @@
+"""
+HistoryStore 단위 테스트 냥~ 🐱
+디스크 저장, 꼬리만 추가 조회, backfill, 당일 종가 갱신 확인
+"""
+import numpy as np
+import pytest
+from datetime import date, timedelta
+
+from app.services.history_store import HistoryStore
+
+
+class FakeClock:
+    """테스트용 시계 냥~"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeFetcher:
+    """일별 종가를 날짜로 만들어주는 가짜 yfinance 냥~ (close = 일자 서수)"""
+
+    def __init__(self, bump: float = 0.0):
+        self.calls = []
+        self.bump = bump
+
+    def __call__(self, ticker, start, end):
+        self.calls.append((start, end))
+        days = (end - start).days + 1
+        dates = np.array([start + timedelta(days=i) for i in range(days)], dtype="datetime64[D]")
+        closes = np.array([float((start + timedelta(days=i)).toordinal()) for i in range(days)]) + self.bump
+        return dates, closes
+
+
+class TestHistoryStore:
+    """HistoryStore 동작 테스트"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def store(self, tmp_path, clock):
+        return HistoryStore(tmp_path, refresh_seconds=60, clock=clock)
+
+    def test_first_call_fetches_and_persists(self, store, tmp_path):
+        """처음 조회는 전체 구간을 받아서 파일로 저장 냥~"""
+        fetch = FakeFetcher()
+        start, end = date.today() - timedelta(days=9), date.today()
+
+        dates, closes = store.get_closes("^KS11", start, end, fetch)
+
+        assert fetch.calls == [(start, end)]
+        assert len(dates) == 10
+        assert (tmp_path / "_KS11.npz").exists()
+
+    def test_repeat_call_served_locally(self, store):
+        """refresh 주기 안의 같은 요청은 조회하지 않음 냥~"""
+        fetch = FakeFetcher()
+        start, end = date.today() - timedelta(days=9), date.today()
+
+        store.get_closes("SPY", start, end, fetch)
+        dates, _ = store.get_closes("SPY", start + timedelta(days=3), end, fetch)
+
+        assert len(fetch.calls) == 1
+        assert dates[0] == np.datetime64(start + timedelta(days=3))
+
+    def test_only_tail_fetched_after_refresh(self, store, clock):
+        """refresh 주기가 지나면 마지막 저장일부터만 받아서 덮어씀 냥~"""
+        fetch = FakeFetcher()
+        start, end = date.today() - timedelta(days=9), date.today()
+        store.get_closes("SPY", start, end, fetch)
+
+        clock.now += 61
+        fetch.bump = 0.5  # 당일 종가가 바뀐 상황
+        _, closes = store.get_closes("SPY", start, end, fetch)
+
+        assert fetch.calls[-1] == (end, end)
+        assert closes[-1] == end.toordinal() + 0.5
+        assert closes[0] == start.toordinal()
+
+    def test_backfill_only_missing_head(self, store):
+        """더 앞 구간 요청은 앞부분만 추가로 받음 냥~"""
+        fetch = FakeFetcher()
+        end = date.today()
+        store.get_closes("SPY", end - timedelta(days=4), end, fetch)
+        dates, _ = store.get_closes("SPY", end - timedelta(days=9), end, fetch)
+
+        assert fetch.calls[-1] == (end - timedelta(days=9), end - timedelta(days=5))
+        assert len(dates) == 10
+
+    def test_past_range_never_refetched(self, store, clock):
+        """지난 구간만 요청하면 refresh 주기가 지나도 조회하지 않음 냥~"""
+        fetch = FakeFetcher()
+        end = date.today()
+        store.get_closes("SPY", end - timedelta(days=30), end, fetch)
+
+        clock.now += 3600
+        store.get_closes("SPY", end - timedelta(days=30), end - timedelta(days=10), fetch)
+
+        assert len(fetch.calls) == 1
+
+    def test_survives_restart(self, tmp_path, clock):
+        """새 인스턴스도 디스크에서 읽어서 재사용 냥~"""
+        fetch = FakeFetcher()
+        start, end = date.today() - timedelta(days=9), date.today()
+        HistoryStore(tmp_path, refresh_seconds=60, clock=clock).get_closes("SPY", start, end, fetch)
+
+        dates, _ = HistoryStore(tmp_path, refresh_seconds=60, clock=clock).get_closes("SPY", start, end, fetch)
+
+        assert len(fetch.calls) == 1
+        assert len(dates) == 10
+
+    def test_empty_fetch_not_persisted(self, store, tmp_path):
+        """빈 결과(조회 실패)는 저장하지 않고 다음에 다시 조회 냥~"""
+        calls = []
+
+        def failing(ticker, start, end):
+            calls.append((start, end))
+            return np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float64)
+
+        store.get_closes("ZZZ", date.today(), date.today(), failing)
+        store.get_closes("ZZZ", date.today(), date.today(), failing)
+
+        assert len(calls) == 2
+        assert not list(tmp_path.iterdir())
+
+    @pytest.mark.asyncio
+    async def test_async_fetch_same_steps(self, store, clock):
+        """비동기 조회 함수도 같은 구간만 받음 냥~ (backfill + 꼬리)"""
+        fetch = FakeFetcher()
+
+        async def fetch_async(ticker, start, end):
+            return fetch(ticker, start, end)
+
+        end = date.today()
+        await store.get_closes_async("SPY", end - timedelta(days=4), end, fetch_async)
+        clock.now += 61
+        dates, closes = await store.get_closes_async("SPY", end - timedelta(days=9), end, fetch_async)
+
+        assert fetch.calls == [
+            (end - timedelta(days=4), end),
+            (end - timedelta(days=9), end - timedelta(days=5)),
+            (end, end),
+        ]
+        assert len(dates) == 10
+        assert closes[-1] == float(end.toordinal())
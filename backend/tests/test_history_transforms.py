@@ -0,0 +1,72 @@
+"""
+히스토리 변환 단위 테스트 냥~ 🐱
+기존 iterrows 루프와 같은 결과인지 확인
+"""
+import numpy as np
+import pandas as pd
+from decimal import Decimal
+
+from app.services.history_transforms import benchmark_points, sparkline, change_rate
+
+
+def _series(closes: list[float]) -> pd.Series:
+    index = pd.date_range("2026-01-01", periods=len(closes), freq="D", tz="Asia/Seoul")
+    return pd.Series(closes, index=index, dtype=np.float64)
+
+
+def _legacy_benchmark(history: pd.Series) -> list[dict]:
+    """기존 행 단위 구현 냥~ (비교용)"""
+    data = []
+    first_close = None
+    for idx, close in history.items():
+        close = float(close)
+        if first_close is None:
+            first_close = close
+        return_rate = ((close - first_close) / first_close) * 100 if first_close else 0
+        data.append({
+            "date": idx.date(),
+            "close": Decimal(str(round(close, 2))),
+            "return_rate": round(return_rate, 2),
+        })
+    return data
+
+
+class TestBenchmarkPoints:
+    """benchmark_points 테스트"""
+
+    def test_matches_row_loop(self):
+        """행 단위 구현과 같은 결과 냥~"""
+        rng = np.random.default_rng(7)
+        closes = (2500 + rng.normal(0, 20, 500).cumsum()).round(3).tolist()
+        history = _series(closes)
+
+        assert benchmark_points(history) == _legacy_benchmark(history)
+
+    def test_types_are_json_friendly(self):
+        """numpy 타입이 아닌 파이썬 타입으로 반환 냥~"""
+        point = benchmark_points(_series([100.0, 110.0]))[-1]
+        assert type(point["return_rate"]) is float
+        assert point["close"] == Decimal("110.0")
+        assert point["return_rate"] == 10.0
+
+    def test_empty(self):
+        assert benchmark_points(_series([])) == []
+
+
+class TestSparkline:
+    """sparkline 테스트"""
+
+    def test_sparkline(self):
+        """날짜 문자열, 반올림 종가, 변화율 냥~"""
+        result = sparkline("^KS11", _series([100.0, 105.123, 90.0]))
+
+        assert result["ticker"] == "^KS11"
+        assert result["data"][1] == {"date": "2026-01-02", "close": 105.12}
+        assert result["change_rate"] == -10.0
+
+    def test_zero_first_close(self):
+        """첫 종가가 0이면 변화율 0 냥~"""
+        assert change_rate(np.array([0.0, 10.0])) == 0.0
+
+    def test_empty(self):
+        assert sparkline("X", _series([])) == {"ticker": "X", "data": [], "change_rate": 0.0}
@@ -0,0 +1,119 @@
+"""
+보유 자산 레코드 단위 테스트 냥~ 🐱
+DB 행 파싱(UUID/Decimal), Mapping 동작, 평가 레코드, AssetResponse 직렬화 확인
+"""
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from app.models.schemas import AssetResponse
+from app.services.fx_matrix import FxMatrix
+from app.services.holdings import Holding, ValuedHolding, as_uuid, asset_key
+from app.services.valuation_engine import value_assets
+
+
+ASSET_ID = "3f1c1e7e-2c4a-4c55-9d7e-1c1d1e1f1a1b"
+PORTFOLIO_ID = "0a1b2c3d-0000-4000-8000-000000000001"
+
+
+def _row(**overrides) -> dict:
+    """supabase assets 행 (카테고리 조인 포함) 냥~"""
+    row = {
+        "id": ASSET_ID,
+        "portfolio_id": PORTFOLIO_ID,
+        "category_id": None,
+        "name": "Apple",
+        "ticker": "AAPL",
+        "asset_type": "stock",
+        "quantity": 3.5,
+        "average_price": 150.25,
+        "currency": "USD",
+        "current_value": None,
+        "purchase_exchange_rate": 1300,
+        "notes": None,
+        "is_active": True,
+        "created_at": "2026-01-02T03:04:05+00:00",
+        "updated_at": "2026-01-02T03:04:05+00:00",
+        "asset_categories": {"name": "해외주식", "color": "#3b82f6", "icon": "🌎"},
+    }
+    row.update(overrides)
+    return row
+
+
+class TestHolding:
+    """Holding 테스트"""
+
+    def test_from_row_parses_once(self):
+        """UUID/Decimal 변환과 카테고리 평탄화는 로드할 때 냥~"""
+        holding = Holding.from_row(_row())
+
+        assert holding.id == UUID(ASSET_ID)
+        assert holding.portfolio_id == UUID(PORTFOLIO_ID)
+        assert holding.quantity == Decimal("3.5")
+        assert holding.purchase_exchange_rate == Decimal("1300")
+        assert holding.current_value is None
+        assert holding.category_name == "해외주식"
+        assert holding.key == ASSET_ID
+        assert "asset_categories" not in holding
+
+    def test_mapping_like_dict(self):
+        """asset["ticker"], asset.get(...), in 모두 dict처럼 냥~"""
+        holding = Holding.from_row(_row(asset_categories=None))
+
+        assert holding["ticker"] == "AAPL"
+        assert holding.get("category_name", "기타") == "기타"
+        assert "category_name" not in holding
+        with pytest.raises(KeyError):
+            holding["market_value"]
+        assert {**holding}["currency"] == "USD"
+
+    def test_unknown_columns_ignored(self):
+        """DB에 새 컬럼이 생겨도 무시 냥~"""
+        holding = Holding.from_row(_row(new_column=1))
+        assert "new_column" not in holding
+
+    def test_slotted(self):
+        """인스턴스 dict 없음 냥~"""
+        holding = Holding.from_row(_row())
+        assert not hasattr(holding, "__dict__")
+        with pytest.raises(AttributeError):
+            holding.something = 1
+
+    def test_asset_key(self):
+        """Holding은 저장된 id 문자열, dict는 str(id) 냥~"""
+        assert asset_key(Holding.from_row(_row())) == ASSET_ID
+        assert asset_key({"id": UUID(ASSET_ID)}) == ASSET_ID
+
+    def test_as_uuid(self):
+        assert as_uuid(ASSET_ID) == UUID(ASSET_ID)
+        assert as_uuid(UUID(ASSET_ID)) == UUID(ASSET_ID)
+        assert as_uuid(None) is None
+
+
+class TestValuedHolding:
+    """ValuedHolding 테스트"""
+
+    def test_value_assets_returns_records(self):
+        """평가 결과는 원본을 건드리지 않는 새 레코드 냥~"""
+        holding = Holding.from_row(_row())
+        valued = value_assets([holding], {"AAPL": {"current_price": 200.0, "currency": "USD"}}, FxMatrix({"USD": 1400}))[0]
+
+        assert isinstance(valued, ValuedHolding)
+        assert valued.key == holding.key
+        assert valued["market_value"] == Decimal("980000.0")
+        assert valued["cost_basis_krw"] == Decimal("683637.500")
+        assert "manual_value" not in valued
+        assert "market_value" not in holding
+
+    def test_serializes_to_asset_response(self):
+        """AssetResponse로 바로 직렬화 냥~"""
+        holding = Holding.from_row(_row())
+        valued = value_assets([holding], {"AAPL": {"current_price": 200.0, "currency": "USD"}}, FxMatrix({"USD": 1400}))[0]
+
+        response = AssetResponse.model_validate(valued)
+
+        assert response.id == UUID(ASSET_ID)
+        assert response.market_value == Decimal("980000.0")
+        assert response.market_value_usd == Decimal("700.00")
+        assert response.category_name == "해외주식"
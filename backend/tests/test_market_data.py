@@ -0,0 +1,316 @@
+"""
+시세 제공자 단위 테스트 냥~ 🐱
+가상(local) 제공자의 재현성, 지연/실패 설정, 야후 chart 비동기 제공자, FinanceService 연동 확인
+"""
+from datetime import date, timedelta
+
+import httpx
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from app.services.finance_service import FinanceService
+from app.services.history_store import HistoryStore
+from app.services.market_data import (
+    LocalMarketDataProvider,
+    MarketDataError,
+    YahooChartProvider,
+    YFinanceProvider,
+    create_market_data_provider,
+)
+from app.services.quote_cache import quote_cache
+
+
+TODAY = date(2026, 10, 16)
+
+
+class TestLocalMarketDataProvider:
+    """LocalMarketDataProvider 테스트"""
+
+    @pytest.fixture
+    def provider(self):
+        return LocalMarketDataProvider(seed=7, today=lambda: TODAY)
+
+    def test_same_seed_same_prices(self, provider):
+        """같은 시드면 항상 같은 시세 냥~"""
+        other = LocalMarketDataProvider(seed=7, today=lambda: TODAY)
+
+        assert provider.quote("AAPL") == other.quote("AAPL")
+        assert provider.batch_closes(["AAPL", "005930.KS"]) == other.batch_closes(["AAPL", "005930.KS"])
+
+    def test_different_seed_different_prices(self, provider):
+        """시드가 다르면 다른 시세 냥~"""
+        other = LocalMarketDataProvider(seed=8, today=lambda: TODAY)
+        assert provider.quote("AAPL")["current_price"] != other.quote("AAPL")["current_price"]
+
+    def test_past_closes_stable_as_days_pass(self, provider):
+        """하루 지나도 지난 종가는 그대로 냥~ (히스토리 저장소와 어긋나지 않게)"""
+        tomorrow = LocalMarketDataProvider(seed=7, today=lambda: TODAY + timedelta(days=1))
+        start = TODAY - timedelta(days=30)
+
+        dates, closes = provider.history("^GSPC", start, TODAY)
+        later_dates, later_closes = tomorrow.history("^GSPC", start, TODAY)
+
+        np.testing.assert_array_equal(dates, later_dates)
+        np.testing.assert_array_equal(closes, later_closes)
+
+    def test_history_business_days_in_range(self, provider):
+        """요청 구간의 영업일 종가만 반환 냥~"""
+        start = TODAY - timedelta(days=14)
+        dates, closes = provider.history("AAPL", start, TODAY)
+
+        assert len(dates) == len(closes) == 11
+        assert dates[0] >= np.datetime64(start)
+        assert dates[-1] == np.datetime64(TODAY)
+        assert np.is_busday(dates).all()
+        assert closes[-1] == provider.quote("AAPL")["current_price"]
+
+    def test_quote_currency_and_exchange(self, provider):
+        """국내 주식은 원화 + 원 단위, 환율은 통화쌍 기준 냥~"""
+        samsung = provider.quote("005930.KS")
+        assert samsung["currency"] == "KRW"
+        assert samsung["exchange"] == "KSC"
+        assert samsung["current_price"] == round(samsung["current_price"])
+
+        usdkrw = provider.quote("USDKRW=X")
+        assert usdkrw["currency"] == "KRW"
+        assert 500 < usdkrw["current_price"] < 5000
+
+    def test_failure_rate(self):
+        """failure_rate=1이면 항상 실패 냥~"""
+        provider = LocalMarketDataProvider(failure_rate=1.0, today=lambda: TODAY)
+        with pytest.raises(MarketDataError):
+            provider.quote("AAPL")
+
+    def test_latency(self):
+        """호출마다 지연 냥~"""
+        provider = LocalMarketDataProvider(latency_ms=20, today=lambda: TODAY)
+        with patch("app.services.market_data.time.sleep") as mock_sleep:
+            provider.batch_closes(["AAPL"])
+        mock_sleep.assert_called_once_with(0.02)
+
+
+class TestCreateMarketDataProvider:
+    """설정 기반 제공자 선택 테스트"""
+
+    def test_select_by_name(self):
+        assert isinstance(create_market_data_provider("yfinance"), YFinanceProvider)
+        assert isinstance(create_market_data_provider("yahoo"), YahooChartProvider)
+        assert isinstance(create_market_data_provider("local"), LocalMarketDataProvider)
+
+    def test_unknown_provider(self):
+        with pytest.raises(ValueError):
+            create_market_data_provider("bloomberg")
+
+    def test_default_from_settings(self):
+        with patch("app.services.market_data.settings.market_data_provider", "local"):
+            assert FinanceService().provider.name == "local"
+
+
+class TestYFinanceProvider:
+    """YFinanceProvider 테스트 (yfinance 호출은 mock)"""
+
+    def test_history_uses_unadjusted_close(self):
+        """히스토리는 수정주가가 아닌 실제 종가 냥~ (저장된 구간과 기준이 같아야 함)"""
+        frame = pd.DataFrame(
+            {"Close": [100.0, 50.0], "Adj Close": [49.0, 50.0]},
+            index=pd.DatetimeIndex(["2026-10-15", "2026-10-16"], tz="America/New_York"),
+        )
+        with patch("app.services.market_data.yf.Ticker") as mock_ticker:
+            mock_ticker.return_value.history.return_value = frame
+            dates, closes = YFinanceProvider().history("AAPL", date(2026, 10, 15), TODAY)
+
+        assert mock_ticker.return_value.history.call_args.kwargs["auto_adjust"] is False
+        assert dates.tolist() == [date(2026, 10, 15), date(2026, 10, 16)]
+        assert closes.tolist() == [100.0, 50.0]
+
+
+class TestFinanceServiceWithLocalProvider:
+    """가상 제공자로 FinanceService가 오프라인 동작하는지 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        quote_cache.clear()
+        yield
+        quote_cache.clear()
+
+    @pytest.fixture
+    def service(self):
+        return FinanceService(provider=LocalMarketDataProvider(seed=1, today=lambda: TODAY))
+
+    @pytest.mark.asyncio
+    async def test_prices_and_exchange_rate(self, service):
+        """시세/일괄 시세/환율 모두 가상 제공자에서 냥~"""
+        price = await service.get_stock_price("AAPL")
+        prices = await service.get_multiple_prices(["MSFT", "005930.KS"])
+        rate = await service._fetch_exchange_rate("USD", "KRW")
+
+        assert price["valid"] is True
+        assert prices["005930.KS"]["currency"] == "KRW"
+        assert rate == service.provider.quote("USDKRW=X")["current_price"]
+
+    @pytest.mark.asyncio
+    async def test_indicators(self, service):
+        """금/은 비율과 PER도 가상 제공자에서 냥~"""
+        ratio = await service.get_gold_silver_ratio()
+        per = await service.get_index_per()
+
+        assert ratio["valid"] is True
+        assert all(item["valid"] for item in per.values())
+
+
+def _chart_payload(ticker: str, closes: list, currency: str = "USD", exchange: str = "NMS") -> dict:
+    """야후 chart API 응답 형태 냥~ (2026-10-14부터 하루 간격, 뉴욕 시간)"""
+    start = 1791984600  # 2026-10-14 09:30 EDT
+    return {
+        "chart": {
+            "result": [{
+                "meta": {
+                    "symbol": ticker,
+                    "currency": currency,
+                    "exchangeName": exchange,
+                    "shortName": f"{ticker} Inc.",
+                    "regularMarketPrice": closes[-1],
+                    "gmtoffset": -14400,
+                },
+                "timestamp": [start + i * 86400 for i in range(len(closes))],
+                "indicators": {"quote": [{"close": closes}]},
+            }],
+            "error": None,
+        }
+    }
+
+
+class TestYahooChartProvider:
+    """httpx 기반 야후 chart 제공자 테스트 (MockTransport, 네트워크 없음)"""
+
+    @staticmethod
+    def _provider(handler) -> YahooChartProvider:
+        return YahooChartProvider(transport=httpx.MockTransport(handler))
+
+    @pytest.mark.asyncio
+    async def test_quote(self):
+        """chart meta에서 현재가/통화/거래소 냥~"""
+        def handler(request):
+            assert request.url.path == "/v8/finance/chart/AAPL"
+            return httpx.Response(200, json=_chart_payload("AAPL", [200.0, 210.0]))
+
+        provider = self._provider(handler)
+        quote = await provider.quote("AAPL")
+        await provider.aclose()
+
+        assert quote == {"current_price": 210.0, "currency": "USD", "name": "AAPL Inc.", "exchange": "NMS"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_ticker(self):
+        """없는 티커는 예외 없이 현재가 None 냥~"""
+        provider = self._provider(lambda request: httpx.Response(
+            404, json={"chart": {"result": None, "error": {"code": "Not Found"}}}
+        ))
+        quote = await provider.quote("ZZZ")
+        await provider.aclose()
+
+        assert quote["current_price"] is None
+
+    @pytest.mark.asyncio
+    async def test_batch_closes_concurrent(self):
+        """여러 티커를 커넥션 풀 하나로 동시에 조회, 마지막 유효 종가 사용 냥~"""
+        requested = []
+
+        def handler(request):
+            ticker = request.url.path.rsplit("/", 1)[-1]
+            requested.append(ticker)
+            if ticker == "ZZZ":
+                return httpx.Response(404)
+            return httpx.Response(200, json=_chart_payload(ticker, [100.0, 101.0, None]))
+
+        provider = self._provider(handler)
+        closes = await provider.batch_closes(["AAPL", "MSFT", "ZZZ"])
+        await provider.aclose()
+
+        assert sorted(requested) == ["AAPL", "MSFT", "ZZZ"]
+        assert closes == {"AAPL": 101.0, "MSFT": 101.0}
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_raises(self):
+        """429는 예외로 알림 냥~ (업스트림 가드가 실패로 집계)"""
+        provider = self._provider(lambda request: httpx.Response(429))
+        with pytest.raises(httpx.HTTPStatusError):
+            await provider.batch_closes(["AAPL", "MSFT"])
+        await provider.aclose()
+
+    @pytest.mark.asyncio
+    async def test_history_local_dates(self):
+        """타임스탬프는 거래소 현지 날짜로, 빈 종가는 NaN 냥~"""
+        provider = self._provider(
+            lambda request: httpx.Response(200, json=_chart_payload("AAPL", [200.0, None, 220.0]))
+        )
+        dates, closes = await provider.history("AAPL", date(2026, 10, 14), date(2026, 10, 16))
+        await provider.aclose()
+
+        assert dates.tolist() == [date(2026, 10, 14), date(2026, 10, 15), date(2026, 10, 16)]
+        assert closes[0] == 200.0 and np.isnan(closes[1]) and closes[2] == 220.0
+
+
+class TestFinanceServiceWithYahooProvider:
+    """비동기 제공자는 스레드 풀 없이 사용되는지 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        quote_cache.clear()
+        yield
+        quote_cache.clear()
+
+    @pytest.fixture
+    def service(self):
+        def handler(request):
+            ticker = request.url.path.rsplit("/", 1)[-1]
+            currency = "KRW" if ticker.endswith(".KS") else "USD"
+            return httpx.Response(200, json=_chart_payload(ticker, [100.0, 110.0], currency=currency))
+
+        return FinanceService(provider=YahooChartProvider(transport=httpx.MockTransport(handler)))
+
+    @pytest.mark.asyncio
+    async def test_multiple_prices_without_executor(self, service):
+        """일괄 시세는 이벤트 루프에서 바로 조회 냥~"""
+        with patch.object(service._executor, "submit") as mock_submit:
+            prices = await service.get_multiple_prices(["AAPL", "005930.KS"])
+
+        mock_submit.assert_not_called()
+        assert prices["AAPL"]["current_price"] == 110.0
+        assert prices["005930.KS"]["currency"] == "KRW"
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_ticker_history_through_store(self, service, tmp_path):
+        """히스토리 저장소를 거쳐도 제공자 조회는 이벤트 루프에서 바로 await 냥~"""
+        with patch("app.services.finance_service.history_store", HistoryStore(tmp_path, refresh_seconds=3600)), \
+                patch("app.services.finance_service.date") as mock_date:
+            mock_date.today.return_value = date(2026, 10, 15)
+            result = await service.get_ticker_history("AAPL", 7)
+
+        assert [point["close"] for point in result["data"]] == [100.0, 110.0]
+        assert result["change_rate"] == 10.0
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_history_fetch_not_bounced_through_thread(self, service, tmp_path):
+        """저장소 없는 구간 조회도 스레드에서 루프로 되돌아가지 않음 냥~ (첫 호출부터)"""
+        with patch("app.services.finance_service.history_store", HistoryStore(tmp_path, refresh_seconds=3600)), \
+                patch("app.services.finance_service.asyncio.run_coroutine_threadsafe") as mock_bounce:
+            result = await service._get_benchmark_history_async("^GSPC", date(2026, 10, 13), date(2026, 10, 15))
+
+        mock_bounce.assert_not_called()
+        assert [point["close"] for point in result] == [100.0, 110.0]
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_client(self, service):
+        """종료 시 커넥션 풀 닫기 냥~"""
+        await service.get_stock_price("AAPL")
+        client = service.provider._client
+        await service.aclose()
+
+        assert client.is_closed
+        assert service._executor._shutdown is True
@@ -0,0 +1,85 @@
+"""
+장 시간 기반 TTL 단위 테스트 냥~ 🐱
+"""
+import pytest
+import pytz
+from datetime import datetime
+
+from app.services.market_hours import KRX, US, session_for, is_always_open, quote_ttl
+
+
+SEOUL = pytz.timezone("Asia/Seoul")
+NEW_YORK = pytz.timezone("America/New_York")
+
+
+def seoul(*args) -> datetime:
+    return SEOUL.localize(datetime(*args))
+
+
+def new_york(*args) -> datetime:
+    return NEW_YORK.localize(datetime(*args))
+
+
+class TestSessionFor:
+    """거래소 판단 테스트"""
+
+    def test_exchange_code_first(self):
+        """yfinance exchange 코드로 판단 냥~"""
+        assert session_for("AAPL", "NMS") is US
+        assert session_for("005930.KS", "KSC") is KRX
+
+    def test_suffix_and_index(self):
+        """exchange가 없으면 접미사/지수 티커로 판단 냥~"""
+        assert session_for("035720.KQ") is KRX
+        assert session_for("^GSPC") is US
+        assert session_for("AAPL") is None
+
+    def test_always_open(self):
+        """환율/선물/코인은 24시간 냥~"""
+        assert is_always_open("USDKRW=X")
+        assert is_always_open("GC=F")
+        assert is_always_open("BTC-USD")
+        assert not is_always_open("SPY")
+
+
+class TestQuoteTtl:
+    """quote_ttl 테스트 (2026-10-16 금요일)"""
+
+    def test_krx_open_uses_short_ttl(self):
+        """장중에는 기본 TTL 냥~"""
+        now = seoul(2026, 10, 16, 10, 0)
+        assert quote_ttl("005930.KS", now=now) == 60
+
+    def test_krx_closed_until_next_open(self):
+        """금요일 장 마감 후에는 월요일 개장까지 냥~"""
+        now = seoul(2026, 10, 16, 16, 0)
+        expected = (seoul(2026, 10, 19, 9, 0) - now).total_seconds()
+        assert quote_ttl("005930.KS", "KSC", now=now) == expected
+
+    def test_krx_settle_window_counts_as_open(self):
+        """마감 직후 정산 구간은 장중 취급 냥~"""
+        now = seoul(2026, 10, 16, 15, 35)
+        assert quote_ttl("005930.KS", now=now) == 60
+
+    def test_us_closed_overnight(self):
+        """미국장 마감 후 다음 날 개장까지 냥~"""
+        now = new_york(2026, 10, 14, 20, 0)
+        expected = (new_york(2026, 10, 15, 9, 30) - now).total_seconds()
+        assert quote_ttl("AAPL", "NMS", now=now) == expected
+
+    def test_fx_always_short(self):
+        """환율은 주말에도 기본 TTL 냥~"""
+        now = seoul(2026, 10, 17, 12, 0)
+        assert quote_ttl("USDKRW=X", now=now) == 60
+
+    def test_old_fetch_counts_from_fetch_time(self):
+        """과거에 받은 장중 시세는 남은 TTL이 줄어듦 냥~"""
+        now = seoul(2026, 10, 16, 10, 0, 50)
+        fetched_at = seoul(2026, 10, 16, 10, 0, 0)
+        assert quote_ttl("005930.KS", fetched_at=fetched_at, now=now) == 10
+
+    def test_closed_fetch_stays_fresh_until_open(self):
+        """금요일 마감 후 받은 시세는 일요일에도 신선 냥~"""
+        fetched_at = seoul(2026, 10, 16, 18, 0)
+        now = seoul(2026, 10, 18, 12, 0)
+        assert quote_ttl("005930.KS", fetched_at=fetched_at, now=now) == pytest.approx(21 * 3600)
@@ -1,8 +1,14 @@
 """
 시장 지표 API 테스트 냥~ 🐱
 """
+import asyncio
+from datetime import datetime, timedelta
+
 import pytest
 from httpx import AsyncClient
+from unittest.mock import AsyncMock, patch
+
+from app.services.market_indicators import MarketIndicatorsSnapshot
 
 
 @pytest.mark.asyncio
@@ -50,3 +56,74 @@ async def test_exchange_rate_endpoint(client: AsyncClient):
     assert data["to_currency"] == "KRW"
     # 환율은 합리적인 범위 내에 있어야 함 (1000 ~ 2000)
     assert 1000 <= float(data["rate"]) <= 2000
+
+
+def _bundle(indicators: list) -> dict:
+    return {
+        "indicators": indicators,
+        "gold_silver_ratio": None,
+        "index_per": None,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+KOSPI = {"ticker": "^KS11", "name": "KOSPI", "price": 2600.0, "change_rate": 0.5, "currency": "KRW"}
+
+
+class TestMarketIndicatorsSnapshot:
+    """시장 지표 스냅샷 테스트 (업스트림 없이 build_market_indicators 패치)"""
+
+    @pytest.fixture
+    def snapshot(self):
+        return MarketIndicatorsSnapshot(stale_after_seconds=600)
+
+    @pytest.mark.asyncio
+    async def test_get_reads_snapshot_without_fetching(self, snapshot):
+        """한 번 계산된 뒤에는 몇 번을 읽어도 다시 계산하지 않음 냥~"""
+        build = AsyncMock(return_value=_bundle([KOSPI]))
+        with patch("app.services.market_indicators.build_market_indicators", build):
+            await snapshot.refresh(object())
+            for _ in range(5):
+                data = await snapshot.get(object())
+
+        build.assert_awaited_once()
+        assert data["indicators"] == [KOSPI]
+        assert data["stale"] is False
+        assert data["age_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_reads_compute_once(self, snapshot):
+        """스냅샷이 없을 때 동시에 들어온 요청은 계산 한 번으로 합쳐짐 냥~"""
+        async def slow_build(finance_service):
+            await asyncio.sleep(0.01)
+            return _bundle([KOSPI])
+
+        build = AsyncMock(side_effect=slow_build)
+        with patch("app.services.market_indicators.build_market_indicators", build):
+            results = await asyncio.gather(*[snapshot.get(object()) for _ in range(10)])
+
+        build.assert_awaited_once()
+        assert all(result["indicators"] == [KOSPI] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_empty_refresh_keeps_previous(self, snapshot):
+        """지표를 하나도 못 받으면 이전 스냅샷 유지 냥~"""
+        build = AsyncMock(side_effect=[_bundle([KOSPI]), _bundle([])])
+        with patch("app.services.market_indicators.build_market_indicators", build):
+            await snapshot.refresh(object())
+            await snapshot.refresh(object())
+            data = await snapshot.get(object())
+
+        assert data["indicators"] == [KOSPI]
+
+    @pytest.mark.asyncio
+    async def test_stale_flag(self, snapshot):
+        """갱신이 오래 멈추면 stale 표시 냥~"""
+        with patch("app.services.market_indicators.build_market_indicators", AsyncMock(return_value=_bundle([KOSPI]))):
+            await snapshot.refresh(object())
+        snapshot._updated_at = datetime.now() - timedelta(seconds=601)
+
+        data = await snapshot.get(object())
+
+        assert data["stale"] is True
+        assert data["age_seconds"] >= 601
@@ -0,0 +1,136 @@
+"""
+Money/Quantity 고정소수점 타입 단위 테스트 냥~ 🐱
+입력 변환, 반올림 정책, 통화 태그, Decimal 변환 확인
+"""
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.services.money import (
+    MONEY_SCALE,
+    RATE_SCALE,
+    CurrencyMismatch,
+    Money,
+    Quantity,
+    round_div_column,
+    scaled_column,
+)
+
+
+class TestConversion:
+    """숫자 → 고정소수점 변환 테스트"""
+
+    @pytest.mark.parametrize("value", [0, 1, 1385.5, 0.1, 231.47, "0.000001", Decimal("1234567.891011")])
+    def test_same_as_decimal_str(self, value):
+        """float는 Decimal(str(x))와 같은 값 냥~"""
+        assert Money.of(value).to_decimal() == Decimal(str(value))
+
+    def test_large_float_falls_back_exactly(self):
+        """float 정밀도 밖의 큰 값도 Decimal(str(x))와 같게 냥~"""
+        assert Money.of(1.5e15).to_decimal() == Decimal("1.5E+15")
+        assert Money.of(123456789012.345).to_decimal() == Decimal("123456789012.345")
+
+    def test_quantity_satoshi(self):
+        """수량은 1억분의 1까지 냥~"""
+        assert Quantity.of("0.00000001").units == 1
+        assert (Quantity.of(0.1) + Quantity.of(0.2)).to_decimal() == Decimal("0.3")
+
+    def test_none_is_zero(self):
+        assert Money.of(None) == Money.zero()
+
+    def test_to_decimal_trims_zeros(self):
+        """응답 Decimal은 끝자리 0 없이 냥~"""
+        assert str(Money.of(3000000).to_decimal()) == "3000000"
+        assert str(Money.of("1505.50").to_decimal()) == "1505.5"
+
+
+class TestRounding:
+    """반올림 정책(ROUND_HALF_EVEN) 테스트"""
+
+    @pytest.mark.parametrize("value, units", [
+        ("0.0000005", 0),
+        ("0.0000015", 2),
+        ("0.0000025", 2),
+        ("-0.0000015", -2),
+        ("0.00000051", 1),
+    ])
+    def test_half_even_on_input(self, value, units):
+        assert Money.of(value).units == units
+
+    def test_multiply_by_quantity(self):
+        """단가 × 수량은 MONEY_SCALE로 반올림 냥~"""
+        price = Money.of("0.000001", "USD")
+        assert (price * Quantity.of("0.5")).units == 0
+        assert (price * Quantity.of("1.5")).units == 2
+
+    def test_round_minor(self):
+        """통화 최소 단위로 반올림 냥~ (원은 정수, 달러는 센트)"""
+        assert Money.of("1234.5").round_minor() == Money.of(1234)
+        assert Money.of("1235.5").round_minor() == Money.of(1236)
+        assert Money.of("10.005", "USD").round_minor() == Money.of("10.00", "USD")
+
+
+class TestMoneyArithmetic:
+    """금액 연산 테스트"""
+
+    def test_usd_principal_in_krw(self):
+        """평균단가(USD) × 수량 × 매수 환율 = 원화 원금 냥~"""
+        principal = (Money.of(150.25, "USD") * Quantity.of(3)).convert(Decimal("1350.5"))
+
+        assert principal.currency == "KRW"
+        assert principal.to_decimal() == Decimal("150.25") * 3 * Decimal("1350.5")
+
+    def test_immutable(self):
+        """값 타입이라 필드 변경 불가, convert는 새 인스턴스 냥~"""
+        price = Money.of(10, "USD")
+        converted = price.convert(1350)
+
+        assert price.currency == "USD"
+        assert converted == Money.of(13500)
+        with pytest.raises(AttributeError):
+            price.currency = "KRW"
+        with pytest.raises(AttributeError):
+            Quantity.of(1).units = 0
+
+    def test_currency_mismatch(self):
+        """다른 통화끼리 더하면 예외 냥~"""
+        with pytest.raises(CurrencyMismatch):
+            Money.of(1, "USD") + Money.of(1)
+
+    def test_sum(self):
+        """sum()으로 합산 냥~"""
+        total = sum([Money.of(0.1), Money.of(0.2), Money.of(0.3)])
+        assert total.to_decimal() == Decimal("0.6")
+
+    def test_ratio(self):
+        assert Money.of(25).ratio(Money.of(100)) == 0.25
+        assert Money.of(25).ratio(Money.zero()) == 0.0
+
+    def test_quantity_at(self):
+        """금액 ÷ 단가 = 수량 (1억분의 1로 반올림) 냥~"""
+        assert Money.of(1000000).quantity_at(Money.of(300000)).to_decimal() == Decimal("3.33333333")
+        assert Money.of(-1000000).quantity_at(Money.of(500000)).to_decimal() == Decimal("-2")
+
+
+class TestColumns:
+    """열 단위 변환/나눗셈 테스트"""
+
+    def test_scaled_column_matches_scalar(self):
+        """열 변환은 Money.of와 같은 정수 냥~ (Decimal/str/None/큰 값 섞여도)"""
+        values = [0.1, 231.47, 1.0000005, 2.5e-7, 1.5e15, 3, None, Decimal("12.3456789"), "0.0000015"]
+        column = scaled_column(values, MONEY_SCALE)
+
+        assert column.tolist() == [Money.of(value).units for value in values]
+
+    def test_round_div_column_half_even(self):
+        """열 나눗셈도 은행가 반올림 냥~"""
+        numerator = np.array([5, 15, 25, -15, 26], dtype=object)
+        assert round_div_column(numerator, 10).tolist() == [0, 2, 2, -2, 3]
+
+    def test_rate_column(self):
+        """환율 열은 RATE_SCALE 자리로, 행마다 달라도 됨 냥~"""
+        rates = scaled_column([1385.5, 1300, 1385.12345], RATE_SCALE)
+        quotient = round_div_column(np.array([2, 2, 2], dtype=object) * rates, 10 ** RATE_SCALE)
+
+        assert quotient.tolist() == [2771, 2600, 2770]
@@ -0,0 +1,131 @@
+"""
+영구 캐시 단위 테스트 냥~ 🐱
+SQLite 저장/조회, warm start, 마지막 정상값 폴백 확인
+"""
+import time
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from app.services.finance_service import FinanceService
+from app.services.persistent_cache import PersistentCache, QUOTES, FX, META
+from app.services.quote_cache import quote_cache, STALE
+from app.services.ticker_metadata import ticker_metadata
+
+
+class TestPersistentCache:
+    """PersistentCache 자체 동작 테스트"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = PersistentCache(tmp_path / "cache.sqlite3")
+        yield cache
+        cache.close()
+
+    def test_roundtrip(self, cache):
+        """저장한 값을 그대로 읽음 냥~"""
+        cache.put_many(QUOTES, {"AAPL": {"current_price": 200.5, "valid": True}})
+
+        value, updated_at = cache.get(QUOTES, "AAPL")
+        assert value == {"current_price": 200.5, "valid": True}
+        assert updated_at > 0
+        assert cache.get(QUOTES, "MSFT") is None
+        assert cache.get(FX, "AAPL") is None
+
+    def test_survives_reopen(self, tmp_path):
+        """다시 열어도 값이 남아있음 냥~"""
+        path = tmp_path / "cache.sqlite3"
+        first = PersistentCache(path)
+        first.put_many(FX, {"USDKRW": {"rate": 1400.0}})
+        first.close()
+
+        second = PersistentCache(path)
+        assert second.load(FX)["USDKRW"][0] == {"rate": 1400.0}
+        second.close()
+
+    def test_overwrite(self, cache):
+        """같은 키는 덮어씀 냥~"""
+        cache.put_many(META, {"AAPL": {"name": "Apple"}})
+        cache.put_many(META, {"AAPL": {"name": "Apple Inc."}})
+        assert cache.get(META, "AAPL")[0] == {"name": "Apple Inc."}
+        assert len(cache.load(META)) == 1
+
+
+class TestFinanceServicePersistence:
+    """FinanceService 영구 캐시 연동 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        quote_cache.clear()
+        FinanceService._exchange_rate_cache.clear()
+        yield
+        quote_cache.clear()
+        FinanceService._exchange_rate_cache.clear()
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = PersistentCache(tmp_path / "cache.sqlite3")
+        with patch("app.services.finance_service.persistent_cache", cache):
+            yield cache
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_quotes_written_through(self, cache):
+        """조회 성공한 시세와 메타데이터는 디스크에도 기록 냥~"""
+        quote = {"ticker": "AAPL", "current_price": 200.0, "currency": "USD",
+                 "name": "Apple", "exchange": "NMS", "valid": True}
+
+        with patch.object(FinanceService, "_get_stock_info_sync", return_value=quote):
+            await FinanceService().get_stock_price("AAPL")
+
+        assert cache.get(QUOTES, "AAPL")[0]["current_price"] == 200.0
+        assert cache.get(META, "AAPL")[0] == {"name": "Apple", "currency": "USD", "exchange": "NMS"}
+
+    def test_warm_start_loads_stale_quotes_and_rates(self, cache):
+        """시작 시 디스크 값으로 캐시를 채움 (TTL 지난 시세는 stale로) 냥~"""
+        # 한 시간 전에 저장된 값
+        with patch("app.services.persistent_cache.time.time", return_value=time.time() - 3600):
+            cache.put_many(QUOTES, {"AAPL": {"ticker": "AAPL", "current_price": 190.0, "valid": True}})
+            cache.put_many(FX, {"USDKRW": {"rate": 1390.0}})
+
+        FinanceService().warm_start()
+
+        value, state = quote_cache.lookup("AAPL")
+        assert state == STALE
+        assert value["current_price"] == 190.0
+        assert FinanceService._exchange_rate_cache["USDKRW"]["rate"] == 1390.0
+
+    def test_warm_start_loads_ticker_metadata(self, cache):
+        """저장된 메타데이터는 남은 TTL만큼 메타데이터 캐시로 냥~"""
+        with patch("app.services.persistent_cache.time.time", return_value=time.time() - 3600):
+            cache.put_many(META, {"AAPL": {"name": "Apple Inc.", "currency": "USD", "exchange": "NMS"}})
+        with patch("app.services.persistent_cache.time.time", return_value=time.time() - 2 * 86400):
+            cache.put_many(META, {"OLD": {"name": "Old Corp.", "currency": "USD", "exchange": "NYQ"}})
+
+        FinanceService().warm_start()
+
+        assert ticker_metadata.get("AAPL")["name"] == "Apple Inc."
+        assert ticker_metadata.get("OLD") is None
+
+    @pytest.mark.asyncio
+    async def test_failed_quote_falls_back_to_last_known(self, cache):
+        """조회 실패 시 디스크의 마지막 정상 시세 사용 냥~"""
+        cache.put_many(QUOTES, {"AAPL": {"ticker": "AAPL", "current_price": 190.0, "valid": True}})
+        failed = {"ticker": "AAPL", "current_price": None, "valid": False}
+
+        with patch.object(FinanceService, "_get_stock_info_sync", return_value=failed):
+            result = await FinanceService().get_stock_price("AAPL")
+
+        assert result["current_price"] == 190.0
+        assert result["valid"] is True
+
+    @pytest.mark.asyncio
+    async def test_failed_fx_falls_back_to_last_known(self, cache):
+        """환율 조회 실패 시 기본값 대신 마지막 정상 환율 냥~"""
+        cache.put_many(FX, {"USDKRW": {"rate": 1390.0}})
+        service = FinanceService()
+
+        with patch.object(service, "get_stock_price", new_callable=AsyncMock) as mock_price:
+            mock_price.return_value = {"current_price": None, "valid": False}
+            rate = await service.get_exchange_rate()
+
+        assert rate == 1390.0
@@ -0,0 +1,251 @@
+"""
+포트폴리오 평가 상태 단위 테스트 냥~ 🐱
+증분 반영(시세 틱, 자산 생성/수정/삭제, 환율 변경) 결과가 calculate_summary 전체 재계산과 같은지 확인
+"""
+import random
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.services.asset_service import AssetService
+from app.services.fx_matrix import FxMatrix
+from app.services.holdings import Holding
+from app.services.portfolio_state import PortfolioState, PortfolioStates
+from app.services.valuation_engine import value_assets
+
+
+PORTFOLIO_ID = UUID("0a1b2c3d-0000-4000-8000-000000000001")
+CATEGORIES = [
+    (UUID("c0000000-0000-4000-8000-000000000001"), "국내주식", "#ef4444"),
+    (UUID("c0000000-0000-4000-8000-000000000002"), "해외주식", "#3b82f6"),
+    (UUID("c0000000-0000-4000-8000-000000000003"), "현금", "#22c55e"),
+]
+TICKERS = {"005930.KS": "KRW", "AAPL": "USD", "MSFT": "USD", "BTC-USD": "USD"}
+
+
+def _holding(rng: random.Random, **overrides) -> Holding:
+    """카테고리 조인이 들어간 자산 레코드 냥~"""
+    category_id, category_name, color = rng.choice(CATEGORIES)
+    if category_name == "현금":
+        fields = {
+            "ticker": None, "asset_type": "cash", "currency": "KRW",
+            "quantity": Decimal("1"), "average_price": Decimal("0"),
+            "current_value": Decimal(rng.randint(1, 10_000_000)),
+        }
+    else:
+        ticker = rng.choice(list(TICKERS))
+        fields = {
+            "ticker": ticker, "asset_type": "stock", "currency": TICKERS[ticker],
+            "quantity": Decimal(str(round(rng.uniform(0.001, 50), 4))),
+            "average_price": Decimal(str(round(rng.uniform(1, 90_000), 2))),
+            "current_value": None,
+            "purchase_exchange_rate": rng.choice([None, Decimal("1290.5"), Decimal("1350")]),
+        }
+    fields.update(
+        id=uuid4(), portfolio_id=PORTFOLIO_ID, category_id=category_id, name="자산",
+        is_active=True, category_name=category_name, category_color=color,
+    )
+    fields.update(overrides)
+    return Holding(**fields)
+
+
+def _quotes(rng: random.Random) -> dict[str, dict]:
+    return {
+        ticker: {"current_price": round(rng.uniform(1, 90_000), 2), "currency": currency}
+        for ticker, currency in TICKERS.items()
+    }
+
+
+async def _full_summary(holdings: list[Holding], quotes: dict, fx: FxMatrix):
+    """기존 방식: 전체 평가 + calculate_summary 냥~"""
+    enriched = value_assets(holdings, quotes, fx)
+    return await AssetService(None).calculate_summary(enriched, PORTFOLIO_ID, fx.decimal_rate("USD"))
+
+
+def _assert_same(incremental, full):
+    assert incremental.total_value == full.total_value
+    assert incremental.total_principal == full.total_principal
+    assert incremental.total_profit == full.total_profit
+    assert incremental.profit_rate == full.profit_rate
+    assert incremental.asset_count == full.asset_count
+    assert [a.model_dump() for a in incremental.allocations] == [a.model_dump() for a in full.allocations]
+
+
+class TestPortfolioState:
+    """PortfolioState 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_build_matches_calculate_summary(self):
+        """처음 만든 상태의 요약 = 전체 재계산 냥~"""
+        rng = random.Random(1)
+        holdings = [_holding(rng) for _ in range(40)]
+        quotes, fx = _quotes(rng), FxMatrix({"USD": 1387.25})
+
+        state = PortfolioState.build(PORTFOLIO_ID, holdings, quotes, fx, built_at=0)
+
+        _assert_same(state.summary(), await _full_summary(holdings, quotes, fx))
+
+    @pytest.mark.asyncio
+    async def test_quote_tick_revalues_only_affected(self):
+        """시세 틱은 그 티커를 가진 자산만 다시 평가 냥~"""
+        rng = random.Random(2)
+        holdings = [_holding(rng) for _ in range(40)]
+        quotes, fx = _quotes(rng), FxMatrix({"USD": 1387.25})
+        state = PortfolioState.build(PORTFOLIO_ID, holdings, quotes, fx, built_at=0)
+
+        tick = {"AAPL": {"current_price": 231.5, "currency": "USD"}, "UNHELD": {"current_price": 1.0}}
+        revalued = state.apply_quotes(tick)
+
+        assert revalued == sum(1 for h in holdings if h.get("ticker") == "AAPL")
+        assert state.apply_quotes(tick) == 0  # 같은 가격이면 다시 평가 안 함
+        _assert_same(state.summary(), await _full_summary(holdings, {**quotes, **tick}, fx))
+
+    @pytest.mark.asyncio
+    async def test_asset_changes_match_full_recompute(self):
+        """자산 생성/수정/삭제를 여러 번 반영해도 전체 재계산과 같음 냥~"""
+        rng = random.Random(3)
+        holdings = {h.key: h for h in (_holding(rng) for _ in range(30))}
+        quotes, fx = _quotes(rng), FxMatrix({"USD": 1350.0})
+        state = PortfolioState.build(PORTFOLIO_ID, list(holdings.values()), quotes, fx, built_at=0)
+
+        for _ in range(200):
+            action = rng.random()
+            if action < 0.3 or not holdings:
+                holding = _holding(rng)
+                holdings[holding.key] = holding
+                assert state.upsert(holding)
+            elif action < 0.7:
+                # insert/update 결과 행에는 카테고리 조인이 없음 → 알고 있는 카테고리로 채움
+                old = rng.choice(list(holdings.values()))
+                category_id, category_name, color = rng.choice(CATEGORIES[:2])
+                updated = {**old, "quantity": old["quantity"] + 1, "category_id": category_id}
+                for name in ("category_name", "category_color"):
+                    updated.pop(name, None)
+                assert state.upsert(Holding(**updated))
+                holdings[old.key] = Holding(**updated, category_name=category_name, category_color=color)
+            else:
+                key = rng.choice(list(holdings))
+                del holdings[key]
+                assert state.remove(key)
+
+        assert not state.remove(str(uuid4()))
+        _assert_same(state.summary(), await _full_summary(list(holdings.values()), quotes, fx))
+
+    @pytest.mark.asyncio
+    async def test_soft_delete_and_unknown_category(self):
+        """비활성 자산은 빠지고, 모르는 카테고리는 False (다시 만들어야 함) 냥~"""
+        rng = random.Random(4)
+        holdings = [_holding(rng) for _ in range(5)]
+        quotes, fx = _quotes(rng), FxMatrix({"USD": 1350.0})
+        state = PortfolioState.build(PORTFOLIO_ID, holdings, quotes, fx, built_at=0)
+
+        state.upsert(Holding(**{**holdings[0], "is_active": False}))
+        assert holdings[0].key not in state
+
+        unknown = {**holdings[1], "category_id": uuid4()}
+        del unknown["category_name"]
+        assert not state.upsert(Holding(**unknown))
+
+        _assert_same(state.summary(), await _full_summary(holdings[1:], quotes, fx))
+
+    @pytest.mark.asyncio
+    async def test_fx_change_revalues_all(self):
+        """환율이 바뀌면 전체 다시 평가 냥~"""
+        rng = random.Random(5)
+        holdings = [_holding(rng) for _ in range(20)]
+        quotes = _quotes(rng)
+        state = PortfolioState.build(PORTFOLIO_ID, holdings, quotes, FxMatrix({"USD": 1350.0}), built_at=0)
+
+        assert not state.apply_fx(FxMatrix({"USD": 1350.0}))
+        assert state.apply_fx(FxMatrix({"USD": 1402.8}))
+
+        _assert_same(state.summary(), await _full_summary(holdings, quotes, FxMatrix({"USD": 1402.8})))
+
+    def test_empty(self):
+        """자산이 없으면 0 냥~"""
+        summary = PortfolioState.build(None, [], {}, FxMatrix({"USD": 1350.0}), built_at=0).summary()
+        assert summary.total_value == 0
+        assert summary.asset_count == 0
+        assert summary.allocations == []
+
+
+class _FakeAssetService:
+    def __init__(self, holdings: list[Holding]):
+        self.holdings = holdings
+        self.loads = 0
+
+    async def get_assets(self, portfolio_id=None):
+        self.loads += 1
+        return list(self.holdings)
+
+
+class _FakeFinanceService:
+    def __init__(self, quotes: dict, usd_krw: float):
+        self.quotes = quotes
+        self.usd_krw = usd_krw
+
+    async def get_multiple_prices(self, tickers):
+        return {ticker: self.quotes[ticker] for ticker in tickers if ticker in self.quotes}
+
+    async def get_fx_matrix(self, currencies=()):
+        return FxMatrix({"USD": self.usd_krw})
+
+
+class TestPortfolioStates:
+    """PortfolioStates 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_reuses_state_until_ttl(self):
+        """TTL 안에서는 DB 조회 없이 재사용, 지나면 새로 만듦 냥~"""
+        rng = random.Random(6)
+        holdings = [_holding(rng) for _ in range(10)]
+        now = [0.0]
+        states = PortfolioStates(ttl_seconds=300, clock=lambda: now[0])
+        assets, finance = _FakeAssetService(holdings), _FakeFinanceService(_quotes(rng), 1350.0)
+
+        first = await states.get(None, assets, finance)
+        assert await states.get(None, assets, finance) is first
+        assert await states.get(PORTFOLIO_ID, assets, finance) is first  # 실제 id로도
+        assert assets.loads == 1
+
+        now[0] = 301
+        assert await states.get(None, assets, finance) is not first
+        assert assets.loads == 2
+
+    @pytest.mark.asyncio
+    async def test_get_applies_latest_quotes_and_fx(self):
+        """재사용할 때도 최신 시세/환율은 반영 냥~"""
+        rng = random.Random(7)
+        holdings = [_holding(rng) for _ in range(15)]
+        states = PortfolioStates(ttl_seconds=300)
+        assets, finance = _FakeAssetService(holdings), _FakeFinanceService(_quotes(rng), 1350.0)
+        await states.get(PORTFOLIO_ID, assets, finance)
+
+        finance.quotes = _quotes(rng)
+        finance.usd_krw = 1399.0
+        state = await states.get(PORTFOLIO_ID, assets, finance)
+
+        assert assets.loads == 1
+        _assert_same(state.summary(), await _full_summary(holdings, finance.quotes, FxMatrix({"USD": 1399.0})))
+
+    @pytest.mark.asyncio
+    async def test_hooks_route_to_state(self):
+        """시세 틱/자산 변경은 해당 포트폴리오 상태로, 모르는 카테고리는 상태 버림 냥~"""
+        rng = random.Random(8)
+        holdings = [_holding(rng) for _ in range(10)]
+        states = PortfolioStates(ttl_seconds=300)
+        assets, finance = _FakeAssetService(holdings), _FakeFinanceService(_quotes(rng), 1350.0)
+        state = await states.get(PORTFOLIO_ID, assets, finance)
+
+        tick = {"MSFT": {"current_price": 512.0, "currency": "USD"}}
+        assert states.apply_quotes(tick) == sum(1 for h in holdings if h.get("ticker") == "MSFT")
+
+        states.remove(holdings[0].id)
+        assert holdings[0].key not in state
+
+        unknown = {**holdings[1], "category_id": uuid4()}
+        del unknown["category_name"]
+        states.upsert(Holding(**unknown))
+        await states.get(PORTFOLIO_ID, assets, finance)
+        assert assets.loads == 2
@@ -0,0 +1,158 @@
+"""
+QuoteCache 단위 테스트 냥~ 🐱
+TTL, LRU 제거, stale-while-revalidate 동작 확인
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from app.services.quote_cache import QuoteCache, quote_cache, FRESH, STALE, MISS
+from app.services.finance_service import FinanceService
+
+
+class FakeClock:
+    """테스트용 시계 냥~"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestQuoteCache:
+    """QuoteCache 자체 동작 테스트"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock):
+        return QuoteCache(ttl_seconds=60, stale_seconds=300, max_size=3, clock=clock)
+
+    def test_miss_when_empty(self, cache):
+        """없는 키는 MISS 냥~"""
+        value, state = cache.lookup("AAPL")
+        assert value is None
+        assert state == MISS
+
+    def test_fresh_within_ttl(self, cache, clock):
+        """TTL 이내면 FRESH 냥~"""
+        cache.set("AAPL", {"current_price": 200})
+        clock.now += 59
+        value, state = cache.lookup("AAPL")
+        assert state == FRESH
+        assert value["current_price"] == 200
+
+    def test_stale_after_ttl(self, cache, clock):
+        """TTL 지나고 stale 구간이면 STALE 냥~"""
+        cache.set("AAPL", {"current_price": 200})
+        clock.now += 61
+        value, state = cache.lookup("AAPL")
+        assert state == STALE
+        assert value["current_price"] == 200
+        assert cache.get("AAPL") is None
+
+    def test_miss_after_stale_window(self, cache, clock):
+        """stale 구간까지 지나면 MISS 냥~"""
+        cache.set("AAPL", {"current_price": 200})
+        clock.now += 361
+        _, state = cache.lookup("AAPL")
+        assert state == MISS
+
+    def test_custom_ttl(self, cache, clock):
+        """항목별 TTL 지정 냥~"""
+        cache.set("AAPL", {"current_price": 200}, ttl_seconds=3600)
+        clock.now += 1800
+        _, state = cache.lookup("AAPL")
+        assert state == FRESH
+
+    def test_ttl_remaining(self, cache, clock):
+        """남은 신선 시간 조회 냥~"""
+        assert cache.ttl_remaining("AAPL") is None
+        cache.set("AAPL", {"current_price": 200}, ttl_seconds=60)
+        clock.now += 45
+        assert cache.ttl_remaining("AAPL") == pytest.approx(15)
+
+    def test_lru_eviction(self, cache):
+        """max_size 넘으면 가장 오래 안 쓴 항목부터 제거 냥~"""
+        cache.set("A", 1)
+        cache.set("B", 2)
+        cache.set("C", 3)
+        cache.lookup("A")  # A를 최근 사용으로
+        cache.set("D", 4)
+
+        assert len(cache) == 3
+        assert "B" not in cache
+        assert "A" in cache
+        assert "D" in cache
+
+
+class TestFinanceServiceQuoteCache:
+    """FinanceService의 공유 캐시 사용 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        quote_cache.clear()
+        yield
+        quote_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_cache_shared_across_instances(self):
+        """다른 인스턴스에서도 캐시된 시세를 재사용 냥~"""
+        quote = {"ticker": "AAPL", "current_price": 200, "currency": "USD", "valid": True}
+
+        with patch.object(FinanceService, "_get_stock_info_sync", return_value=quote) as mock_sync:
+            first = await FinanceService().get_stock_price("AAPL")
+            second = await FinanceService().get_stock_price("AAPL")
+
+        assert first["current_price"] == 200
+        assert second["current_price"] == 200
+        assert mock_sync.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_quote_not_cached(self):
+        """조회 실패 결과는 캐시하지 않음 냥~"""
+        failed = {"ticker": "ZZZ", "current_price": None, "valid": False}
+
+        with patch.object(FinanceService, "_get_stock_info_sync", return_value=failed) as mock_sync:
+            await FinanceService().get_stock_price("ZZZ")
+            await FinanceService().get_stock_price("ZZZ")
+
+        assert mock_sync.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_served_and_refreshed_in_background(self):
+        """stale 시세는 즉시 반환하고 백그라운드에서 한 번만 갱신 냥~"""
+        quote_cache.set("AAPL", {"ticker": "AAPL", "current_price": 100, "valid": True}, ttl_seconds=-1)
+        fresh = {"ticker": "AAPL", "current_price": 200, "currency": "USD", "valid": True}
+
+        with patch.object(FinanceService, "_get_batch_quotes_sync", return_value={"AAPL": fresh}) as mock_sync:
+            service = FinanceService()
+            results = await asyncio.gather(*[service.get_stock_price("AAPL") for _ in range(5)])
+            # 모두 stale 값을 즉시 받음
+            assert all(r["current_price"] == 100 for r in results)
+
+            await asyncio.gather(*list(FinanceService._refresh_tasks))
+
+        assert mock_sync.call_count == 1
+        assert quote_cache.get("AAPL")["current_price"] == 200
+
+    @pytest.mark.asyncio
+    async def test_prewarm_refreshes_only_expiring(self):
+        """예열은 곧 만료될 시세만 일괄 갱신 냥~"""
+        quote_cache.set("AAPL", {"ticker": "AAPL", "current_price": 100, "valid": True}, ttl_seconds=3600)
+        quote_cache.set("MSFT", {"ticker": "MSFT", "current_price": 300, "valid": True}, ttl_seconds=10)
+        fresh = {
+            "MSFT": {"ticker": "MSFT", "current_price": 310, "currency": "USD", "valid": True},
+            "SPY": {"ticker": "SPY", "current_price": 600, "currency": "USD", "valid": True},
+        }
+
+        with patch.object(FinanceService, "_get_batch_quotes_sync", return_value=fresh) as mock_sync:
+            refreshed = await FinanceService().prewarm_quotes(["AAPL", "MSFT", "SPY", "SPY"], horizon_seconds=45)
+
+        assert refreshed == ["MSFT", "SPY"]
+        assert mock_sync.call_count == 1
+        assert quote_cache.get("MSFT")["current_price"] == 310
+        assert quote_cache.get("AAPL")["current_price"] == 100
@@ -8,6 +8,9 @@ from unittest.mock import MagicMock, AsyncMock, patch
 from uuid import UUID
 
 from app.services.rebalance_service import RebalanceService
+from app.services.finance_service import FinanceService
+from app.services.fx_matrix import FxMatrix
+from app.services.asset_index import AssetIndex
 
 
 class TestMatchItemToAsset:
@@ -148,6 +151,58 @@ class TestMatchItemToAsset:
         assert matched["id"] == "cash-1"
 
 
+class TestAssetIndex:
+    """AssetIndex 테스트 (선형 탐색과 같은 결과인지) 냥~"""
+
+    @pytest.fixture
+    def assets(self):
+        return [
+            {"id": "a1", "name": "KODEX 200", "ticker": "069500.KS"},
+            {"id": "a2", "name": "KODEX 200 복제", "ticker": "069500.KS"},
+            {"id": "a3", "name": "국내 금현물", "ticker": None},
+            {"id": "a4", "name": "현금", "ticker": None},
+        ]
+
+    def test_first_occurrence_wins(self, assets):
+        """같은 티커가 여러 개면 먼저 나온 자산 냥~"""
+        index = AssetIndex(assets)
+        assert index.match({"ticker": "069500.KS"})["id"] == "a1"
+
+    def test_ticker_falls_back_to_name(self, assets):
+        """티커 칸에 이름을 넣어도 매칭 냥~"""
+        index = AssetIndex(assets)
+        assert index.match({"ticker": "국내 금현물"})["id"] == "a3"
+
+    def test_alias_containment_both_ways(self, assets):
+        """alias ⊂ 이름, 이름 ⊂ alias 모두 매칭 냥~"""
+        index = AssetIndex(assets)
+        assert index.match({"alias": "금현물"})["id"] == "a3"
+        assert index.match({"alias": "비상금 현금 통장"})["id"] == "a4"
+        assert index.match({"alias": "해외주식"}) is None
+
+    def test_alias_result_cached(self, assets):
+        """같은 alias는 한 번만 탐색 냥~"""
+        index = AssetIndex(assets)
+        first = index.match({"alias": "KODEX"})
+        assert index.match({"alias": "kodex"}) is first
+        assert len(index._alias_cache) == 1
+
+    def test_same_result_as_list(self, assets):
+        """리스트를 넘겨도 인덱스와 같은 결과 냥~"""
+        with patch("app.services.rebalance_service.get_supabase_client"):
+            service = RebalanceService()
+        index = AssetIndex(assets)
+        items = [
+            {"asset_id": "a2"},
+            {"ticker": "069500.KS"},
+            {"alias": "금현물"},
+            {"asset_id": "missing", "alias": "현금"},
+            {"ticker": "없음"},
+        ]
+        for item in items:
+            assert service.match_item_to_asset(item, assets) is service.match_item_to_asset(item, index)
+
+
 class TestGetAssetValues:
     """_get_asset_values 메서드 테스트"""
 
@@ -155,8 +210,8 @@ class TestGetAssetValues:
     def service(self):
         """RebalanceService 인스턴스"""
         with patch("app.services.rebalance_service.get_supabase_client"):
-            svc = RebalanceService()
-            svc.finance_service = MagicMock()
+            svc = RebalanceService(finance_service=FinanceService())
+            svc.finance_service.get_fx_matrix = AsyncMock(return_value=FxMatrix({"USD": 1300.0}))
             return svc
 
     @pytest.mark.asyncio
@@ -176,9 +231,8 @@ class TestGetAssetValues:
             },
         ]
 
-        # Mock finance service (현금은 ticker가 없어서 호출 안됨)
-        service.finance_service.get_stock_price = AsyncMock(return_value={})
-        service.finance_service.get_exchange_rate = AsyncMock(return_value=1300.0)
+        # Mock finance service (현금은 ticker가 없어서 시세 없음)
+        service.finance_service.get_multiple_prices = AsyncMock(return_value={})
 
         total_value, asset_values = await service._get_asset_values(assets)
 
@@ -213,13 +267,9 @@ class TestGetAssetValues:
         ]
 
         # Mock: 삼성전자 현재가 50,000원
-        async def mock_get_price(ticker):
-            if ticker == "005930.KS":
-                return {"current_price": 50000, "valid": True}
-            return {}
-
-        service.finance_service.get_stock_price = mock_get_price
-        service.finance_service.get_exchange_rate = AsyncMock(return_value=1300.0)
+        service.finance_service.get_multiple_prices = AsyncMock(return_value={
+            "005930.KS": {"current_price": 50000, "currency": "KRW", "valid": True},
+        })
 
         total_value, asset_values = await service._get_asset_values(assets)
 
@@ -252,8 +302,7 @@ class TestGetAssetValues:
             },
         ]
 
-        service.finance_service.get_stock_price = AsyncMock(return_value={})
-        service.finance_service.get_exchange_rate = AsyncMock(return_value=1300.0)
+        service.finance_service.get_multiple_prices = AsyncMock(return_value={})
 
         total_value, asset_values = await service._get_asset_values(assets)
 
@@ -261,6 +310,36 @@ class TestGetAssetValues:
         assert uuid_str in asset_values
         assert asset_values[uuid_str]["market_value"] == Decimal("3000000")
 
+    @pytest.mark.asyncio
+    async def test_single_batched_fetch_for_all_assets(self, service):
+        """
+        자산 수와 상관없이 시세는 일괄 조회 한 번, 환율도 한 번 냥~
+        """
+        assets = [
+            {
+                "id": f"us-{i}",
+                "name": f"미국주식 {i}",
+                "ticker": f"T{i}",
+                "quantity": 10,
+                "average_price": 100,
+                "current_value": None,
+                "currency": "USD",
+            }
+            for i in range(40)
+        ]
+        service.finance_service.get_multiple_prices = AsyncMock(return_value={
+            f"T{i}": {"current_price": 100, "currency": "USD", "valid": True}
+            for i in range(40)
+        })
+
+        total_value, asset_values = await service._get_asset_values(assets)
+
+        assert service.finance_service.get_multiple_prices.await_count == 1
+        assert service.finance_service.get_fx_matrix.await_count == 1
+        # 40 × (100 × 10 × 1300)
+        assert total_value == Decimal("52000000")
+        assert asset_values["us-0"]["current_price"] == Decimal("100")
+
 
 class TestCalculateGroupSuggestion:
     """_calculate_group_suggestion 메서드 테스트"""
@@ -411,3 +490,94 @@ class TestCalculateAllocationSuggestion:
         assert suggestion["target_percentage"] == 30.0
         assert suggestion["suggested_amount"] == Decimal("1000000")  # 100만원 추가 필요
         assert suggestion["is_matched"] is True
+
+
+class TestPortfolioValuation:
+    """요청 단위 평가 컨텍스트 재사용 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        with patch("app.services.rebalance_service.get_supabase_client"):
+            svc = RebalanceService(finance_service=FinanceService())
+            svc.finance_service.get_fx_matrix = AsyncMock(return_value=FxMatrix({"USD": 1300.0}))
+            svc.finance_service.get_multiple_prices = AsyncMock(return_value={
+                "069500.KS": {"current_price": 40000, "currency": "KRW", "valid": True},
+            })
+            return svc
+
+    @pytest.fixture
+    def assets(self):
+        return [
+            {
+                "id": "a1",
+                "portfolio_id": "550e8400-e29b-41d4-a716-446655440000",
+                "name": "KODEX 200",
+                "ticker": "069500.KS",
+                "quantity": 10,
+                "average_price": 35000,
+                "currency": "KRW",
+            },
+            {
+                "id": "a2",
+                "portfolio_id": "550e8400-e29b-41d4-a716-446655440000",
+                "name": "현금",
+                "ticker": None,
+                "quantity": 0,
+                "average_price": 0,
+                "current_value": 600000,
+                "currency": "KRW",
+            },
+        ]
+
+    @pytest.mark.asyncio
+    async def test_valuation_computed_once_per_request(self, service, assets):
+        """배분/그룹 계산이 같은 평가를 재사용 냥~"""
+        portfolio_id = UUID("550e8400-e29b-41d4-a716-446655440000")
+        allocations = [{"asset_id": "a1", "target_percentage": 50}]
+
+        with patch(
+            "app.services.asset_service.AssetService.get_assets",
+            new_callable=AsyncMock,
+            return_value=assets,
+        ) as mock_assets:
+            with patch.object(service, "get_groups", new_callable=AsyncMock) as mock_groups:
+                mock_groups.return_value = [{"id": "g1", "items": [{"alias": "현금"}]}]
+
+                allocs = await service.get_allocations_with_values(allocations, portfolio_id)
+                groups = await service.get_groups_with_values(UUID(int=1), portfolio_id)
+                valuation = await service.get_valuation(portfolio_id)
+
+        assert mock_assets.await_count == 1
+        assert service.finance_service.get_multiple_prices.await_count == 1
+        assert valuation.total_value == Decimal("1000000")
+        assert allocs[0]["current_percentage"] == 40.0
+        assert groups[0]["current_value"] == 600000.0
+
+    @pytest.mark.asyncio
+    async def test_default_portfolio_valuation_shared(self, service, assets):
+        """기본 포트폴리오(None)로 평가해도 실제 id로 재사용 냥~"""
+        with patch(
+            "app.services.asset_service.AssetService.get_assets",
+            new_callable=AsyncMock,
+            return_value=assets,
+        ) as mock_assets:
+            first = await service.get_valuation(None)
+            second = await service.get_valuation(UUID("550e8400-e29b-41d4-a716-446655440000"))
+
+        assert first is second
+        assert mock_assets.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_main_plan_ref_skips_valuation(self, service):
+        """대시보드 요약용 메인 플랜 조회는 포트폴리오 평가 없이 id/이름만 냥~"""
+        plan = {"id": "11111111-1111-4111-8111-111111111111", "name": "기본 플랜"}
+        with patch(
+            "app.services.rebalance_service.execute",
+            new_callable=AsyncMock,
+            return_value=MagicMock(data=[plan]),
+        ):
+            with patch.object(service, "get_valuation", new_callable=AsyncMock) as mock_valuation:
+                ref = await service.get_main_plan_ref(UUID("550e8400-e29b-41d4-a716-446655440000"))
+
+        assert ref == plan
+        mock_valuation.assert_not_awaited()
@@ -0,0 +1,107 @@
+"""
+스케줄러 서비스 단위 테스트 냥~ 🐱
+일일 스냅샷 작업의 티커 중복 제거 및 일괄 저장, 시세 예열 확인
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.asset_service import AssetService
+from app.services.finance_service import FinanceService
+from app.services.fx_matrix import FxMatrix
+from app.services.scheduler_service import prewarm_quotes, take_daily_snapshot
+
+
+class TestTakeDailySnapshot:
+    """take_daily_snapshot 테스트"""
+
+    @pytest.fixture
+    def portfolios(self):
+        """SPY를 같이 가진 포트폴리오 2개"""
+        return {
+            "p1": [
+                {"id": "a1", "name": "SPY", "ticker": "SPY", "quantity": 1,
+                 "average_price": 500, "currency": "USD", "category_name": "미국주식"},
+                {"id": "a2", "name": "삼성전자", "ticker": "005930.KS", "quantity": 10,
+                 "average_price": 60000, "currency": "KRW", "category_name": "국내주식"},
+            ],
+            "p2": [
+                {"id": "b1", "name": "SPY", "ticker": "SPY", "quantity": 2,
+                 "average_price": 500, "currency": "USD", "category_name": "미국주식"},
+            ],
+        }
+
+    @pytest.mark.asyncio
+    async def test_union_fetched_once_and_saved_in_bulk(self, portfolios):
+        """공통 티커는 한 번만 조회하고 스냅샷은 한 번에 저장 냥~"""
+        finance_service = FinanceService()
+        finance_service.get_multiple_prices = AsyncMock(return_value={
+            "SPY": {"current_price": 600.0, "currency": "USD", "valid": True},
+            "005930.KS": {"current_price": 70000.0, "currency": "KRW", "valid": True},
+        })
+        finance_service.get_fx_matrix = AsyncMock(return_value=FxMatrix({"USD": 1400.0}))
+
+        async def get_assets(self, portfolio_id=None, include_inactive=False):
+            return portfolios[portfolio_id]
+
+        with patch("app.services.scheduler_service.get_supabase_client", return_value=MagicMock()), \
+                patch("app.services.scheduler_service.get_finance_service", return_value=finance_service), \
+                patch.object(AssetService, "get_all_portfolio_ids", new=AsyncMock(return_value=["p1", "p2"])), \
+                patch.object(AssetService, "get_assets", new=get_assets), \
+                patch.object(AssetService, "save_snapshots", new_callable=AsyncMock) as mock_save:
+            await take_daily_snapshot()
+
+        finance_service.get_multiple_prices.assert_awaited_once_with(["005930.KS", "SPY"])
+        assert mock_save.await_count == 1
+        rows = mock_save.await_args.args[0]
+        assert [row["portfolio_id"] for row in rows] == ["p1", "p2"]
+
+    @pytest.mark.asyncio
+    async def test_failed_portfolio_skipped(self, portfolios):
+        """한 포트폴리오가 실패해도 나머지는 저장 냥~"""
+        finance_service = FinanceService()
+        finance_service.get_multiple_prices = AsyncMock(return_value={})
+        finance_service.get_fx_matrix = AsyncMock(return_value=FxMatrix({"USD": 1400.0}))
+
+        async def get_assets(self, portfolio_id=None, include_inactive=False):
+            if portfolio_id == "p1":
+                raise RuntimeError("DB 오류")
+            return portfolios[portfolio_id]
+
+        with patch("app.services.scheduler_service.get_supabase_client", return_value=MagicMock()), \
+                patch("app.services.scheduler_service.get_finance_service", return_value=finance_service), \
+                patch.object(AssetService, "get_all_portfolio_ids", new=AsyncMock(return_value=["p1", "p2"])), \
+                patch.object(AssetService, "get_assets", new=get_assets), \
+                patch.object(AssetService, "save_snapshots", new_callable=AsyncMock) as mock_save:
+            await take_daily_snapshot()
+
+        rows = mock_save.await_args.args[0]
+        assert [row["portfolio_id"] for row in rows] == ["p2"]
+
+
+class TestPrewarmQuotes:
+    """prewarm_quotes 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_held_and_indicator_tickers_prewarmed(self):
+        """활성 자산 티커 + 시장 지표 티커를 예열 냥~"""
+        finance_service = FinanceService()
+        finance_service.prewarm_quotes = AsyncMock(return_value=["SPY"])
+        finance_service.get_exchange_rate = AsyncMock()
+
+        with patch("app.services.scheduler_service.get_supabase_client", return_value=MagicMock()), \
+                patch("app.services.scheduler_service.get_finance_service", return_value=finance_service), \
+                patch.object(AssetService, "get_active_tickers", new=AsyncMock(return_value=["005930.KS", "SPY"])):
+            refreshed = await prewarm_quotes()
+
+        assert refreshed == ["SPY"]
+        tickers = finance_service.prewarm_quotes.await_args.args[0]
+        assert tickers[:2] == ["005930.KS", "SPY"]
+        assert "^KS11" in tickers and "USDKRW=X" in tickers
+        finance_service.get_exchange_rate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_swallowed(self):
+        """DB 오류가 나도 스케줄러 작업은 죽지 않음 냥~"""
+        with patch("app.services.scheduler_service.get_supabase_client", return_value=MagicMock()), \
+                patch.object(AssetService, "get_active_tickers", new=AsyncMock(side_effect=RuntimeError("DB 오류"))):
+            assert await prewarm_quotes() == []
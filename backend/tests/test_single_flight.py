@@ -0,0 +1,137 @@
+"""
+SingleFlight 단위 테스트 냥~ 🐱
+동시에 들어온 같은 조회가 하나로 합쳐지는지 확인
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from app.services.finance_service import FinanceService
+from app.services.quote_cache import quote_cache
+from app.services.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """SingleFlight 자체 동작 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """같은 키 동시 호출은 한 번만 실행 냥~"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "meow"
+
+        results = await asyncio.gather(*[flight.do("k", work) for _ in range(10)])
+
+        assert calls == 1
+        assert results == ["meow"] * 10
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_run_again(self):
+        """끝난 작업은 합치지 않고 다시 실행 냥~"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("k", work) == 1
+        assert await flight.do("k", work) == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_shared(self):
+        """실패도 함께 전달 냥~"""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("냥!")
+
+        results = await asyncio.gather(
+            flight.do("k", work), flight.do("k", work), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_leader_cancel_does_not_cancel_followers(self):
+        """먼저 요청한 쪽이 취소돼도 나머지는 결과를 받음 냥~"""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "done"
+
+    @pytest.mark.asyncio
+    async def test_do_many_joins_overlapping_batches(self):
+        """겹치는 일괄 조회는 진행 중인 키에 합류하고 나머지만 조회 냥~"""
+        flight = SingleFlight()
+        batches = []
+
+        async def fetch(keys):
+            batches.append(list(keys))
+            await asyncio.sleep(0.01)
+            return {k: k.lower() for k in keys}
+
+        first, second = await asyncio.gather(
+            flight.do_many(["A", "B"], fetch),
+            flight.do_many(["B", "C"], fetch),
+        )
+
+        assert batches == [["A", "B"], ["C"]]
+        assert first == {"A": "a", "B": "b"}
+        assert second == {"B": "b", "C": "c"}
+
+
+class TestFinanceServiceCoalescing:
+    """FinanceService 조회 합치기 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        quote_cache.clear()
+        FinanceService._exchange_rate_cache.clear()
+        yield
+        quote_cache.clear()
+        FinanceService._exchange_rate_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_multiple_prices_fetch_once(self):
+        """여러 엔드포인트가 같은 티커를 동시에 조회해도 일괄 조회는 한 번 냥~"""
+        batch = {
+            "AAPL": {"ticker": "AAPL", "current_price": 210.0, "currency": "USD", "valid": True},
+            "SPY": {"ticker": "SPY", "current_price": 600.0, "currency": "USD", "valid": True},
+        }
+
+        with patch.object(FinanceService, "_get_batch_quotes_sync", return_value=batch) as mock_batch:
+            results = await asyncio.gather(*[
+                FinanceService().get_multiple_prices(["AAPL", "SPY"]) for _ in range(4)
+            ])
+
+        assert mock_batch.call_count == 1
+        assert all(r["SPY"]["current_price"] == 600.0 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_ticker_history_fetch_once(self):
+        """같은 (티커, 일수) 히스토리 동시 조회는 한 번만 냥~"""
+        history = {"ticker": "^KS11", "data": [], "change_rate": 0.0}
+
+        with patch.object(FinanceService, "_get_ticker_history_sync", return_value=history) as mock_sync:
+            service = FinanceService()
+            await asyncio.gather(*[service.get_ticker_history("^KS11", 2) for _ in range(4)])
+
+        assert mock_sync.call_count == 1
@@ -0,0 +1,133 @@
+"""
+티커 메타데이터 캐시 테스트 냥~ 🐱
+검증/자산 추가가 메타데이터 캐시를 쓰고 시세 조회 경로에서도 채워지는지 확인
+"""
+import pytest
+from unittest.mock import patch
+
+from app.services.finance_service import FinanceService
+from app.services.quote_cache import quote_cache
+from app.services.ticker_metadata import TickerMetadataCache, ticker_metadata
+
+
+class FakeClock:
+    """테스트용 가짜 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+APPLE = {
+    "ticker": "AAPL", "current_price": 200.0, "currency": "USD",
+    "name": "Apple Inc.", "exchange": "NMS", "valid": True,
+}
+
+
+class TestTickerMetadataCache:
+    """TickerMetadataCache 자체 동작 테스트"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock):
+        return TickerMetadataCache(ttl_seconds=86400, invalid_ttl_seconds=600, max_size=10, clock=clock)
+
+    def test_valid_kept_for_a_day(self, cache, clock):
+        """유효한 티커는 하루 동안 냥~"""
+        cache.remember("AAPL", APPLE)
+        clock.now += 86000
+        assert cache.get("AAPL") == {"name": "Apple Inc.", "currency": "USD", "exchange": "NMS", "valid": True}
+        clock.now += 401
+        assert cache.get("AAPL") is None
+
+    def test_invalid_kept_briefly(self, cache, clock):
+        """없는 티커는 짧게 냥~"""
+        cache.remember("ZZZ", {"ticker": "ZZZ", "current_price": None, "valid": False})
+        assert cache.get("ZZZ")["valid"] is False
+        clock.now += 601
+        assert cache.get("ZZZ") is None
+
+    def test_upstream_error_not_cached(self, cache):
+        """업스트림 실패는 유효성을 모르니 저장 안 함 냥~"""
+        cache.remember("AAPL", {"ticker": "AAPL", "current_price": None, "valid": False, "error": "429"})
+        assert cache.get("AAPL") is None
+
+    def test_batch_quote_without_metadata_skipped(self, cache):
+        """이름/거래소 없는 일괄 조회 시세는 메타데이터로 쓰지 않음 냥~"""
+        cache.remember("AAPL", {"ticker": "AAPL", "current_price": 200.0, "currency": "USD", "valid": True})
+        assert cache.get("AAPL") is None
+
+
+class TestFinanceServiceMetadata:
+    """FinanceService의 메타데이터 캐시 사용 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        quote_cache.clear()
+        yield
+        quote_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_validate_from_cache(self):
+        """한 번 확인한 티커는 시세가 만료돼도 업스트림 없이 검증 냥~"""
+        with patch.object(FinanceService, "_get_stock_info_sync", return_value=APPLE) as mock_sync:
+            service = FinanceService()
+            assert await service.validate_ticker("AAPL") is True
+            quote_cache.clear()
+            assert await service.validate_ticker("AAPL") is True
+
+        assert mock_sync.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_ticker_cached(self):
+        """없는 티커도 캐시해서 반복 검증에 업스트림 호출 없음 냥~"""
+        missing = {"ticker": "ZZZ", "current_price": None, "valid": False}
+
+        with patch.object(FinanceService, "_get_stock_info_sync", return_value=missing) as mock_sync:
+            service = FinanceService()
+            assert await service.validate_ticker("ZZZ") is False
+            assert await service.validate_ticker("ZZZ") is False
+
+        assert mock_sync.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_validate_with_info_reuses_quote(self):
+        """검증 정보의 현재가는 방금 받은 시세를 재사용 냥~"""
+        with patch.object(FinanceService, "_get_stock_info_sync", return_value=APPLE) as mock_sync, \
+                patch.object(FinanceService, "_get_batch_quotes_sync") as mock_batch:
+            info = await FinanceService().validate_ticker_with_info("AAPL")
+
+        assert info["valid"] is True
+        assert info["name"] == "Apple Inc."
+        assert info["current_price"] == 200
+        assert mock_sync.call_count == 1
+        mock_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_quote_filled_by_single_lookup(self):
+        """일괄 조회 시세만 있으면 이름을 위해 개별 조회 한 번 냥~"""
+        quote_cache.set("AAPL", {"ticker": "AAPL", "current_price": 200.0, "currency": "USD", "valid": True})
+
+        with patch.object(FinanceService, "_get_stock_info_sync", return_value=APPLE) as mock_sync:
+            meta = await FinanceService().get_ticker_metadata("AAPL")
+
+        assert meta["name"] == "Apple Inc."
+        assert mock_sync.call_count == 1
+        assert ticker_metadata.get("AAPL")["exchange"] == "NMS"
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_metadata_cache(self):
+        """일괄 조회 결과의 이름/거래소는 메타데이터 캐시에서 냥~"""
+        ticker_metadata.remember("AAPL", APPLE)
+
+        service = FinanceService()
+        with patch.object(service.provider, "batch_closes", return_value={"AAPL": 210.0}):
+            results = service._get_batch_quotes_sync(["AAPL"])
+
+        assert results["AAPL"]["name"] == "Apple Inc."
+        assert results["AAPL"]["exchange"] == "NMS"
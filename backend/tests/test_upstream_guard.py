@@ -0,0 +1,306 @@
+"""
+UpstreamGuard 단위 테스트 냥~ 🐱
+AIMD 동시성 제한, 타임아웃, 서킷 브레이커, FinanceService 폴백 확인
+"""
+import asyncio
+import threading
+
+import httpx
+import pytest
+from unittest.mock import patch
+from yfinance.exceptions import YFRateLimitError
+
+from app.services.finance_service import FinanceService
+from app.services.market_data import MarketDataError, is_upstream_failure
+from app.services.quote_cache import quote_cache
+from app.services.upstream_guard import (
+    UpstreamGuard,
+    UpstreamTimeout,
+    UpstreamUnavailable,
+    upstream_guard,
+    CLOSED,
+    OPEN,
+    HALF_OPEN,
+)
+
+
+class FakeClock:
+    """테스트용 가짜 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def ok():
+    return "meow"
+
+
+async def boom():
+    raise RuntimeError("429 Too Many Requests")
+
+
+class TestUpstreamGuard:
+    """UpstreamGuard 자체 동작 테스트"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def guard(self, clock):
+        return UpstreamGuard(
+            name="test",
+            min_concurrency=1,
+            max_concurrency=4,
+            timeout_seconds=0.05,
+            failure_threshold=3,
+            open_seconds=30,
+            is_failure=lambda exc: True,
+            clock=clock,
+        )
+
+    @pytest.mark.asyncio
+    async def test_failure_halves_limit_and_success_grows_back(self, guard):
+        """실패하면 동시성 절반, 성공하면 조금씩 회복 냥~"""
+        with pytest.raises(RuntimeError):
+            await guard.call(boom)
+        assert guard.limit == 2
+
+        for _ in range(4):
+            await guard.call(ok)
+        assert 2 < guard.limit <= 4
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_limit(self, guard):
+        """동시에 실행되는 호출은 limit을 넘지 않음 냥~"""
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "meow"
+
+        results = await asyncio.gather(*[guard.call(work) for _ in range(10)])
+
+        assert results == ["meow"] * 10
+        assert peak == 4
+        assert guard.snapshot()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_counted_as_failure(self, guard):
+        """타임아웃은 UpstreamTimeout으로 바꾸고 실패로 집계 냥~"""
+        async def slow():
+            await asyncio.sleep(1)
+
+        with pytest.raises(UpstreamTimeout):
+            await guard.call(slow)
+
+        snapshot = guard.snapshot()
+        assert snapshot["total_timeouts"] == 1
+        assert snapshot["consecutive_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_request_errors_not_counted(self, clock):
+        """없는 티커/잘못된 심볼 예외는 실패로 안 셈, 429/5xx/전송 오류만 냥~"""
+        guard = UpstreamGuard(
+            name="test", min_concurrency=1, max_concurrency=4, timeout_seconds=1,
+            failure_threshold=1, open_seconds=30, is_failure=is_upstream_failure, clock=clock,
+        )
+
+        async def typo():
+            raise ValueError("No data found, symbol may be delisted")
+
+        for _ in range(5):
+            with pytest.raises(ValueError):
+                await guard.call(typo)
+        assert guard.state == CLOSED
+        assert guard.total_failures == 0
+
+        async def rate_limited():
+            request = httpx.Request("GET", "https://example.com")
+            raise httpx.HTTPStatusError("429", request=request, response=httpx.Response(429, request=request))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await guard.call(rate_limited)
+        assert guard.state == OPEN
+
+    def test_is_upstream_failure(self):
+        request = httpx.Request("GET", "https://example.com")
+
+        def status_error(code):
+            return httpx.HTTPStatusError(str(code), request=request, response=httpx.Response(code, request=request))
+
+        assert is_upstream_failure(status_error(503))
+        assert is_upstream_failure(status_error(429))
+        assert not is_upstream_failure(status_error(404))
+        assert is_upstream_failure(httpx.ConnectTimeout("timeout"))
+        assert is_upstream_failure(ConnectionError())
+        assert is_upstream_failure(YFRateLimitError())
+        assert is_upstream_failure(MarketDataError("down"))
+        assert not is_upstream_failure(KeyError("regularMarketPrice"))
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_recovers(self, guard, clock):
+        """연속 실패 → open → 시간이 지나면 시험 호출 → 성공 시 closed 냥~"""
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                await guard.call(boom)
+        assert guard.state == OPEN
+
+        calls = 0
+
+        async def counted():
+            nonlocal calls
+            calls += 1
+            return "meow"
+
+        with pytest.raises(UpstreamUnavailable):
+            await guard.call(counted)
+        assert calls == 0
+        assert guard.snapshot()["retry_in_seconds"] == 30
+
+        clock.now += 31
+        assert await guard.call(counted) == "meow"
+        assert guard.state == CLOSED
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_half_open_allows_single_probe(self, guard, clock):
+        """half-open에서는 시험 호출 하나만 허용, 실패하면 다시 open 냥~"""
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                await guard.call(boom)
+        clock.now += 31
+
+        async def slow_boom():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("still limited")
+
+        probe = asyncio.ensure_future(guard.call(slow_boom))
+        await asyncio.sleep(0)
+        assert guard.state == HALF_OPEN
+
+        with pytest.raises(UpstreamUnavailable):
+            await guard.call(ok)
+        with pytest.raises(RuntimeError):
+            await probe
+        assert guard.state == OPEN
+
+
+class TestFinanceServiceGuard:
+    """FinanceService가 가드를 거쳐 yfinance를 호출하는지 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        quote_cache.clear()
+        yield
+        quote_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_serves_last_known_quote(self):
+        """서킷이 열려 있으면 yfinance를 부르지 않고 마지막 정상 시세로 응답 냥~"""
+        known = {"ticker": "AAPL", "current_price": 200, "currency": "USD", "valid": True}
+        quote_cache.set("AAPL", known, ttl_seconds=-1000)
+        upstream_guard.state = OPEN
+        upstream_guard._opened_at = upstream_guard._clock()
+
+        service = FinanceService(max_workers=1)
+        with patch.object(FinanceService, "_get_stock_info_sync") as mock_sync:
+            result = await service._fetch_stock_price("AAPL")
+
+        mock_sync.assert_not_called()
+        assert result["current_price"] == 200
+        # 제출 안 된 호출의 풀 슬롯은 바로 반납
+        assert not service._upstream_slots.locked()
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_errors_open_circuit(self):
+        """개별 조회 레이트 리밋 예외가 쌓이면 서킷이 열림 냥~"""
+        with patch.object(FinanceService, "_get_stock_info_sync", side_effect=YFRateLimitError()) as mock_sync:
+            service = FinanceService()
+            for _ in range(upstream_guard.failure_threshold + 2):
+                await service._fetch_stock_price("AAPL")
+
+        assert upstream_guard.state == OPEN
+        assert mock_sync.call_count == upstream_guard.failure_threshold
+
+    @pytest.mark.asyncio
+    async def test_invalid_symbol_does_not_open_circuit(self):
+        """사용자 오타(잘못된 심볼 예외)는 아무리 많아도 서킷을 안 엶 냥~"""
+        with patch.object(FinanceService, "_get_stock_info_sync", side_effect=ValueError("invalid symbol")):
+            service = FinanceService()
+            for _ in range(upstream_guard.failure_threshold + 2):
+                result = await service._fetch_stock_price("AAPLL")
+
+        assert upstream_guard.state == CLOSED
+        assert result["valid"] is False
+        assert result["error"] == "invalid symbol"
+
+    @pytest.mark.asyncio
+    async def test_timed_out_thread_keeps_slot(self):
+        """
+        타임아웃으로 버려진 스레드 호출은 끝날 때까지 슬롯을 차지 냥~ (풀 크기 이상 안 쌓임)
+        슬롯을 기다리는 시간은 가드 타임아웃/실패로 집계하지 않음
+        """
+        release = threading.Event()
+
+        def hung(ticker):
+            release.wait(5)
+            return {"ticker": ticker, "current_price": None, "valid": False}
+
+        service = FinanceService(max_workers=1)
+        with patch.object(upstream_guard, "timeout_seconds", 0.05), \
+                patch.object(FinanceService, "_get_stock_info_sync", side_effect=hung) as mock_sync:
+            first = await service._fetch_stock_price("AAPL")
+            assert upstream_guard.total_timeouts == 1
+
+            # 스레드가 아직 돌고 있으니 두 번째 호출은 풀 슬롯을 기다림 (타임아웃 아님)
+            second = asyncio.ensure_future(service._fetch_stock_price("MSFT"))
+            await asyncio.sleep(0.2)
+            assert not second.done()
+            assert mock_sync.call_count == 1
+            assert upstream_guard.total_timeouts == 1
+            assert upstream_guard.consecutive_failures == 1
+
+            release.set()
+            await asyncio.wait_for(second, timeout=5)
+            for _ in range(100):
+                if not service._upstream_slots.locked():
+                    break
+                await asyncio.sleep(0.01)
+
+        assert mock_sync.call_count == 2
+        assert not service._upstream_slots.locked()
+        assert first["valid"] is False and second.result()["valid"] is False
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_ticker_not_counted_as_failure(self):
+        """없는 티커(예외 없는 빈 결과)는 업스트림 실패가 아님 냥~"""
+        missing = {"ticker": "ZZZ", "current_price": None, "valid": False}
+
+        with patch.object(FinanceService, "_get_stock_info_sync", return_value=missing):
+            await FinanceService()._fetch_stock_price("ZZZ")
+
+        assert upstream_guard.consecutive_failures == 0
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_history_uses_store_only(self):
+        """서킷이 열려 있으면 히스토리는 저장된 구간만으로 응답 냥~"""
+        upstream_guard.state = OPEN
+        upstream_guard._opened_at = upstream_guard._clock()
+
+        with patch.object(FinanceService, "_fetch_history_sync") as mock_fetch, \
+                patch("app.services.finance_service.history_store", None):
+            result = await FinanceService().get_ticker_history("^GSPC", 7)
+
+        mock_fetch.assert_not_called()
+        assert result == {"ticker": "^GSPC", "data": [], "change_rate": 0.0}
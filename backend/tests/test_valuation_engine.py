@@ -0,0 +1,238 @@
+"""
+평가 엔진 단위 테스트 냥~ 🐱
+기존 Decimal 행 단위 루프와 같은 결과인지, 28자리 정밀도에 잘리지 않는지 확인
+"""
+import random
+import time
+from decimal import Decimal
+
+import pytest
+
+from app.services.fx_matrix import FxMatrix
+from app.services.valuation_engine import value_assets
+
+
+def _legacy_enrich(assets: list[dict], prices: dict, fx: FxMatrix) -> list[dict]:
+    """기존 enrich_assets_with_prices 행 단위 구현 냥~ (비교용)"""
+    current_exchange_rate = fx.usd_krw
+    current_rate_decimal = Decimal(str(current_exchange_rate))
+
+    enriched = []
+    for asset in assets:
+        asset_copy = dict(asset)
+        ticker = asset.get("ticker")
+        quantity = Decimal(str(asset.get("quantity", 0)))
+        avg_price = Decimal(str(asset.get("average_price", 0)))
+        currency = asset.get("currency", "KRW")
+
+        # 현재 환율 추가
+        asset_copy["current_exchange_rate"] = current_rate_decimal
+
+        # 현재가 결정
+        if ticker and ticker in prices:
+            price_info = prices[ticker]
+            current_price = price_info.get("current_price")
+
+            # yfinance가 currency None 반환 시 DB의 자산 통화를 따름
+            price_currency = price_info.get("currency") or currency
+
+            if current_price:
+                # 가격 통화와 자산 통화가 다르면 자산 통화로 환산 (예: USD 시세 → KRW 자산)
+                if price_currency != currency:
+                    conversion = fx.rate(price_currency, currency)
+                    if conversion is not None:
+                        current_price = float(current_price) * conversion
+
+                asset_copy["current_price"] = Decimal(str(current_price))
+            else:
+                asset_copy["current_price"] = None
+        elif asset.get("current_value"):
+            # 티커 없는 자산 (현금, 금현물, 예금 등)
+            # current_value가 총 가치를 나타냄
+            asset_copy["current_price"] = None  # 단가는 없음
+            asset_copy["manual_value"] = True  # 수동 입력 표시
+        else:
+            asset_copy["current_price"] = None
+
+        # USD 자산의 원화 환산 매입가 계산
+        if currency == "USD" and quantity > 0:
+            # 매수 시점 환율이 있으면 사용, 없으면 현재 환율 사용
+            purchase_rate = asset.get("purchase_exchange_rate")
+            if purchase_rate:
+                purchase_rate = Decimal(str(purchase_rate))
+            else:
+                purchase_rate = current_rate_decimal
+
+            # 원화 환산 매입가 = 평균매수가(USD) × 수량 × 매수시점환율
+            asset_copy["cost_basis_krw"] = avg_price * quantity * purchase_rate
+        else:
+            asset_copy["cost_basis_krw"] = None
+
+        # 평가금액, 손익, 수익률 계산
+        if asset_copy.get("current_price") and quantity > 0:
+            # 티커가 있는 자산: 현재가 × 수량
+            current_price = Decimal(str(asset_copy["current_price"]))
+            market_value = current_price * quantity
+
+            # USD 자산인 경우 원화 환산
+            if currency == "USD":
+                # USD 원본 금액 저장 (달러 표시용) 냥~
+                asset_copy["market_value_usd"] = market_value
+                # 원화 환산
+                market_value_krw = market_value * current_rate_decimal
+                # 원금도 원화 환산 (매수 시점 환율 사용)
+                purchase_rate = asset.get("purchase_exchange_rate")
+                if purchase_rate:
+                    purchase_rate = Decimal(str(purchase_rate))
+                else:
+                    purchase_rate = current_rate_decimal
+                principal_krw = avg_price * quantity * purchase_rate
+                profit_loss = market_value_krw - principal_krw
+                asset_copy["market_value"] = market_value_krw
+            else:
+                principal = avg_price * quantity
+                profit_loss = market_value - principal
+                asset_copy["market_value"] = market_value
+
+            asset_copy["profit_loss"] = profit_loss
+
+            # 수익률은 원금 대비 계산
+            principal_for_rate = principal_krw if currency == "USD" else principal
+            if principal_for_rate > 0:
+                asset_copy["profit_rate"] = float((profit_loss / principal_for_rate) * 100)
+            else:
+                asset_copy["profit_rate"] = 0.0
+        elif asset.get("current_value"):
+            # 티커 없는 자산 (금현물, 현금, 예금 등)
+            current_value = Decimal(str(asset["current_value"]))
+            asset_copy["market_value"] = current_value
+
+            # 현금은 수익 개념 없음 냥~ 💰
+            if asset.get("asset_type") == "cash":
+                asset_copy["profit_loss"] = Decimal("0")
+                asset_copy["profit_rate"] = 0.0
+            else:
+                # current_value = 현재 총 가치, average_price × quantity = 원금
+                principal = avg_price * quantity
+                asset_copy["profit_loss"] = current_value - principal
+
+                if principal > 0:
+                    asset_copy["profit_rate"] = float(((current_value - principal) / principal) * 100)
+                else:
+                    asset_copy["profit_rate"] = 0.0
+        else:
+            asset_copy["market_value"] = Decimal("0")
+            asset_copy["profit_loss"] = Decimal("0")
+            asset_copy["profit_rate"] = 0.0
+
+        enriched.append(asset_copy)
+
+    return enriched
+
+
+FX = FxMatrix({"USD": 1385.5, "JPY": 9.21})
+
+PRICES = {
+    "AAPL": {"current_price": 231.47, "currency": "USD", "valid": True},
+    "005930.KS": {"current_price": 71200.0, "currency": "KRW", "valid": True},
+    "7203.T": {"current_price": 2875.5, "currency": "JPY", "valid": True},
+    "BTC-USD": {"current_price": 67123.45, "currency": "USD", "valid": True},
+    "DEAD": {"current_price": None, "currency": "USD", "valid": False},
+    "NOCUR": {"current_price": 15.5, "currency": None, "valid": True},
+}
+
+
+def _random_assets(count: int, seed: int = 7) -> list[dict]:
+    """주식/코인/현금/금현물이 섞인 가상 포트폴리오 냥~"""
+    rng = random.Random(seed)
+    assets = []
+    for i in range(count):
+        kind = rng.choice(["usd", "krw", "jpy_krw", "crypto", "cash", "gold", "dead", "nocur"])
+        asset = {"id": f"asset-{i}", "name": kind, "ticker": None, "currency": "KRW",
+                 "quantity": 0, "average_price": 0}
+        if kind == "usd":
+            asset.update(ticker="AAPL", currency="USD", quantity=rng.randint(1, 500),
+                         average_price=round(rng.uniform(100, 250), 2),
+                         purchase_exchange_rate=rng.choice([None, 1290.3, Decimal("1350.25")]))
+        elif kind == "krw":
+            asset.update(ticker="005930.KS", quantity=rng.randint(1, 300), average_price=rng.randint(50000, 90000))
+        elif kind == "jpy_krw":
+            asset.update(ticker="7203.T", quantity=rng.randint(1, 100), average_price=rng.randint(20000, 30000))
+        elif kind == "crypto":
+            asset.update(ticker="BTC-USD", currency="USD",
+                         quantity=Decimal(rng.randint(1, 10 ** 8)) / Decimal(10 ** 8),
+                         average_price=round(rng.uniform(20000, 70000), 2))
+        elif kind == "cash":
+            asset.update(asset_type="cash", current_value=rng.randint(1, 10 ** 7))
+        elif kind == "gold":
+            asset.update(quantity=rng.randint(1, 20), average_price=90000,
+                         current_value=Decimal(str(round(rng.uniform(1e5, 3e6), 2))))
+        elif kind == "dead":
+            asset.update(ticker="DEAD", currency="USD", quantity=3, average_price=10)
+        else:
+            asset.update(ticker="NOCUR", currency="USD", quantity=Decimal("2.5"), average_price=12)
+        assets.append(asset)
+    return assets
+
+
+class TestValueAssets:
+    """value_assets 테스트"""
+
+    def test_matches_legacy_loop(self):
+        """기존 행 단위 Decimal 계산과 같은 값 냥~ (수익률은 float 반올림 차이만 허용)"""
+        assets = _random_assets(400)
+
+        expected = _legacy_enrich(assets, PRICES, FX)
+        actual = value_assets(assets, PRICES, FX)
+
+        for old, new in zip(expected, actual):
+            assert set(new) == set(old)
+            for key in ("current_price", "current_exchange_rate", "cost_basis_krw",
+                        "market_value", "market_value_usd", "profit_loss", "manual_value"):
+                assert new.get(key) == old.get(key), (key, old["name"])
+            assert new["profit_rate"] == pytest.approx(old["profit_rate"], rel=1e-12)
+
+    def test_fractional_quantities_exact(self):
+        """소수 수량 합산도 오차 없음 냥~ (float였으면 0.30000000000000004)"""
+        assets = [
+            {"id": str(i), "ticker": "BTC-USD", "currency": "USD", "quantity": 0.1, "average_price": 0.1,
+             "purchase_exchange_rate": 1}
+            for i in range(3)
+        ]
+        prices = {"BTC-USD": {"current_price": 0.1, "currency": "USD"}}
+
+        enriched = value_assets(assets, prices, FxMatrix({"USD": 1.0}))
+
+        assert sum(row["market_value"] for row in enriched) == Decimal("0.03")
+        assert sum(row["cost_basis_krw"] for row in enriched) == Decimal("0.03")
+        assert all(row["profit_loss"] == 0 for row in enriched)
+
+    def test_large_values_not_rounded(self):
+        """Decimal 기본 정밀도(28자리)를 넘는 곱도 그대로 냥~"""
+        quantity = Decimal("123456789.12345678")
+        price = Decimal("98765432109.87654321")
+        assets = [{"id": "1", "ticker": "BIG", "currency": "KRW", "quantity": quantity, "average_price": 0}]
+
+        enriched = value_assets(assets, {"BIG": {"current_price": price, "currency": "KRW"}}, FX)
+
+        assert str(enriched[0]["market_value"]) == "12193263124676115434.7203169122374638"
+
+    def test_does_not_mutate_input(self):
+        """입력 자산 dict는 그대로 냥~"""
+        assets = _random_assets(20)
+        before = [dict(asset) for asset in assets]
+        value_assets(assets, PRICES, FX)
+        assert assets == before
+
+    def test_empty(self):
+        assert value_assets([], PRICES, FX) == []
+
+    def test_thousands_of_lots_fast(self):
+        """수천 개 로트도 순식간에 냥~"""
+        assets = _random_assets(5000)
+        started = time.perf_counter()
+        enriched = value_assets(assets, PRICES, FX)
+        elapsed = time.perf_counter() - started
+
+        assert len(enriched) == 5000
+        assert elapsed < 1.0
@@ -459,6 +459,8 @@ export interface MarketIndicatorsResponse {
   gold_silver_ratio: GoldSilverRatio | null
   index_per: IndexPer | null
   timestamp: string
+  age_seconds: number
+  stale: boolean
 }
 
 // ============================================